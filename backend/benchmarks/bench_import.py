@@ -0,0 +1,104 @@
+"""Profile ``import server`` and the time until a static route first answers.
+
+Run from the backend directory:
+
+    python benchmarks/bench_import.py [--runs 5] [--top 15]
+
+Each run is a fresh interpreter (imports are cached per process). It reports
+the wall time of ``import server``, the time until ``GET /api/orisha`` has
+been served through the lifespan handler, and whether the heavy upstream
+clients (``google.generativeai``, ``motor``) were imported along the way.
+The slowest modules come from ``python -X importtime``.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+PROBE = r"""
+import json, sys, time
+started = time.perf_counter()
+import server
+imported = time.perf_counter()
+heavy_after_import = [m for m in ("google.generativeai", "motor") if m in sys.modules]
+from fastapi.testclient import TestClient
+with TestClient(server.app) as client:
+    response = client.get("/api/orisha")
+    served = time.perf_counter()
+    llm_touched = server.llm_gateway.ready
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "first_response_ms": (served - started) * 1000,
+    "status": response.status_code,
+    "heavy_after_import": heavy_after_import,
+    "llm_touched": llm_touched,
+}))
+"""
+
+
+def probe_env():
+    env = os.environ.copy()
+    # An unreachable database and no warm-up: static routes must not care
+    env.setdefault("MONGO_URL", "mongodb://127.0.0.1:9/?serverSelectionTimeoutMS=100")
+    env.setdefault("DB_NAME", "itan_bench")
+    env["LLM_PREWARM"] = "false"
+    env["CULTURAL_CONTENT_WARMUP"] = "false"
+    env["PYTHONWARNINGS"] = "ignore"
+    return env
+
+
+def run_probe():
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=BACKEND_DIR, env=probe_env(),
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def slowest_imports(top: int):
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import server"], cwd=BACKEND_DIR, env=probe_env(),
+        capture_output=True, text=True, check=True,
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name[1:]
+        # Only what server.py and its siblings import directly, so nested
+        # modules do not repeat their parents' time
+        if len(name) - len(name.lstrip()) != 2:
+            continue
+        rows.append((int(cumulative_us), int(self_us), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    probes = [run_probe() for _ in range(args.runs)]
+    imports = [p["import_ms"] for p in probes]
+    first = [p["first_response_ms"] for p in probes]
+    last = probes[-1]
+    print(f"import server          median {statistics.median(imports):8.1f} ms   min {min(imports):8.1f} ms")
+    print(f"first GET /api/orisha  median {statistics.median(first):8.1f} ms   min {min(first):8.1f} ms"
+          f"   (status {last['status']})")
+    print(f"heavy modules imported by 'import server': {', '.join(last['heavy_after_import']) or 'none'}")
+    print(f"Gemini client initialized before first response: {last['llm_touched']}")
+
+    print(f"\n{'cumulative ms':>14}{'self ms':>10}  module")
+    for cumulative_us, self_us, name in slowest_imports(args.top):
+        print(f"{cumulative_us / 1000:>14.1f}{self_us / 1000:>10.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
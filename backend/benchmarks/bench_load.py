@@ -0,0 +1,220 @@
+"""Concurrent HTTP load against every API route, with latency percentiles.
+
+Run from the backend directory:
+
+    python benchmarks/bench_load.py [--concurrency 32] [--duration 10] [--llm-latency 0.2]
+
+By default this starts ``bench_server.py`` (fake Gemini, in-memory Mongo) in
+a subprocess and hammers each route in turn with ``--concurrency`` async
+clients for ``--duration`` seconds, then prints p50/p95/p99 latency, requests
+per second and the error count per route. Use ``--url`` to target a server
+that is already running, ``--routes`` to pick a subset, ``--unique`` to
+defeat the translation caches, and ``--json`` to save the results for
+comparing runs.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from corpus_seed import IJAPA_STORIES, ORISHA_DATA, PROVERB_CATEGORIES  # noqa: E402
+
+BENCH_DIR = Path(__file__).resolve().parent
+
+# Proverb meanings are not aligned pairs, so they miss the translation memory
+# and exercise the cache and Gemini path
+TRANSLATION_TEXTS = [
+    proverb["meaning"] for category in PROVERB_CATEGORIES.values() for proverb in category["proverbs"]
+]
+SEARCH_QUERIES = ["wisdom", "ogbon", "character", "omi", "patience", "ìwà", "child", "elder"]
+CONTENT_TYPES = ["story", "praise", "info"]
+
+
+class Scenario(NamedTuple):
+    name: str
+    method: str
+    # Called with a running request number so requests can vary
+    path: Callable[[int], str]
+    body: Optional[Callable[[int], Any]] = None
+
+
+def cycle(values: List[str]) -> Callable[[int], str]:
+    return lambda n: values[n % len(values)]
+
+
+def scenarios(unique: bool) -> List[Scenario]:
+    orisha_ids = list(ORISHA_DATA)
+    category_ids = list(PROVERB_CATEGORIES)
+    story_ids = list(IJAPA_STORIES)
+    orisha_names = [data["name"] for data in ORISHA_DATA.values()]
+
+    def text(n: int) -> str:
+        base = TRANSLATION_TEXTS[n % len(TRANSLATION_TEXTS)]
+        return f"{base} ({n})" if unique else base
+
+    def translation(n: int) -> Dict[str, str]:
+        return {"text": text(n), "target_language": "yoruba" if n % 2 else "english"}
+
+    def cultural(n: int) -> Dict[str, str]:
+        return {"orisha_name": orisha_names[n % len(orisha_names)], "content_type": CONTENT_TYPES[n % 3]}
+
+    return [
+        Scenario("GET /api/", "GET", lambda n: "/api/"),
+        Scenario("GET /api/orisha", "GET", lambda n: "/api/orisha"),
+        Scenario("GET /api/orisha/{id}", "GET", lambda n: f"/api/orisha/{cycle(orisha_ids)(n)}"),
+        Scenario("GET /api/proverbs/categories", "GET", lambda n: "/api/proverbs/categories"),
+        Scenario("GET /api/proverbs/category/{id}", "GET",
+                 lambda n: f"/api/proverbs/category/{cycle(category_ids)(n)}"),
+        Scenario("GET /api/proverbs/search", "GET", lambda n: f"/api/proverbs/search?q={cycle(SEARCH_QUERIES)(n)}"),
+        Scenario("GET /api/search", "GET", lambda n: f"/api/search?q={cycle(SEARCH_QUERIES)(n)}"),
+        Scenario("GET /api/proverbs/daily", "GET", lambda n: "/api/proverbs/daily"),
+        Scenario("GET /api/folktales", "GET", lambda n: "/api/folktales"),
+        Scenario("GET /api/folktales/{id}", "GET", lambda n: f"/api/folktales/{cycle(story_ids)(n)}"),
+        Scenario("POST /api/translate", "POST", lambda n: "/api/translate", translation),
+        Scenario("POST /api/translate/batch", "POST", lambda n: "/api/translate/batch",
+                 lambda n: {"items": [translation(n * 4 + i) for i in range(4)]}),
+        Scenario("POST /api/translate/stream", "POST", lambda n: "/api/translate/stream", translation),
+        Scenario("POST /api/cultural-content", "POST", lambda n: "/api/cultural-content", cultural),
+        Scenario("POST /api/cultural-content/stream", "POST", lambda n: "/api/cultural-content/stream", cultural),
+        Scenario("GET /api/cache/stats", "GET", lambda n: "/api/cache/stats"),
+        Scenario("GET /metrics", "GET", lambda n: "/metrics"),
+    ]
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, scenario: Scenario, concurrency: int, duration: float, counter: Iterator[int]
+) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            n = next(counter)
+            body = scenario.body(n) if scenario.body else None
+            started = time.perf_counter()
+            try:
+                # Stream so SSE routes are timed until their last event
+                async with client.stream(scenario.method, scenario.path(n), json=body) as response:
+                    content = await response.aread()
+                    # SSE routes report upstream failures as an error event
+                    failed = response.status_code >= 500 or b"event: error" in content
+            except httpx.HTTPError:
+                failed = True
+            latencies.append(time.perf_counter() - started)
+            errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "route": scenario.name,
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+async def wait_until_up(url: str, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=url) as client:
+        while True:
+            try:
+                if (await client.get("/api/")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Server at {url} did not come up within {timeout:g}s")
+            await asyncio.sleep(0.2)
+
+
+def start_server(args) -> subprocess.Popen:
+    command = [
+        sys.executable, str(BENCH_DIR / "bench_server.py"),
+        "--port", str(args.port),
+        "--llm-latency", str(args.llm_latency),
+        "--llm-jitter", str(args.llm_jitter),
+        "--llm-error-rate", str(args.llm_error_rate),
+    ]
+    if args.mongo_url:
+        command += ["--mongo-url", args.mongo_url]
+    return subprocess.Popen(command, cwd=BENCH_DIR.parent, env=os.environ.copy())
+
+
+async def run(args) -> List[Dict[str, Any]]:
+    await wait_until_up(args.url)
+    selected = [s for s in scenarios(args.unique) if not args.routes or any(r in s.name for r in args.routes)]
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    results = []
+    # Shared across routes so --unique texts never repeat between scenarios
+    counter = itertools.count()
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=args.timeout) as client:
+        print(f"{'route':<38}{'requests':>10}{'errors':>8}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+        for scenario in selected:
+            result = await run_scenario(client, scenario, args.concurrency, args.duration, counter)
+            results.append(result)
+            print(
+                f"{result['route']:<38}{result['requests']:>10}{result['errors']:>8}{result['rps']:>10,.0f}"
+                f"{result['p50_ms']:>10.1f}{result['p95_ms']:>10.1f}{result['p99_ms']:>10.1f}"
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="benchmark an already running server instead of starting one")
+    parser.add_argument("--port", type=int, default=8011)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10, help="seconds per route")
+    parser.add_argument("--timeout", type=float, default=60, help="per-request timeout (s)")
+    parser.add_argument("--routes", nargs="*", help="only run routes containing one of these strings")
+    parser.add_argument("--unique", action="store_true", help="make every translation text unique")
+    parser.add_argument("--mongo-url", help="real MongoDB for the spawned server")
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    parser.add_argument("--llm-jitter", type=float, default=0.05)
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    args = parser.parse_args()
+
+    process = None
+    if not args.url:
+        args.url = f"http://127.0.0.1:{args.port}"
+        process = start_server(args)
+    try:
+        results = asyncio.run(run(args))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+    if args.json:
+        settings = {k: v for k, v in vars(args).items() if k not in ("json", "routes")}
+        args.json.write_text(json.dumps({"settings": settings, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
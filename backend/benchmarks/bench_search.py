@@ -0,0 +1,102 @@
+"""Exact vs fuzzy search latency on a synthetic large proverb corpus.
+
+Run from the backend directory:
+
+    python benchmarks/bench_search.py [--proverbs 100000] [--queries 500]
+
+The corpus is the seed proverbs plus generated Yoruba-like proverbs built
+from a syllable inventory, so vocabulary growth is realistic (many distinct
+words, each shared by many entries). Queries are corpus words with one or
+two random typos applied, which is what fuzzy search is for.
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from corpus_seed import PROVERB_CATEGORIES  # noqa: E402
+from search import ProverbIndex, tokenize  # noqa: E402
+
+SYLLABLES = [
+    "a", "ba", "bi", "bọ", "da", "di", "fẹ", "fi", "gba", "gbọ", "ko", "kọ", "la", "lo",
+    "mi", "mọ", "na", "ni", "ọ", "pa", "ra", "ri", "ṣe", "ṣi", "ta", "tọ", "wa", "wọ", "yi", "yọ",
+]
+ENGLISH = "the one who a child elder water river king wisdom patience road market tortoise rain".split()
+
+
+def make_word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def make_corpus(size: int, vocabulary_size: int, seed: int):
+    rng = random.Random(seed)
+    vocabulary = [make_word(rng) for _ in range(vocabulary_size)]
+    categories = {key: {**value, "proverbs": list(value["proverbs"])} for key, value in PROVERB_CATEGORIES.items()}
+    bulk = []
+    for _ in range(size):
+        bulk.append({
+            "yoruba": " ".join(rng.choice(vocabulary) for _ in range(rng.randint(5, 10))),
+            "literal": " ".join(rng.choice(ENGLISH) for _ in range(rng.randint(5, 10))),
+            "meaning": " ".join(rng.choice(ENGLISH) for _ in range(rng.randint(4, 8))),
+            "context": " ".join(rng.choice(ENGLISH) for _ in range(3)),
+        })
+    categories["synthetic"] = {"name": "Synthetic", "name_yoruba": "Àfikún", "proverbs": bulk}
+    return categories, vocabulary
+
+
+def typo(word: str, rng: random.Random) -> str:
+    word = list(word)
+    for _ in range(1 if len(word) < 6 else 2):
+        position = rng.randrange(len(word))
+        operation = rng.choice(("drop", "swap", "replace"))
+        if operation == "drop" and len(word) > 3:
+            del word[position]
+        elif operation == "swap" and position + 1 < len(word):
+            word[position], word[position + 1] = word[position + 1], word[position]
+        else:
+            word[position] = rng.choice("abdefgiklmnoprstuwy")
+    return "".join(word)
+
+
+def measure(index: ProverbIndex, queries, fuzzy: bool):
+    latencies, hits = [], 0
+    for query in queries:
+        started = time.perf_counter()
+        total, _ = index.search(query, limit=20, fuzzy=fuzzy)
+        latencies.append((time.perf_counter() - started) * 1000)
+        hits += total > 0
+    latencies.sort()
+    return latencies, hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--proverbs", type=int, default=100_000)
+    parser.add_argument("--vocabulary", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    categories, vocabulary = make_corpus(args.proverbs, args.vocabulary, args.seed)
+    started = time.perf_counter()
+    index = ProverbIndex(categories)
+    print(f"indexed {len(index):,} proverbs in {time.perf_counter() - started:.1f}s")
+
+    rng = random.Random(args.seed + 1)
+    words = [w for w in (tokenize(" ".join(vocabulary))) if len(w) >= 4]
+    queries = [typo(rng.choice(words), rng) for _ in range(args.queries)]
+
+    print(f"{'mode':<8}{'hit rate':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'mean ms':>10}")
+    for fuzzy in (False, True):
+        latencies, hits = measure(index, queries, fuzzy)
+        p = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))]  # noqa: E731
+        print(f"{'fuzzy' if fuzzy else 'exact':<8}{hits / len(queries):>10.0%}{p(0.5):>10.2f}"
+              f"{p(0.95):>10.2f}{p(0.99):>10.2f}{statistics.mean(latencies):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Run ``server.py`` against a fake Gemini model and a local Mongo stand-in.
+
+Run from the backend directory:
+
+    python benchmarks/bench_server.py [--port 8011] [--llm-latency 0.2] [--llm-error-rate 0.05]
+
+Without ``--mongo-url`` the Motor client is replaced by an in-memory
+``mongomock_motor`` client, so no database is needed; pass a URL to measure
+against a real local ``mongod`` instead. ``bench_load.py`` starts this script
+in a subprocess unless it is pointed at an existing ``--url``.
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import uvicorn
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_llm import FakeGenerativeModel  # noqa: E402
+
+
+def use_mongo_stand_in():
+    """Swap Motor's client for mongomock before ``server`` creates one."""
+    import motor.motor_asyncio
+    from mongomock_motor import AsyncMongoMockClient
+
+    class StandInClient(AsyncMongoMockClient):
+        def __init__(self, *args, event_listeners=None, **kwargs):
+            super().__init__(*args, **kwargs)
+
+    motor.motor_asyncio.AsyncIOMotorClient = StandInClient
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8011)
+    parser.add_argument("--mongo-url", help="real MongoDB to use instead of the in-memory stand-in")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="mean fake Gemini latency (s)")
+    parser.add_argument("--llm-jitter", type=float, default=0.05, help="latency standard deviation (s)")
+    parser.add_argument("--llm-error-rate", type=float, default=0.0, help="share of failing Gemini calls")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DB_NAME", "itan_bench")
+    os.environ.setdefault("GEMINI_API_KEY", "bench")
+    # The fake model is free; only concurrency should limit it
+    os.environ.setdefault("LLM_REQUESTS_PER_MINUTE", "1000000")
+    if args.mongo_url:
+        os.environ["MONGO_URL"] = args.mongo_url
+    else:
+        os.environ.setdefault("MONGO_URL", "mongodb://stand-in")
+        use_mongo_stand_in()
+
+    import server
+
+    fake_model = FakeGenerativeModel(
+        latency=args.llm_latency, jitter=args.llm_jitter, error_rate=args.llm_error_rate
+    )
+    server.llm_gateway.model_factory = lambda model_name, profile: fake_model
+    uvicorn.run(server.app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
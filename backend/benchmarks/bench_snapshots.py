@@ -0,0 +1,86 @@
+"""Compare per-request catalog construction with pre-rendered snapshots.
+
+Run from the backend directory:
+
+    python benchmarks/bench_snapshots.py [--iterations 2000]
+
+The "per-request" numbers replay what the catalog routes used to do on every
+call: build the Pydantic models / dicts and let FastAPI validate and
+serialize them through the response model. The "snapshot" numbers are the
+current path: pick a pre-serialized, pre-compressed body.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+import server  # noqa: E402
+from snapshots import snapshot_response  # noqa: E402
+
+ORISHA_LIST = TypeAdapter(List[server.OrishaProfile])
+
+
+def per_request_orisha():
+    profiles = [server.OrishaProfile(id=orisha_id, **data) for orisha_id, data in server.ORISHA_DATA.items()]
+    validated = ORISHA_LIST.validate_python([p.model_dump() for p in profiles])
+    return JSONResponse(jsonable_encoder(validated))
+
+
+def per_request_folktales():
+    tales = [{"id": story_id, **data} for story_id, data in server.IJAPA_STORIES.items()]
+    return JSONResponse(jsonable_encoder(tales))
+
+
+def per_request_categories():
+    categories = [
+        {
+            "id": category_id,
+            "name": data["name"],
+            "name_yoruba": data["name_yoruba"],
+            "count": len(data["proverbs"])
+        }
+        for category_id, data in server.PROVERB_CATEGORIES.items()
+    ]
+    return JSONResponse(jsonable_encoder(categories))
+
+
+def snapshot(key: str, accept_encoding: str) -> Callable[[], Any]:
+    headers = {"accept-encoding": accept_encoding}
+    return lambda: snapshot_response(server.catalog_snapshot[key], headers, server.CATALOG_CACHE_CONTROL)
+
+
+def measure(func: Callable[[], Any], iterations: int) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return iterations / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    cases = [
+        ("/api/orisha", per_request_orisha, "orisha"),
+        ("/api/folktales", per_request_folktales, "folktales"),
+        ("/api/proverbs/categories", per_request_categories, "proverb_categories"),
+    ]
+    print(f"{'route':<28}{'per-request/s':>16}{'snapshot/s':>14}{'snapshot+gzip/s':>18}{'speedup':>10}")
+    for route, baseline, key in cases:
+        before = measure(baseline, args.iterations)
+        after = measure(snapshot(key, ""), args.iterations)
+        after_gzip = measure(snapshot(key, "gzip, deflate, br"), args.iterations)
+        print(f"{route:<28}{before:>16,.0f}{after:>14,.0f}{after_gzip:>18,.0f}{after / before:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Local stand-in for ``genai.GenerativeModel`` used by the load benchmarks.
+
+It answers ``generate_content_async`` (plain and ``stream=True``) after a
+configurable latency, fails a configurable share of calls, and returns text
+shaped like what the real prompts ask for: JSON for the daily proverb and a
+few sentences otherwise. Nothing leaves the machine.
+"""
+import asyncio
+import json
+import random
+from typing import AsyncIterator, List, Optional
+
+FAKE_PROVERB = {
+    "yoruba": "Àgbà kì í wà lọ́jà, kí orí ọmọ tuntun wọ́.",
+    "literal_translation": "An elder does not stay in the market and let a child's head be twisted.",
+    "meaning": "Elders are responsible for guiding the young when they are present.",
+    "usage_context": "Said to remind elders of their duty to intervene and advise.",
+}
+
+FAKE_TEXT = (
+    "Ọ̀rọ̀ yìí jẹ́ àpẹẹrẹ fún ìdánwò. The quick response below stands in for a "
+    "Gemini generation so that the benchmark measures the server, not the "
+    "upstream model. Ẹ ṣé o."
+)
+
+
+class FakeLLMError(Exception):
+    """Injected upstream failure."""
+
+
+class _Chunk:
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _StreamedResponse:
+    def __init__(self, chunks: List[str], chunk_delay: float):
+        self._chunks = chunks
+        self._chunk_delay = chunk_delay
+
+    async def __aiter__(self) -> AsyncIterator[_Chunk]:
+        for chunk in self._chunks:
+            await asyncio.sleep(self._chunk_delay)
+            yield _Chunk(chunk)
+
+
+class FakeGenerativeModel:
+    """Drop-in for the subset of ``GenerativeModel`` the gateway uses."""
+
+    def __init__(
+        self,
+        latency: float = 0.2,
+        jitter: float = 0.05,
+        error_rate: float = 0.0,
+        stream_chunks: int = 5,
+        seed: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.stream_chunks = max(1, stream_chunks)
+        self._random = random.Random(seed)
+        self.calls = 0
+
+    def _delay(self) -> float:
+        return max(0.0, self._random.gauss(self.latency, self.jitter)) if self.jitter else self.latency
+
+    @staticmethod
+    def _answer(prompt: str) -> str:
+        if '"literal_translation"' in prompt:
+            return json.dumps(FAKE_PROVERB, ensure_ascii=False)
+        return FAKE_TEXT
+
+    async def generate_content_async(self, prompt: str, stream: bool = False):
+        self.calls += 1
+        failing = self._random.random() < self.error_rate
+        text = self._answer(prompt)
+        if stream:
+            # First byte after a fraction of the latency, the rest spread out
+            first = self._delay() / self.stream_chunks
+            await asyncio.sleep(first)
+            if failing:
+                raise FakeLLMError("Injected upstream failure")
+            size = -(-len(text) // self.stream_chunks)
+            chunks = [text[i:i + size] for i in range(0, len(text), size)]
+            return _StreamedResponse(chunks, first)
+
+        await asyncio.sleep(self._delay())
+        if failing:
+            raise FakeLLMError("Injected upstream failure")
+        return _Chunk(text)
@@ -0,0 +1,261 @@
+"""Small caching primitives shared by the generative routes.
+
+``TieredCache`` checks an in-process LRU first, then a SQLite file that
+every worker on the same host can see, then a MongoDB collection shared by
+every host. All tiers expire entries by TTL.
+"""
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """In-process LRU cache whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, max_size: int = 1024, ttl: float = 3600):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str):
+        self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class MongoCache:
+    """Cache tier stored in a MongoDB collection with a TTL index."""
+
+    def __init__(self, collection, ttl: float = 7 * 24 * 3600):
+        self._collection = collection
+        self.ttl = ttl
+
+    async def ensure_indexes(self):
+        try:
+            await self._collection.create_index("expires_at", expireAfterSeconds=0)
+        except Exception as e:
+            logger.warning("Could not create cache TTL index on %s: %s", self._collection.name, e)
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            doc = await self._collection.find_one({"_id": key})
+        except Exception as e:
+            logger.warning("Cache read failed for %s: %s", key, e)
+            return None
+        # The TTL monitor only runs once a minute, so check expiry here too
+        if doc is None or doc["expires_at"] < datetime.utcnow():
+            return None
+        return doc["value"]
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        expires_at = datetime.utcnow() + timedelta(seconds=self.ttl if ttl is None else ttl)
+        try:
+            await self._collection.replace_one(
+                {"_id": key},
+                {"_id": key, "value": value, "expires_at": expires_at},
+                upsert=True,
+            )
+        except Exception as e:
+            logger.warning("Cache write failed for %s: %s", key, e)
+
+    async def delete(self, key: str):
+        try:
+            await self._collection.delete_one({"_id": key})
+        except Exception as e:
+            logger.warning("Cache delete failed for %s: %s", key, e)
+
+
+class SQLiteCache:
+    """Cache tier in a local SQLite file shared by every worker on the host.
+
+    The database runs in WAL mode so readers in one worker never wait for a
+    writer in another. Values are stored as JSON. Expired entries are purged
+    and the least recently read entries beyond ``max_entries`` are evicted
+    every ``evict_every`` writes. All queries run on one dedicated thread per
+    worker, so the event loop never waits on disk.
+    """
+
+    # Reads only bump accessed_at when it is older than this, so hits rarely write
+    TOUCH_INTERVAL = 60
+
+    def __init__(self, path: str, ttl: float = 24 * 3600, max_entries: int = 100_000, evict_every: int = 100):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.evict_every = evict_every
+        self._connection: Optional[sqlite3.Connection] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._writes = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)")
+            connection.execute("CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)")
+            self._connection = connection
+        return self._connection
+
+    async def _run(self, operation: Callable[[sqlite3.Connection], Any]) -> Any:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-cache")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: operation(self._connect()))
+
+    async def ensure_indexes(self):
+        try:
+            await self._run(self._evict)
+        except Exception as e:
+            logger.warning("Could not prepare local cache at %s: %s", self.path, e)
+
+    async def get(self, key: str) -> Optional[Any]:
+        def read(connection: sqlite3.Connection):
+            now = time.time()
+            row = connection.execute(
+                "SELECT value, expires_at, accessed_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] < now:
+                return None
+            if row[2] < now - self.TOUCH_INTERVAL:
+                connection.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+            return row[0]
+
+        try:
+            value = await self._run(read)
+        except Exception as e:
+            logger.warning("Local cache read failed for %s: %s", key, e)
+            return None
+        return None if value is None else json.loads(value)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        def write(connection: sqlite3.Connection):
+            now = time.time()
+            connection.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, encoded, now + (self.ttl if ttl is None else ttl), now),
+            )
+            self._writes += 1
+            if self._writes % self.evict_every == 0:
+                self._evict(connection)
+
+        encoded = json.dumps(value, ensure_ascii=False)
+        try:
+            await self._run(write)
+        except Exception as e:
+            logger.warning("Local cache write failed for %s: %s", key, e)
+
+    async def delete(self, key: str):
+        try:
+            await self._run(lambda connection: connection.execute("DELETE FROM cache WHERE key = ?", (key,)))
+        except Exception as e:
+            logger.warning("Local cache delete failed for %s: %s", key, e)
+
+    def _evict(self, connection: sqlite3.Connection):
+        connection.execute("DELETE FROM cache WHERE expires_at < ?", (time.time(),))
+        excess = connection.execute("SELECT COUNT(*) FROM cache").fetchone()[0] - self.max_entries
+        if excess > 0:
+            connection.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY accessed_at LIMIT ?)", (excess,)
+            )
+
+    def close(self):
+        def close_connection():
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+        if self._executor is not None:
+            self._executor.submit(close_connection)
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+class TieredCache:
+    """Memory LRU in front of optional host-local and shared cache tiers,
+    with hit/miss counters."""
+
+    def __init__(self, memory: TTLCache, shared=None, local=None):
+        self.memory = memory
+        self.local = local
+        self.shared = shared
+        self.stats: Dict[str, int] = {"memory_hits": 0, "local_hits": 0, "shared_hits": 0, "misses": 0}
+
+    def _tiers(self):
+        return [tier for tier in (self.local, self.shared) if tier is not None]
+
+    async def ensure_indexes(self):
+        for tier in self._tiers():
+            await tier.ensure_indexes()
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = self.memory.get(key)
+        if value is not None:
+            self.stats["memory_hits"] += 1
+            return value
+        if self.local is not None:
+            value = await self.local.get(key)
+            if value is not None:
+                self.stats["local_hits"] += 1
+                self.memory.set(key, value)
+                return value
+        if self.shared is not None:
+            value = await self.shared.get(key)
+            if value is not None:
+                self.stats["shared_hits"] += 1
+                self.memory.set(key, value)
+                if self.local is not None:
+                    await self.local.set(key, value)
+                return value
+        self.stats["misses"] += 1
+        return None
+
+    async def set(self, key: str, value: Any):
+        self.memory.set(key, value)
+        for tier in self._tiers():
+            await tier.set(key, value)
+
+    async def delete(self, key: str):
+        self.memory.delete(key)
+        for tier in self._tiers():
+            await tier.delete(key)
+
+    def snapshot(self) -> Dict[str, Any]:
+        lookups = sum(self.stats.values())
+        hits = lookups - self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self.memory),
+        }
@@ -0,0 +1,138 @@
+"""Circuit breaker for the upstream LLM client.
+
+The breaker keeps a rolling window of call outcomes and latencies. When the
+error rate or the share of slow calls in the window crosses its threshold
+the circuit opens and calls fail immediately instead of waiting out the
+upstream timeout. After a cooldown a limited number of probe calls are let
+through (half-open); a successful probe closes the circuit again.
+
+Every state change starts a new generation. ``before_call`` hands out the
+current generation as a ticket, and outcomes carrying a ticket from an
+earlier generation are ignored: a slow call admitted while the circuit was
+closed must not close it again when it finally succeeds during a probe.
+"""
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """Rolling-window error-rate and latency circuit breaker."""
+
+    def __init__(
+        self,
+        window_seconds: float = 60,
+        min_calls: int = 10,
+        error_rate_threshold: float = 0.5,
+        slow_call_seconds: float = 10,
+        slow_rate_threshold: float = 0.8,
+        cooldown_seconds: float = 30,
+        half_open_probes: int = 1,
+    ):
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.error_rate_threshold = error_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_rate_threshold = slow_rate_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.half_open_probes = half_open_probes
+
+        self.state = CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._generation = 0
+        # (timestamp, succeeded, latency)
+        self._calls: Deque[Tuple[float, bool, float]] = deque()
+        self.stats: Dict[str, int] = {"rejected": 0, "opened": 0}
+
+    def before_call(self) -> int:
+        """Raise ``CircuitOpenError`` unless a call may go upstream now.
+
+        Returns the ticket to pass to ``record`` or ``cancelled`` for this call.
+        """
+        if self.state == OPEN:
+            if time.monotonic() - self._opened_at < self.cooldown_seconds:
+                self.stats["rejected"] += 1
+                raise CircuitOpenError("LLM circuit is open")
+            self.state = HALF_OPEN
+            self._generation += 1
+            self._probes_in_flight = 0
+            logger.info("LLM circuit half-open; probing upstream")
+
+        if self.state == HALF_OPEN:
+            if self._probes_in_flight >= self.half_open_probes:
+                self.stats["rejected"] += 1
+                raise CircuitOpenError("LLM circuit is half-open; probe in progress")
+            self._probes_in_flight += 1
+        return self._generation
+
+    def record(self, ticket: int, succeeded: bool, latency: float):
+        """Record the outcome of a call that ``before_call`` allowed."""
+        if ticket != self._generation:
+            # Admitted before the last state change; it says nothing about this one
+            return
+        now = time.monotonic()
+        if self.state == HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if succeeded and latency < self.slow_call_seconds:
+                self._close()
+            else:
+                self._open(now)
+            return
+
+        self._calls.append((now, succeeded, latency))
+        self._evict(now)
+        if len(self._calls) < self.min_calls:
+            return
+        errors = sum(1 for _, ok, _ in self._calls if not ok)
+        slow = sum(1 for _, _, latency in self._calls if latency >= self.slow_call_seconds)
+        if (errors / len(self._calls) >= self.error_rate_threshold
+                or slow / len(self._calls) >= self.slow_rate_threshold):
+            self._open(now)
+
+    def cancelled(self, ticket: int):
+        """Release a call slot whose outcome will never be known."""
+        if self.state == HALF_OPEN and ticket == self._generation:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def snapshot(self) -> Dict[str, object]:
+        self._evict(time.monotonic())
+        calls = len(self._calls)
+        errors = sum(1 for _, ok, _ in self._calls if not ok)
+        return {
+            "state": self.state,
+            "window_calls": calls,
+            "window_error_rate": round(errors / calls, 4) if calls else 0.0,
+            **self.stats,
+        }
+
+    def _open(self, now: float):
+        if self.state != OPEN:
+            logger.warning("LLM circuit opened")
+            self.stats["opened"] += 1
+        self.state = OPEN
+        self._generation += 1
+        self._opened_at = now
+        self._calls.clear()
+
+    def _close(self):
+        logger.info("LLM circuit closed")
+        self.state = CLOSED
+        self._generation += 1
+        self._calls.clear()
+
+    def _evict(self, now: float):
+        cutoff = now - self.window_seconds
+        while self._calls and self._calls[0][0] < cutoff:
+            self._calls.popleft()
@@ -0,0 +1,161 @@
+"""MongoDB-backed corpus with an immutable in-memory snapshot.
+
+Òrìṣà profiles, proverb categories and folktales live in their own
+collections. They are read into a ``CorpusSnapshot`` at startup and a new
+snapshot is built and swapped in whenever a change stream (replica sets) or
+a cheap fingerprint poll (standalone servers) notices an edit. Request
+handlers only ever read the current snapshot.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+ORISHA_COLLECTION = "orishas"
+PROVERB_CATEGORY_COLLECTION = "proverb_categories"
+FOLKTALE_COLLECTION = "folktales"
+META_COLLECTION = "corpus_meta"
+
+CORPUS_COLLECTIONS = (ORISHA_COLLECTION, PROVERB_CATEGORY_COLLECTION, FOLKTALE_COLLECTION)
+
+
+@dataclass(frozen=True)
+class CorpusSnapshot:
+    """One consistent version of the corpus.
+
+    The dicts have the same shape as the seed literals in ``corpus_seed.py``
+    and must never be mutated; edits produce a new snapshot instead.
+    """
+
+    orishas: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    proverb_categories: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    folktales: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    loaded_at: datetime = field(default_factory=datetime.utcnow)
+
+
+def to_document(entry_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    return {"_id": entry_id, **data, "updated_at": datetime.utcnow()}
+
+
+def from_document(doc: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    data = {k: v for k, v in doc.items() if k not in ("_id", "updated_at")}
+    return doc["_id"], data
+
+
+class CorpusStore:
+    """Loads, seeds and watches the corpus collections."""
+
+    def __init__(self, db, poll_interval: float = 30):
+        self._db = db
+        self.poll_interval = poll_interval
+
+    async def ensure_indexes(self):
+        try:
+            await self._db[ORISHA_COLLECTION].create_index([("name", ASCENDING)])
+            await self._db[FOLKTALE_COLLECTION].create_index([("title", ASCENDING)])
+            for name in CORPUS_COLLECTIONS:
+                await self._db[name].create_index([("updated_at", DESCENDING)])
+        except Exception as e:
+            logger.warning("Could not create corpus indexes: %s", e)
+
+    async def seed(self, snapshot: CorpusSnapshot):
+        """Populate empty collections from ``snapshot`` (first start only)."""
+        sources = {
+            ORISHA_COLLECTION: snapshot.orishas,
+            PROVERB_CATEGORY_COLLECTION: snapshot.proverb_categories,
+            FOLKTALE_COLLECTION: snapshot.folktales,
+        }
+        for name, entries in sources.items():
+            collection = self._db[name]
+            if await collection.estimated_document_count() > 0:
+                continue
+            docs = [to_document(entry_id, data) for entry_id, data in entries.items()]
+            if docs:
+                await collection.insert_many(docs, ordered=False)
+                logger.info("Seeded %d documents into %s", len(docs), name)
+
+    async def load(self) -> CorpusSnapshot:
+        """Read every collection into a fresh snapshot."""
+        loaded = {}
+        for name in CORPUS_COLLECTIONS:
+            entries = {}
+            async for doc in self._db[name].find():
+                entry_id, data = from_document(doc)
+                entries[entry_id] = data
+            loaded[name] = entries
+        return CorpusSnapshot(
+            orishas=loaded[ORISHA_COLLECTION],
+            proverb_categories=loaded[PROVERB_CATEGORY_COLLECTION],
+            folktales=loaded[FOLKTALE_COLLECTION],
+        )
+
+    async def bump_version(self):
+        """Signal pollers on other workers that the corpus has changed."""
+        await self._db[META_COLLECTION].update_one(
+            {"_id": "version"},
+            {"$inc": {"version": 1}, "$set": {"updated_at": datetime.utcnow()}},
+            upsert=True,
+        )
+
+    async def fingerprint(self) -> Tuple:
+        """Cheap summary that changes whenever a corpus document does."""
+        meta = await self._db[META_COLLECTION].find_one({"_id": "version"})
+        parts = [meta["version"] if meta else 0]
+        for name in CORPUS_COLLECTIONS:
+            collection = self._db[name]
+            latest = await collection.find_one({}, {"updated_at": 1}, sort=[("updated_at", DESCENDING)])
+            parts.append(await collection.count_documents({}))
+            parts.append(latest.get("updated_at") if latest else None)
+        return tuple(parts)
+
+    async def watch(self, on_change: Callable[[CorpusSnapshot], Awaitable[None]]):
+        """Reload on every change, via change streams or fingerprint polling."""
+        try:
+            pipeline = [{"$match": {"ns.coll": {"$in": list(CORPUS_COLLECTIONS)}}}]
+            async with self._db.watch(pipeline) as stream:
+                logger.info("Watching corpus collections with a change stream")
+                async for _ in stream:
+                    # Let a burst of edits settle before reloading once
+                    await asyncio.sleep(0.5)
+                    await on_change(await self.load())
+        except OperationFailure as e:
+            logger.info("Change streams unavailable (%s); polling corpus every %ss", e, self.poll_interval)
+            await self._poll(on_change)
+        except Exception as e:
+            logger.warning("Corpus change stream failed (%s); falling back to polling", e)
+            await self._poll(on_change)
+
+    async def _poll(self, on_change: Callable[[CorpusSnapshot], Awaitable[None]]):
+        last: Optional[Tuple] = None
+        while True:
+            try:
+                current = await self.fingerprint()
+                if last is not None and current != last:
+                    await on_change(await self.load())
+                last = current
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Corpus poll failed: %s", e)
+            await asyncio.sleep(self.poll_interval)
+
+    async def run(self, seed: CorpusSnapshot, on_change: Callable[[CorpusSnapshot], Awaitable[None]]):
+        """Background job: seed if empty, load once, then keep watching."""
+        while True:
+            try:
+                await self.ensure_indexes()
+                await self.seed(seed)
+                await on_change(await self.load())
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Could not load corpus from MongoDB, serving seed data: %s", e)
+                await asyncio.sleep(self.poll_interval)
+        await self.watch(on_change)
@@ -0,0 +1,84 @@
+"""Export or import the corpus as NDJSON through a running server.
+
+    python corpus_cli.py export [--out corpus.ndjson]
+    python corpus_cli.py import corpus.ndjson
+
+Both commands stream, so files of any size use constant memory on both
+ends. The server must have ``ADMIN_TOKEN`` set; pass the same value with
+``--token`` or the ``ADMIN_TOKEN`` environment variable. ``--url`` (or
+``BACKEND_URL``) is the server's base URL, without ``/api``.
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import httpx
+
+CHUNK_BYTES = 64 * 1024
+
+
+def read_chunks(path: Path) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(CHUNK_BYTES)
+            if not chunk:
+                return
+            yield chunk
+
+
+def export_corpus(client: httpx.Client, out) -> int:
+    lines = 0
+    with client.stream("GET", "/api/admin/export") as response:
+        if response.is_error:
+            response.read()
+        response.raise_for_status()
+        for chunk in response.iter_bytes():
+            out.write(chunk)
+            lines += chunk.count(b"\n")
+    print(f"exported {lines} entries", file=sys.stderr)
+    return 0
+
+
+def import_corpus(client: httpx.Client, path: Path) -> int:
+    response = client.post(
+        "/api/admin/import", content=read_chunks(path), headers={"Content-Type": "application/x-ndjson"}
+    )
+    response.raise_for_status()
+    result = response.json()
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    return 1 if result["invalid"] else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=os.environ.get("BACKEND_URL", "http://localhost:8001"))
+    parser.add_argument("--token", default=os.environ.get("ADMIN_TOKEN"))
+    parser.add_argument("--timeout", type=float, default=300, help="seconds to wait for the server")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export_parser = commands.add_parser("export", help="write the corpus as NDJSON")
+    export_parser.add_argument("--out", type=Path, help="output file (default: stdout)")
+    import_parser = commands.add_parser("import", help="upsert entries from an NDJSON file")
+    import_parser.add_argument("file", type=Path)
+    args = parser.parse_args()
+
+    if not args.token:
+        parser.error("an admin token is required (--token or ADMIN_TOKEN)")
+    headers = {"X-Admin-Token": args.token}
+    with httpx.Client(base_url=args.url.rstrip("/"), headers=headers, timeout=args.timeout) as client:
+        try:
+            if args.command == "export":
+                if args.out is None:
+                    return export_corpus(client, sys.stdout.buffer)
+                with open(args.out, "wb") as out:
+                    return export_corpus(client, out)
+            return import_corpus(client, args.file)
+        except httpx.HTTPStatusError as e:
+            print(f"{e.response.status_code}: {e.response.text}", file=sys.stderr)
+            return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""BM25-ranked search across Òrìṣà, proverbs and folktales at once.
+
+Every corpus entry becomes one document with weighted fields (a BM25F-style
+weighted term frequency), and each posting stores its precomputed BM25
+impact, so a query is just a sum over the postings of its terms. Query
+terms also match words they prefix and, when nothing else matches, words a
+typo away (see ``search.FuzzyVocabulary``). Hits carry their type, a score,
+``<mark>``-highlighted snippets of the matching fields, and the response
+includes per-type facet counts.
+"""
+import bisect
+import html
+import math
+import re
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from search import FuzzyVocabulary, tokenize
+
+ORISHA = "orisha"
+PROVERB = "proverb"
+FOLKTALE = "folktale"
+DOC_TYPES = (ORISHA, PROVERB, FOLKTALE)
+
+FIELD_WEIGHTS = {
+    ORISHA: {
+        "name": 4.0, "yoruba_name": 4.0, "domains": 3.0, "symbols": 2.0, "colors": 1.0,
+        "story": 1.0, "yoruba_story": 1.0, "diaspora": 1.0,
+    },
+    PROVERB: {"yoruba": 3.0, "literal": 2.0, "meaning": 1.5, "context": 1.0},
+    FOLKTALE: {
+        "title": 3.0, "title_yoruba": 3.0, "characters": 2.0, "summary": 1.5, "moral": 1.0, "full_story": 1.0,
+    },
+}
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+PREFIX_MATCH_FACTOR = 0.5
+PREFIX_MAX_EXPANSIONS = 50
+FUZZY_MATCH_FACTOR = 0.4
+
+SNIPPET_RADIUS = 80
+# Words as written, including the combining tone marks \w does not cover
+WORD_RE = re.compile(r"[\w\u0300-\u036f]+")
+
+
+def proverb_id(category_id: str, index: int) -> str:
+    return f"{category_id}-{index}"
+
+
+def field_text(value: Any) -> str:
+    if isinstance(value, dict):
+        return ", ".join(str(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(v) for v in value)
+    return "" if value is None else str(value)
+
+
+def corpus_documents(
+    orishas: Dict[str, Dict[str, Any]],
+    proverb_categories: Dict[str, Dict[str, Any]],
+    folktales: Dict[str, Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """One ``{"type", "id", "title", "subtitle", "fields"}`` per corpus entry."""
+    docs = []
+    for orisha_id, data in orishas.items():
+        docs.append({
+            "type": ORISHA, "id": orisha_id, "title": data.get("name", ""),
+            "subtitle": ", ".join(data.get("domains", [])), "fields": data,
+        })
+    for category_id, category in proverb_categories.items():
+        for index, proverb in enumerate(category.get("proverbs", [])):
+            docs.append({
+                "type": PROVERB, "id": proverb_id(category_id, index), "title": proverb.get("yoruba", ""),
+                "subtitle": category.get("name", ""), "fields": proverb,
+            })
+    for story_id, story in folktales.items():
+        docs.append({
+            "type": FOLKTALE, "id": story_id, "title": story.get("title", ""),
+            "subtitle": story.get("title_yoruba", ""), "fields": story,
+        })
+    return docs
+
+
+def highlight(text: str, terms: Set[str]) -> Optional[str]:
+    """HTML-escaped ``text`` with matching words in ``<mark>``; ``None`` if none match.
+
+    Long fields are cut to a window around the first match.
+    """
+    spans = [m.span() for m in WORD_RE.finditer(text) if terms.intersection(tokenize(m.group()))]
+    if not spans:
+        return None
+    start, end = 0, len(text)
+    if len(text) > 2 * SNIPPET_RADIUS:
+        start = max(0, spans[0][0] - SNIPPET_RADIUS)
+        end = min(len(text), spans[0][1] + SNIPPET_RADIUS)
+        # Do not cut words in half
+        while start > 0 and not text[start - 1].isspace():
+            start -= 1
+        while end < len(text) and not text[end].isspace():
+            end += 1
+
+    parts, cursor = [], start
+    for span_start, span_end in spans:
+        if span_start < start or span_end > end:
+            continue
+        parts.append(html.escape(text[cursor:span_start], quote=False))
+        parts.append(f"<mark>{html.escape(text[span_start:span_end], quote=False)}</mark>")
+        cursor = span_end
+    parts.append(html.escape(text[cursor:end], quote=False))
+    return ("…" if start > 0 else "") + "".join(parts) + ("…" if end < len(text) else "")
+
+
+class CorpusSearchIndex:
+    """Precomputed BM25 postings over every corpus entry."""
+
+    def __init__(self, docs: Sequence[Dict[str, Any]]):
+        self._docs = list(docs)
+        term_freqs: List[Dict[str, float]] = []
+        lengths: List[float] = []
+        for doc in self._docs:
+            weights = FIELD_WEIGHTS[doc["type"]]
+            freqs: Dict[str, float] = defaultdict(float)
+            length = 0.0
+            for field, weight in weights.items():
+                tokens = tokenize(field_text(doc["fields"].get(field)))
+                length += weight * len(tokens)
+                for token in tokens:
+                    freqs[token] += weight
+            term_freqs.append(freqs)
+            lengths.append(length)
+
+        # Lengths are normalized per type: stories are much longer than proverbs
+        average = {}
+        for doc_type in DOC_TYPES:
+            type_lengths = [lengths[i] for i, doc in enumerate(self._docs) if doc["type"] == doc_type]
+            average[doc_type] = (sum(type_lengths) / len(type_lengths)) if type_lengths else 1.0
+
+        document_frequency: Dict[str, int] = defaultdict(int)
+        for freqs in term_freqs:
+            for token in freqs:
+                document_frequency[token] += 1
+
+        count = len(self._docs)
+        postings: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+        for doc_id, freqs in enumerate(term_freqs):
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc_id] / (average[self._docs[doc_id]["type"]] or 1.0))
+            for token, tf in freqs.items():
+                df = document_frequency[token]
+                idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+                postings[token].append((doc_id, idf * tf * (BM25_K1 + 1) / (tf + norm)))
+
+        self._postings = dict(postings)
+        self._vocabulary = sorted(self._postings)
+        self._fuzzy = FuzzyVocabulary(self._vocabulary)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def _expand(self, token: str, fuzzy: bool) -> Dict[str, float]:
+        """Vocabulary words a query token matches, with their score factor."""
+        expansions: Dict[str, float] = {}
+        if token in self._postings:
+            expansions[token] = 1.0
+        if len(token) >= 2:
+            start = bisect.bisect_right(self._vocabulary, token)
+            for word in self._vocabulary[start:start + PREFIX_MAX_EXPANSIONS]:
+                if not word.startswith(token):
+                    break
+                expansions[word] = PREFIX_MATCH_FACTOR
+        if fuzzy and not expansions:
+            for word, distance in self._fuzzy.matches(token):
+                expansions[word] = FUZZY_MATCH_FACTOR * (1 - distance / len(token))
+        return expansions
+
+    def search(
+        self,
+        query: str,
+        types: Optional[Sequence[str]] = None,
+        limit: int = 20,
+        offset: int = 0,
+        fuzzy: bool = True,
+    ) -> Dict[str, Any]:
+        """Return ``{"total", "facets", "hits"}`` for ``query``.
+
+        ``facets`` counts matches per type before the ``types`` filter, so a
+        client can show how many hits the other tabs would have.
+        """
+        facets = {doc_type: 0 for doc_type in DOC_TYPES}
+        scores: Dict[int, float] = defaultdict(float)
+        matched_terms: Set[str] = set()
+        for token in dict.fromkeys(tokenize(query)):
+            for word, factor in self._expand(token, fuzzy).items():
+                matched_terms.add(word)
+                for doc_id, impact in self._postings[word]:
+                    scores[doc_id] += impact * factor
+
+        for doc_id in scores:
+            facets[self._docs[doc_id]["type"]] += 1
+        wanted = set(types) if types else None
+        ranked = sorted(
+            ((doc_id, score) for doc_id, score in scores.items()
+             if wanted is None or self._docs[doc_id]["type"] in wanted),
+            key=lambda item: (-item[1], item[0]),
+        )
+        hits = [self._hit(doc_id, score, matched_terms) for doc_id, score in ranked[offset:offset + limit]]
+        return {"total": len(ranked), "facets": facets, "hits": hits}
+
+    def _hit(self, doc_id: int, score: float, terms: Set[str]) -> Dict[str, Any]:
+        doc = self._docs[doc_id]
+        highlights = {}
+        for field in FIELD_WEIGHTS[doc["type"]]:
+            snippet = highlight(field_text(doc["fields"].get(field)), terms)
+            if snippet is not None:
+                highlights[field] = snippet
+        return {
+            "type": doc["type"],
+            "id": doc["id"],
+            "title": doc["title"],
+            "subtitle": doc["subtitle"],
+            "score": round(score, 3),
+            "highlights": highlights,
+        }
@@ -0,0 +1,137 @@
+"""Streaming NDJSON export and import of the corpus collections.
+
+Each line is one entry: ``{"type": "orisha" | "proverb_category" |
+"folktale", "id": ..., <fields>}``, with the fields in the same shape as the
+seed literals in ``corpus_seed.py``. Export walks the collections with
+cursors and import validates and upserts lines in batches of ``batch_size``,
+so memory use depends on the batch size and the longest line, not on the
+size of the corpus.
+
+Import only adds and replaces entries; entries missing from the file are
+left alone.
+"""
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, List, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+from pymongo import ReplaceOne
+
+from corpus import (
+    FOLKTALE_COLLECTION,
+    ORISHA_COLLECTION,
+    PROVERB_CATEGORY_COLLECTION,
+    from_document,
+    to_document,
+)
+
+logger = logging.getLogger(__name__)
+
+ORISHA = "orisha"
+PROVERB_CATEGORY = "proverb_category"
+FOLKTALE = "folktale"
+
+COLLECTIONS = {
+    ORISHA: ORISHA_COLLECTION,
+    PROVERB_CATEGORY: PROVERB_CATEGORY_COLLECTION,
+    FOLKTALE: FOLKTALE_COLLECTION,
+}
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+MAX_LINE_BYTES = 1024 * 1024
+# Invalid lines beyond this many are counted but not described
+MAX_REPORTED_ERRORS = 100
+
+# type -> (model, name of the model field holding the entry id)
+Schemas = Dict[str, Tuple[Type[BaseModel], str]]
+
+
+class TransferError(ValueError):
+    """Raised when an import stream cannot be read at all."""
+
+
+async def export_lines(db, batch_size: int = 500) -> AsyncIterator[bytes]:
+    """Yield every corpus entry as one NDJSON line."""
+    for entry_type, name in COLLECTIONS.items():
+        async for doc in db[name].find().sort("_id", 1).batch_size(batch_size):
+            entry_id, data = from_document(doc)
+            line = {"type": entry_type, "id": entry_id, **data}
+            yield (json.dumps(line, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+async def ndjson_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Split a byte stream into lines without holding more than one at a time."""
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line
+        if len(pending) > MAX_LINE_BYTES:
+            raise TransferError(f"Line longer than {MAX_LINE_BYTES} bytes")
+    if pending:
+        yield pending
+
+
+def parse_line(line: bytes, schemas: Schemas) -> Tuple[str, str, Dict[str, Any]]:
+    """Validate one line; returns ``(type, id, data)`` or raises ``ValueError``."""
+    try:
+        entry = json.loads(line)
+    except ValueError as e:
+        raise ValueError(f"invalid JSON: {e}") from e
+    if not isinstance(entry, dict):
+        raise ValueError("expected a JSON object")
+    entry_type = entry.pop("type", None)
+    if entry_type not in schemas:
+        raise ValueError(f"unknown type {entry_type!r}; expected one of {', '.join(schemas)}")
+    entry_id = entry.pop("id", None)
+    if not isinstance(entry_id, str) or not entry_id:
+        raise ValueError("missing id")
+
+    model, id_field = schemas[entry_type]
+    entry.pop(id_field, None)
+    try:
+        data = model(**{id_field: entry_id}, **entry).model_dump()
+    except ValidationError as e:
+        raise ValueError(f"invalid {entry_type}: {e.errors()[0]['loc']}: {e.errors()[0]['msg']}") from e
+    del data[id_field]
+    return entry_type, entry_id, data
+
+
+async def import_lines(
+    db, lines: AsyncIterator[bytes], schemas: Schemas, batch_size: int = 500
+) -> Dict[str, Any]:
+    """Upsert every valid line; invalid lines are skipped and reported."""
+    counts = {entry_type: 0 for entry_type in COLLECTIONS}
+    errors: List[Dict[str, Any]] = []
+    invalid = 0
+    batches: Dict[str, List[ReplaceOne]] = {entry_type: [] for entry_type in COLLECTIONS}
+
+    async def write(entry_type: str):
+        batch = batches[entry_type]
+        if batch:
+            await db[COLLECTIONS[entry_type]].bulk_write(batch, ordered=False)
+            counts[entry_type] += len(batch)
+            batches[entry_type] = []
+
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            entry_type, entry_id, data = parse_line(line, schemas)
+        except ValueError as e:
+            invalid += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({"line": line_number, "error": str(e)})
+            continue
+        batches[entry_type].append(ReplaceOne({"_id": entry_id}, to_document(entry_id, data), upsert=True))
+        if len(batches[entry_type]) >= batch_size:
+            await write(entry_type)
+
+    for entry_type in COLLECTIONS:
+        await write(entry_type)
+    if invalid:
+        logger.warning("Corpus import skipped %d invalid lines", invalid)
+    return {"imported": counts, "invalid": invalid, "errors": errors}
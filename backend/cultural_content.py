@@ -0,0 +1,361 @@
+"""Pre-generated cultural content for every Òrìṣà × content type cell.
+
+The matrix is small (18 Òrìṣà × 3 content types) so every cell is generated
+ahead of time by a warmup job, persisted in MongoDB under a content version,
+and served from memory. Stale cells are refreshed in the background while the
+previous content keeps being served.
+
+MongoDB holds the one copy every worker serves. Concurrent requests for an
+empty cell share a single generation, and the first stored copy of a cell
+wins. Across workers, generation of an empty variant is claimed with an
+upsert on its ``_id``; workers that lose the claim poll for the winner's
+copy instead of generating their own. Before refreshing a stale variant a
+worker re-reads it, adopts another worker's refresh if there is one, and
+otherwise claims the refresh with a conditional update, so each empty or
+stale variant costs one Gemini call however many workers notice it.
+"""
+import asyncio
+import logging
+import random
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPES = ("story", "praise", "info")
+
+ContentGenerator = Callable[[str, str], Awaitable[str]]
+Cell = Tuple[str, str]
+
+
+def content_cell_type(content_type: str) -> str:
+    """Map a requested content type onto one of the generated branches."""
+    return content_type if content_type in ("story", "praise") else "info"
+
+
+class CulturalContentMatrix:
+    """In-memory matrix of generated content backed by a Mongo collection."""
+
+    def __init__(
+        self,
+        collection,
+        generate: ContentGenerator,
+        version: str = "1",
+        variants: int = 1,
+        max_age_seconds: float = 7 * 24 * 3600,
+        warmup_concurrency: int = 2,
+        claim_seconds: float = 300,
+        poll_interval: float = 0.5,
+    ):
+        self._collection = collection
+        self._generate = generate
+        self.version = version
+        self.variants = max(1, variants)
+        self.max_age = timedelta(seconds=max_age_seconds)
+        self.warmup_concurrency = warmup_concurrency
+        # How long a worker may hold a variant's generation before others take over
+        self.claim = timedelta(seconds=claim_seconds)
+        self.poll_interval = poll_interval
+        self._cells: Dict[Cell, Dict[int, dict]] = {}
+        self._creating: Dict[Cell, asyncio.Task] = {}
+        self._refreshing: Dict[Cell, asyncio.Task] = {}
+
+    async def ensure_indexes(self):
+        try:
+            await self._collection.create_index("version")
+        except Exception as e:
+            logger.warning("Could not create cultural content index: %s", e)
+
+    async def load(self):
+        """Load every stored cell for the current content version."""
+        try:
+            async for doc in self._collection.find({"version": self.version}):
+                cell = (doc["orisha_id"], doc["content_type"])
+                self._cells.setdefault(cell, {})[doc["variant"]] = doc
+        except Exception as e:
+            logger.warning("Could not load cultural content: %s", e)
+
+    def get(self, orisha_id: str, content_type: str) -> Optional[dict]:
+        """Return a stored entry for the cell, scheduling a refresh if stale."""
+        cell = (orisha_id, content_type)
+        entries = self._cells.get(cell)
+        if not entries:
+            return None
+        entry = random.choice(list(entries.values()))
+        if self._is_stale(entries):
+            self.schedule_refresh(orisha_id, entry["orisha_name"], content_type)
+        return entry
+
+    async def ensure(self, orisha_id: str, orisha_name: str, content_type: str) -> dict:
+        """Return content for the cell, generating the first variant if empty.
+
+        Concurrent callers share one attempt, including its failure.
+        """
+        cell = (orisha_id, content_type)
+        entry = self.get(orisha_id, content_type)
+        if entry is not None:
+            return entry
+
+        task = self._creating.get(cell)
+        if task is None:
+            task = asyncio.ensure_future(self._create(orisha_id, orisha_name, content_type))
+            self._creating[cell] = task
+            task.add_done_callback(lambda done: self._finish(cell, done))
+        # Shielded so one waiter disconnecting does not cancel the shared attempt
+        entry = await asyncio.shield(task)
+        if self.variants > 1:
+            self.schedule_refresh(orisha_id, orisha_name, content_type)
+        return entry
+
+    async def _create(self, orisha_id: str, orisha_name: str, content_type: str) -> dict:
+        # Another worker may have filled the cell since it was loaded
+        entry = await self._load_variant(orisha_id, content_type, 0)
+        if entry is None:
+            entry = await self._fill(orisha_id, orisha_name, content_type, 0)
+        return entry
+
+    async def _fill(self, orisha_id: str, orisha_name: str, content_type: str, variant: int) -> dict:
+        """Generate an empty variant once across workers.
+
+        The worker holding the claim generates and stores the variant; the
+        others adopt its copy. If the holder gives up without storing one,
+        the next worker to claim the variant generates it instead.
+        """
+        while True:
+            if await self._claim_empty(orisha_id, content_type, variant):
+                try:
+                    content = await self._generate(orisha_name, content_type)
+                except BaseException:
+                    await self._release_empty(orisha_id, content_type, variant)
+                    raise
+                return await self.put(orisha_id, orisha_name, content_type, content, variant)
+            entry = await self._await_claimed(orisha_id, content_type, variant)
+            if entry is not None:
+                return entry
+
+    def _finish(self, cell: Cell, task: asyncio.Task):
+        self._creating.pop(cell, None)
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter went away
+            task.exception()
+
+    def schedule_refresh(self, orisha_id: str, orisha_name: str, content_type: str):
+        cell = (orisha_id, content_type)
+        if cell in self._refreshing:
+            return
+        task = asyncio.create_task(self.refresh(orisha_id, orisha_name, content_type))
+        self._refreshing[cell] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(cell, None))
+
+    async def refresh(self, orisha_id: str, orisha_name: str, content_type: str):
+        """Regenerate stale or missing variants of a cell."""
+        for variant in range(self.variants):
+            entry = self._cells.get((orisha_id, content_type), {}).get(variant)
+            if entry is not None and not self._is_stale({variant: entry}):
+                continue
+            # Adopt another worker's copy if it is already fresh
+            stored = await self._load_variant(orisha_id, content_type, variant)
+            if stored is not None and not self._is_stale({variant: stored}):
+                continue
+            try:
+                if stored is None:
+                    await self._fill(orisha_id, orisha_name, content_type, variant)
+                elif await self._claim_refresh(stored):
+                    content = await self._generate(orisha_name, content_type)
+                    await self._replace_stale(stored, content)
+            except Exception as e:
+                logger.warning("Refresh of %s/%s failed: %s", orisha_id, content_type, e)
+                return
+
+    async def warmup(self, orishas: Iterable[Tuple[str, str]]):
+        """Fill every missing or stale cell for the given (id, name) pairs."""
+        semaphore = asyncio.Semaphore(self.warmup_concurrency)
+
+        async def fill(orisha_id: str, orisha_name: str, content_type: str):
+            async with semaphore:
+                await self.refresh(orisha_id, orisha_name, content_type)
+
+        await asyncio.gather(*(
+            fill(orisha_id, orisha_name, content_type)
+            for orisha_id, orisha_name in orishas
+            for content_type in CONTENT_TYPES
+        ))
+
+    async def run_warmup(self, orishas: Callable[[], Iterable[Tuple[str, str]]], interval_seconds: float):
+        """Background loop: load stored cells, then keep the matrix fresh.
+
+        ``orishas`` is called on every pass so corpus reloads are picked up.
+        """
+        await self.ensure_indexes()
+        while True:
+            try:
+                # Pick up cells other workers generated or refreshed
+                await self.load()
+                await self.warmup(orishas())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Cultural content warmup failed: %s", e)
+            await asyncio.sleep(interval_seconds)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "cells": len(self._cells),
+            "entries": sum(len(entries) for entries in self._cells.values()),
+            "refreshing": len(self._refreshing),
+        }
+
+    def _is_stale(self, entries: Dict[int, dict]) -> bool:
+        cutoff = datetime.utcnow() - self.max_age
+        return any(entry["generated_at"] < cutoff for entry in entries.values())
+
+    def _doc_id(self, orisha_id: str, content_type: str, variant: int) -> str:
+        return f"{self.version}:{orisha_id}:{content_type}:{variant}"
+
+    def _entry(self, orisha_id: str, orisha_name: str, content_type: str, content: str, variant: int) -> dict:
+        return {
+            "_id": self._doc_id(orisha_id, content_type, variant),
+            "version": self.version,
+            "orisha_id": orisha_id,
+            "orisha_name": orisha_name,
+            "content_type": content_type,
+            "variant": variant,
+            "content": content,
+            "generated_at": datetime.utcnow(),
+        }
+
+    def _adopt(self, doc: dict) -> dict:
+        self._cells.setdefault((doc["orisha_id"], doc["content_type"]), {})[doc["variant"]] = doc
+        return doc
+
+    async def _load_variant(self, orisha_id: str, content_type: str, variant: int) -> Optional[dict]:
+        """Read one variant from MongoDB into memory; ``None`` if absent or unreadable."""
+        try:
+            doc = await self._collection.find_one({"_id": self._doc_id(orisha_id, content_type, variant)})
+        except Exception as e:
+            logger.warning("Could not load cultural content %s/%s: %s", orisha_id, content_type, e)
+            return None
+        # A variant another worker has only claimed has no content yet
+        return self._adopt(doc) if doc is not None and "content" in doc else None
+
+    async def put(self, orisha_id: str, orisha_name: str, content_type: str, content: str, variant: int = 0) -> dict:
+        """Store content (e.g. from a stream) in an empty cell variant.
+
+        If another worker stored the variant first, its copy is kept and
+        returned so every worker serves the same content.
+        """
+        entry = self._entry(orisha_id, orisha_name, content_type, content, variant)
+        fields = {key: value for key, value in entry.items() if key != "_id"}
+        try:
+            stored = await self._collection.find_one_and_update(
+                {"_id": entry["_id"], "content": {"$exists": False}},
+                {"$set": fields, "$unset": {"claimed_until": ""}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            # The variant already has content, so the upsert collided on _id
+            stored = await self._load_variant(orisha_id, content_type, variant) or entry
+        except Exception as e:
+            logger.warning("Could not persist cultural content %s: %s", entry["_id"], e)
+            stored = entry
+        return self._adopt(stored)
+
+    async def _claim_empty(self, orisha_id: str, content_type: str, variant: int) -> bool:
+        """Claim generation of an empty variant; False if another worker holds or stored it."""
+        doc_id = self._doc_id(orisha_id, content_type, variant)
+        now = datetime.utcnow()
+        try:
+            result = await self._collection.update_one(
+                {
+                    "_id": doc_id,
+                    "content": {"$exists": False},
+                    "$or": [
+                        {"claimed_until": {"$exists": False}},
+                        {"claimed_until": {"$lt": now}},
+                    ],
+                },
+                {"$set": {"claimed_until": now + self.claim}},
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            # The variant exists with a live claim or content, so the upsert
+            # collided with it on _id
+            return False
+        except Exception as e:
+            # Without MongoDB there is nothing to coordinate on; generate here
+            logger.warning("Could not claim cultural content %s: %s", doc_id, e)
+            return True
+        return result.upserted_id is not None or result.modified_count == 1
+
+    async def _await_claimed(self, orisha_id: str, content_type: str, variant: int) -> Optional[dict]:
+        """Poll for the variant another worker is generating, while its claim lasts.
+
+        Returns ``None`` as soon as the claim is released or runs out without
+        stored content.
+        """
+        doc_id = self._doc_id(orisha_id, content_type, variant)
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                doc = await self._collection.find_one({"_id": doc_id})
+            except Exception as e:
+                logger.warning("Could not load cultural content %s: %s", doc_id, e)
+                return None
+            if doc is None:
+                return None
+            if "content" in doc:
+                return self._adopt(doc)
+            claimed_until = doc.get("claimed_until")
+            if claimed_until is None or claimed_until < datetime.utcnow():
+                logger.warning("Cultural content %s was claimed but not stored", doc_id)
+                return None
+
+    async def _release_empty(self, orisha_id: str, content_type: str, variant: int):
+        doc_id = self._doc_id(orisha_id, content_type, variant)
+        try:
+            await self._collection.delete_one({"_id": doc_id, "content": {"$exists": False}})
+        except Exception as e:
+            logger.warning("Could not release cultural content claim %s: %s", doc_id, e)
+
+    async def _claim_refresh(self, stored: dict) -> bool:
+        """Claim the refresh of a stale variant; False if another worker holds it."""
+        now = datetime.utcnow()
+        try:
+            result = await self._collection.update_one(
+                {
+                    "_id": stored["_id"],
+                    "generated_at": stored["generated_at"],
+                    "$or": [
+                        {"refresh_claimed_until": {"$exists": False}},
+                        {"refresh_claimed_until": {"$lt": now}},
+                    ],
+                },
+                {"$set": {"refresh_claimed_until": now + self.claim}},
+            )
+        except Exception as e:
+            logger.warning("Could not claim refresh of %s: %s", stored["_id"], e)
+            return False
+        return result.modified_count == 1
+
+    async def _replace_stale(self, stored: dict, content: str) -> dict:
+        """Replace ``stored`` only if it is still the version that was stale."""
+        entry = self._entry(
+            stored["orisha_id"], stored["orisha_name"], stored["content_type"], content, stored["variant"]
+        )
+        try:
+            result = await self._collection.replace_one(
+                {"_id": entry["_id"], "generated_at": stored["generated_at"]}, entry
+            )
+        except Exception as e:
+            logger.warning("Could not persist cultural content %s: %s", entry["_id"], e)
+            return self._adopt(entry)
+        if result.matched_count == 0:
+            # Someone else replaced it first; serve their copy
+            newer = await self._load_variant(stored["orisha_id"], stored["content_type"], stored["variant"])
+            if newer is not None:
+                return newer
+        return self._adopt(entry)
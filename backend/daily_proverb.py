@@ -0,0 +1,219 @@
+"""One proverb per UTC date, generated once and shared by every visitor.
+
+Proverbs are kept in memory, persisted in MongoDB so all workers agree on
+the same proverb for a given day, and generated ahead of time by a
+background job so the daily endpoint is normally a dictionary lookup.
+
+Concurrent requests for a date share one load-or-generate attempt, and a
+failed attempt is remembered for ``failure_ttl`` seconds so visitors get
+the fallback proverb at once instead of retrying Gemini one after another.
+Across workers, generation is claimed per date in MongoDB (the unique index
+on ``date`` makes the claim atomic); workers that lose the claim poll for the
+winner's proverb instead of generating their own.
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from pymongo.errors import DuplicateKeyError
+
+logger = logging.getLogger(__name__)
+
+ProverbGenerator = Callable[[str], Awaitable[Dict[str, str]]]
+
+
+def utc_date(offset_days: int = 0) -> str:
+    return (datetime.utcnow() + timedelta(days=offset_days)).strftime("%Y-%m-%d")
+
+
+class DailyProverbStore:
+    """Memory -> MongoDB -> single-flight generation lookup for daily proverbs."""
+
+    def __init__(
+        self,
+        collection,
+        generate: ProverbGenerator,
+        days_ahead: int = 7,
+        failure_ttl: float = 60,
+        claim_seconds: float = 120,
+        poll_interval: float = 0.5,
+    ):
+        self._collection = collection
+        self._generate = generate
+        self.days_ahead = days_ahead
+        self.failure_ttl = failure_ttl
+        # How long a worker may hold a date's generation before others take over
+        self.claim_seconds = claim_seconds
+        self.poll_interval = poll_interval
+        self._cache: Dict[str, Dict[str, str]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # date -> monotonic time before which a failed date is not retried
+        self._failed_until: Dict[str, float] = {}
+        self._indexed = False
+
+    async def ensure_indexes(self):
+        # Claims rely on this index: it turns a second claim into a DuplicateKeyError
+        try:
+            await self._collection.create_index("date", unique=True)
+            self._indexed = True
+        except Exception as e:
+            logger.warning("Could not create daily proverb index: %s", e)
+
+    async def get(self, date: str) -> Optional[Dict[str, str]]:
+        """Return the proverb for ``date``, generating it at most once.
+
+        ``None`` means the attempt failed; callers should fall back.
+        """
+        proverb = self._cache.get(date)
+        if proverb is not None:
+            return proverb
+        if self._failed_until.get(date, 0.0) > time.monotonic():
+            return None
+
+        task = self._inflight.get(date)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(date))
+            self._inflight[date] = task
+            task.add_done_callback(lambda done: self._finish(date, done))
+        # Shielded so one waiter disconnecting does not cancel the shared attempt
+        return await asyncio.shield(task)
+
+    async def _fetch(self, date: str) -> Optional[Dict[str, str]]:
+        proverb = await self._load(date)
+        if proverb is None:
+            proverb = await self._create(date)
+        if proverb is None:
+            self._failed_until[date] = time.monotonic() + self.failure_ttl
+        else:
+            self._cache[date] = proverb
+            self._failed_until.pop(date, None)
+        return proverb
+
+    def _finish(self, date: str, task: asyncio.Task):
+        self._inflight.pop(date, None)
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter went away
+            task.exception()
+
+    async def fill_ahead(self, days: Optional[int] = None):
+        """Make sure today and the next ``days`` dates have a proverb."""
+        days = self.days_ahead if days is None else days
+        self._prune()
+        for offset in range(days + 1):
+            await self.get(utc_date(offset))
+
+    async def run_prefill(self, interval_seconds: float):
+        """Background loop that keeps the calendar filled ahead of time."""
+        await self.ensure_indexes()
+        while True:
+            try:
+                await self.fill_ahead()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Daily proverb prefill failed: %s", e)
+            await asyncio.sleep(interval_seconds)
+
+    async def _load(self, date: str) -> Optional[Dict[str, str]]:
+        doc = await self._load_doc(date)
+        # A date another worker has only claimed has no proverb yet
+        return doc.get("proverb") if doc else None
+
+    async def _load_doc(self, date: str) -> Optional[Dict[str, Any]]:
+        try:
+            return await self._collection.find_one({"date": date})
+        except Exception as e:
+            logger.warning("Daily proverb lookup failed for %s: %s", date, e)
+            return None
+
+    async def _create(self, date: str) -> Optional[Dict[str, str]]:
+        if not self._indexed:
+            await self.ensure_indexes()
+        if not await self._claim(date):
+            return await self._await_claimed(date)
+        try:
+            proverb = await self._generate(date)
+        except Exception as e:
+            logger.warning("Daily proverb generation failed for %s: %s", date, e)
+            await self._release(date)
+            return None
+
+        try:
+            await self._collection.update_one(
+                {"date": date, "proverb": {"$exists": False}},
+                {
+                    "$set": {"proverb": proverb, "created_at": datetime.utcnow()},
+                    "$unset": {"claimed_until": ""},
+                },
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            # Our claim ran out and another worker stored its proverb first
+            return await self._load(date) or proverb
+        except Exception as e:
+            logger.warning("Could not persist daily proverb for %s: %s", date, e)
+        return proverb
+
+    async def _claim(self, date: str) -> bool:
+        """Claim generation of ``date``; False if another worker holds it or stored it."""
+        now = datetime.utcnow()
+        try:
+            result = await self._collection.update_one(
+                {
+                    "date": date,
+                    "proverb": {"$exists": False},
+                    "$or": [
+                        {"claimed_until": {"$exists": False}},
+                        {"claimed_until": {"$lt": now}},
+                    ],
+                },
+                {"$set": {"claimed_until": now + timedelta(seconds=self.claim_seconds)}},
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            # The date exists with a live claim or a proverb, so the upsert
+            # collided with it on the unique index
+            return False
+        except Exception as e:
+            # Without MongoDB there is nothing to coordinate on; generate here
+            logger.warning("Could not claim daily proverb for %s: %s", date, e)
+            return True
+        return result.upserted_id is not None or result.modified_count == 1
+
+    async def _await_claimed(self, date: str) -> Optional[Dict[str, str]]:
+        """Poll for the proverb another worker is generating, while its claim lasts.
+
+        Returns ``None`` as soon as the claim is released or runs out without
+        a stored proverb, so a failed generation elsewhere fails fast here too.
+        """
+        deadline = time.monotonic() + self.claim_seconds
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            doc = await self._load_doc(date)
+            if doc is None:
+                continue
+            if doc.get("proverb") is not None:
+                return doc["proverb"]
+            claimed_until = doc.get("claimed_until")
+            if claimed_until is None or claimed_until < datetime.utcnow():
+                logger.warning("Daily proverb for %s was claimed but not stored", date)
+                return None
+        logger.warning("Daily proverb for %s was claimed but never stored", date)
+        return None
+
+    async def _release(self, date: str):
+        try:
+            await self._collection.update_one(
+                {"date": date, "proverb": {"$exists": False}}, {"$unset": {"claimed_until": ""}}
+            )
+        except Exception as e:
+            logger.warning("Could not release daily proverb claim for %s: %s", date, e)
+
+    def _prune(self):
+        yesterday = utc_date(-1)
+        for date in [d for d in self._cache if d < yesterday]:
+            del self._cache[date]
+        for date in [d for d in self._failed_until if d < yesterday]:
+            del self._failed_until[date]
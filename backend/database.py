@@ -0,0 +1,74 @@
+"""Lazily connected MongoDB handle.
+
+Importing Motor and creating its client (which starts monitoring threads)
+is deferred until the lifespan handler calls ``connect`` or a collection is
+first used, so importing ``server`` stays cheap. Components are handed
+``LazyCollection`` objects up front and resolve the real Motor collection
+on every attribute access.
+"""
+from typing import Any, Sequence
+
+
+class LazyCollection:
+    """Stand-in for a Motor collection that connects on first use."""
+
+    __slots__ = ("_database", "_name")
+
+    def __init__(self, database: "Database", name: str):
+        self._database = database
+        self._name = name
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._database.db[self._name], attr)
+
+    def __repr__(self) -> str:
+        return f"LazyCollection({self._name!r})"
+
+
+class Database:
+    """Owns the Motor client; collections are reachable before it exists."""
+
+    def __init__(self, url: str, name: str, event_listeners: Sequence[Any] = ()):
+        self.url = url
+        self.name = name
+        self.event_listeners = list(event_listeners)
+        self.client = None
+        self._db = None
+
+    @property
+    def connected(self) -> bool:
+        return self._db is not None
+
+    def connect(self):
+        """Create the Motor client once; no I/O happens until the first query."""
+        if self._db is None:
+            from motor.motor_asyncio import AsyncIOMotorClient
+
+            self.client = AsyncIOMotorClient(self.url, event_listeners=self.event_listeners)
+            self._db = self.client[self.name]
+        return self._db
+
+    @property
+    def db(self):
+        return self.connect()
+
+    def __getitem__(self, name: str) -> LazyCollection:
+        return LazyCollection(self, name)
+
+    def __getattr__(self, name: str) -> LazyCollection:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return LazyCollection(self, name)
+
+    def watch(self, *args, **kwargs):
+        return self.db.watch(*args, **kwargs)
+
+    async def ping(self):
+        await self.db.command("ping")
+
+    def close(self):
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+            self._db = None
+
@@ -0,0 +1,58 @@
+"""Named Gemini generation profiles, one per kind of content.
+
+Each profile caps the output length (and with it the latency and token
+cost) and sets the sampling temperature for one use case. Defaults can be
+overridden per profile from the environment, e.g.::
+
+    LLM_PROFILE_STORY_MAX_OUTPUT_TOKENS=1024
+    LLM_PROFILE_TRANSLATION_TEMPERATURE=0.1
+"""
+import logging
+import os
+from dataclasses import dataclass, replace
+from typing import Dict, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE = "default"
+
+
+@dataclass(frozen=True)
+class GenerationProfile:
+    max_output_tokens: int
+    temperature: float
+
+    def generation_config(self) -> Dict[str, float]:
+        return {"max_output_tokens": self.max_output_tokens, "temperature": self.temperature}
+
+
+# Translations and proverbs are short and should be faithful; stories and
+# praise poetry need room and some creativity
+DEFAULT_PROFILES: Dict[str, GenerationProfile] = {
+    "translation": GenerationProfile(max_output_tokens=512, temperature=0.2),
+    "proverb": GenerationProfile(max_output_tokens=384, temperature=0.7),
+    "story": GenerationProfile(max_output_tokens=1536, temperature=0.9),
+    "praise": GenerationProfile(max_output_tokens=768, temperature=0.9),
+    "info": GenerationProfile(max_output_tokens=1024, temperature=0.4),
+    DEFAULT_PROFILE: GenerationProfile(max_output_tokens=1024, temperature=0.7),
+}
+
+
+def _override(name: str, profile: GenerationProfile, environ: Mapping[str, str]) -> GenerationProfile:
+    prefix = f"LLM_PROFILE_{name.upper()}_"
+    max_tokens = environ.get(prefix + "MAX_OUTPUT_TOKENS")
+    temperature = environ.get(prefix + "TEMPERATURE")
+    try:
+        if max_tokens is not None:
+            profile = replace(profile, max_output_tokens=int(max_tokens))
+        if temperature is not None:
+            profile = replace(profile, temperature=float(temperature))
+    except ValueError:
+        logger.warning("Ignoring invalid %s* settings for generation profile %r", prefix, name)
+    return profile
+
+
+def load_profiles(environ: Optional[Mapping[str, str]] = None) -> Dict[str, GenerationProfile]:
+    """The default profiles with any environment overrides applied."""
+    environ = os.environ if environ is None else environ
+    return {name: _override(name, profile, environ) for name, profile in DEFAULT_PROFILES.items()}
@@ -0,0 +1,148 @@
+"""Write-behind record of every Gemini output in MongoDB.
+
+``LLMGateway`` hands each successful generation to ``GenerationStore.record``,
+which only appends to an in-memory buffer, so persisting outputs adds no
+request latency. A background loop flushes the buffer with ``insert_many``
+every ``flush_interval`` seconds, or as soon as ``batch_size`` records are
+waiting, and ``close`` flushes whatever is left at shutdown. Records expire
+through a TTL index on ``created_at``.
+
+If MongoDB is unreachable the buffer keeps at most ``max_buffer`` records and
+drops the oldest, so an outage costs history rather than memory.
+"""
+import asyncio
+import hashlib
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import BulkWriteError
+
+logger = logging.getLogger(__name__)
+
+
+def prompt_hash(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+class GenerationStore:
+    """Buffers generation records and inserts them into ``collection`` in batches."""
+
+    def __init__(
+        self,
+        collection,
+        ttl: float = 30 * 24 * 3600,
+        batch_size: int = 100,
+        flush_interval: float = 5,
+        max_buffer: int = 10_000,
+    ):
+        self._collection = collection
+        self.ttl = ttl
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self.stats: Dict[str, int] = {"recorded": 0, "written": 0, "dropped": 0, "failed_flushes": 0}
+
+    async def ensure_indexes(self):
+        try:
+            await self._collection.create_index("created_at", expireAfterSeconds=int(self.ttl))
+            await self._collection.create_index([("prompt_hash", ASCENDING), ("created_at", DESCENDING)])
+            await self._collection.create_index([("kind", ASCENDING), ("created_at", DESCENDING)])
+        except Exception as e:
+            logger.warning("Could not create generation store indexes: %s", e)
+
+    def record(
+        self,
+        kind: str,
+        model: str,
+        prompt: str,
+        output: str,
+        latency: float,
+        priority: str,
+        streamed: bool = False,
+    ):
+        """Queue one generation for the next flush; never blocks or raises."""
+        self._buffer.append({
+            "kind": kind,
+            "model": model,
+            "prompt_hash": prompt_hash(prompt),
+            "prompt": prompt,
+            "output": output,
+            "latency_ms": round(latency * 1000, 1),
+            "priority": priority,
+            "streamed": streamed,
+            "created_at": datetime.utcnow(),
+        })
+        self.stats["recorded"] += 1
+        while len(self._buffer) > self.max_buffer:
+            self._buffer.popleft()
+            self.stats["dropped"] += 1
+        if len(self._buffer) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    async def run(self):
+        """Background loop flushing the buffer until cancelled."""
+        self._wakeup = asyncio.Event()
+        await self.ensure_indexes()
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self):
+        """Insert every buffered record, ``batch_size`` at a time."""
+        # Created lazily so it binds to the running event loop
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            while self._buffer:
+                batch: List[Dict[str, Any]] = []
+                while self._buffer and len(batch) < self.batch_size:
+                    batch.append(self._buffer.popleft())
+                try:
+                    await self._collection.insert_many(batch, ordered=False)
+                except asyncio.CancelledError:
+                    # Shutdown cancelled the loop mid-write; close() retries the
+                    # batch, and records already inserted fail as duplicates
+                    self._requeue(batch)
+                    raise
+                except BulkWriteError as e:
+                    # The server rejected some records; retrying will not help
+                    written = e.details.get("nInserted", 0)
+                    self.stats["written"] += written
+                    self.stats["dropped"] += len(batch) - written
+                    logger.warning("Rejected %d generation records: %s", len(batch) - written, e)
+                    continue
+                except Exception as e:
+                    self._requeue(batch)
+                    self.stats["failed_flushes"] += 1
+                    logger.warning("Could not write %d generation records: %s", len(batch), e)
+                    return
+                self.stats["written"] += len(batch)
+
+    def _requeue(self, batch: List[Dict[str, Any]]):
+        # Put the batch back for the next attempt; the buffer cap still
+        # applies if MongoDB stays down
+        self._buffer.extendleft(reversed(batch))
+        while len(self._buffer) > self.max_buffer:
+            self._buffer.popleft()
+            self.stats["dropped"] += 1
+
+    async def close(self):
+        """Flush what is still buffered; called before the database closes."""
+        await self.flush()
+        if self._buffer:
+            logger.warning("Discarding %d unwritten generation records at shutdown", len(self._buffer))
+            self.stats["dropped"] += len(self._buffer)
+            self._buffer.clear()
+
+    def snapshot(self) -> Dict[str, int]:
+        return {**self.stats, "buffered": len(self._buffer)}
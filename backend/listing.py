@@ -0,0 +1,98 @@
+"""Field projection, multi-get and cursor pagination over catalog lists.
+
+A ``Listing`` holds one ordered catalog list (Òrìṣà, folktales, proverb
+categories) as built from the corpus snapshot. ``select`` returns only the
+requested entries and fields, so callers that render a few summary fields
+do not pay for serializing every full story.
+"""
+import base64
+import binascii
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+ID_FIELD = "id"
+
+
+class ListingError(ValueError):
+    """Raised for an unknown field or a cursor that does not belong to the list."""
+
+
+def encode_cursor(entry_id: str) -> str:
+    return base64.urlsafe_b64encode(entry_id.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ListingError("Invalid cursor") from e
+
+
+def split_param(value: Optional[str]) -> Optional[List[str]]:
+    """Parse a comma-separated query parameter; ``None`` when absent."""
+    if value is None:
+        return None
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+class Listing:
+    """One ordered catalog list; entries are dicts that each carry an ``id``."""
+
+    def __init__(self, entries: Sequence[Dict[str, Any]], default_fields: Optional[Sequence[str]] = None):
+        self.entries = list(entries)
+        self._positions = {entry[ID_FIELD]: index for index, entry in enumerate(self.entries)}
+        available = {ID_FIELD}
+        for entry in self.entries:
+            available.update(entry)
+        self.available_fields = frozenset(available)
+        self.default_fields = tuple(default_fields) if default_fields else None
+
+    def fields(self, requested: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+        """Validated projection; ``None`` means every field of the default shape."""
+        if not requested:
+            return self.default_fields
+        unknown = sorted(set(requested) - self.available_fields)
+        if unknown:
+            raise ListingError(
+                f"Unknown field(s): {', '.join(unknown)}. "
+                f"Available: {', '.join(sorted(self.available_fields))}"
+            )
+        # The id is always returned so clients can fetch the full entry
+        return (ID_FIELD,) + tuple(dict.fromkeys(f for f in requested if f != ID_FIELD))
+
+    def select(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        ids: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], int, Optional[str]]:
+        """Return ``(page, total, next_cursor)``.
+
+        ``ids`` restricts the list to those entries, in the order given
+        (unknown ids are skipped). ``cursor`` continues after the entry a
+        previous page ended on; ``next_cursor`` is ``None`` on the last page.
+        """
+        projection = self.fields(fields)
+        if ids is not None:
+            candidates = [self.entries[self._positions[i]] for i in dict.fromkeys(ids) if i in self._positions]
+        else:
+            candidates = self.entries
+
+        start = 0
+        if cursor:
+            after = decode_cursor(cursor)
+            if ids is None:
+                position = self._positions.get(after)
+            else:
+                position = next((i for i, entry in enumerate(candidates) if entry[ID_FIELD] == after), None)
+            if position is None:
+                raise ListingError("Invalid cursor")
+            start = position + 1
+
+        end = len(candidates) if limit is None else min(len(candidates), start + limit)
+        page = candidates[start:end]
+        next_cursor = encode_cursor(page[-1][ID_FIELD]) if page and end < len(candidates) else None
+        if projection is not None:
+            page = [{f: entry[f] for f in projection if f in entry} for entry in page]
+        return page, len(candidates), next_cursor
@@ -0,0 +1,322 @@
+"""Shared async gateway for all Gemini generation calls.
+
+Every generative route goes through a single ``LLMGateway`` so that slow
+upstream calls never block the event loop and the number of concurrent
+Gemini requests stays bounded. Identical prompts that are already in flight
+are coalesced so one upstream call serves every waiter. Each kind of
+content gets a long-lived model configured with its generation profile.
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from circuit_breaker import CircuitBreaker, CircuitOpenError
+from generation_profiles import DEFAULT_PROFILE, GenerationProfile, load_profiles
+from metrics import LLM_CALL_DURATION, LLM_CALLS_IN_FLIGHT, LLM_ERRORS
+from quota_scheduler import QueueFullError, QueueTimeoutError, QuotaScheduler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = 'gemini-1.5-flash'
+
+
+class LLMError(Exception):
+    """Raised when the upstream model fails to produce a response."""
+
+
+class LLMTimeoutError(LLMError):
+    """Raised when a generation call exceeds its timeout."""
+
+
+class LLMUnavailableError(LLMError):
+    """Raised without calling upstream while the circuit breaker is open."""
+
+
+class LLMOverloadedError(LLMUnavailableError):
+    """Raised without queueing when too many calls already wait for quota."""
+
+
+class LLMGateway:
+    """Bounded, timeout-aware async access to a Gemini model."""
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        api_key: Optional[str] = None,
+        profiles: Optional[Dict[str, GenerationProfile]] = None,
+        model_factory: Optional[Callable[[str, GenerationProfile], Any]] = None,
+        generation_store=None,
+    ):
+        self.model_name = model_name
+        self.api_key = api_key or os.environ.get('GEMINI_API_KEY')
+        self.max_concurrency = max_concurrency or int(os.environ.get('LLM_MAX_CONCURRENCY', '8'))
+        self.timeout = timeout or float(os.environ.get('LLM_TIMEOUT_SECONDS', '30'))
+        self.breaker = breaker or CircuitBreaker(
+            window_seconds=float(os.environ.get('LLM_BREAKER_WINDOW_SECONDS', '60')),
+            min_calls=int(os.environ.get('LLM_BREAKER_MIN_CALLS', '10')),
+            error_rate_threshold=float(os.environ.get('LLM_BREAKER_ERROR_RATE', '0.5')),
+            slow_call_seconds=float(os.environ.get('LLM_BREAKER_SLOW_CALL_SECONDS', '10')),
+            slow_rate_threshold=float(os.environ.get('LLM_BREAKER_SLOW_RATE', '0.8')),
+            cooldown_seconds=float(os.environ.get('LLM_BREAKER_COOLDOWN_SECONDS', '30')),
+        )
+        # The quota is per account but each worker process schedules on its
+        # own, so every worker gets an equal share of it
+        workers = max(1, int(os.environ.get('WEB_CONCURRENCY', '1')))
+        self.requests_per_minute = float(os.environ.get('LLM_REQUESTS_PER_MINUTE', '60')) / workers
+        self.tokens_per_minute = float(os.environ.get('LLM_TOKENS_PER_MINUTE', '1000000')) / workers
+        self.max_queue_depth = int(os.environ.get('LLM_MAX_QUEUE_DEPTH', '64'))
+        self.expected_output_tokens = int(os.environ.get('LLM_EXPECTED_OUTPUT_TOKENS', '512'))
+        self.profiles = profiles or load_profiles()
+        # (kind, profile) -> model; tests and benchmarks can swap the factory
+        self.model_factory = model_factory or self._create_model
+        self._models: Dict[str, Any] = {}
+        # Optional GenerationStore that records every successful output
+        self.generation_store = generation_store
+        self._configured = False
+        self._preparing: Optional[asyncio.Future] = None
+        self._scheduler: Optional[QuotaScheduler] = None
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.stats: Dict[str, int] = {"calls": 0, "coalesced_calls": 0}
+
+    def profile(self, kind: str) -> GenerationProfile:
+        return self.profiles.get(kind) or self.profiles[DEFAULT_PROFILE]
+
+    def model(self, kind: str = DEFAULT_PROFILE):
+        """The long-lived model for ``kind``, created on first use.
+
+        Creating the first model imports the client, so on the event loop
+        await ``prepare()`` first.
+        """
+        if kind not in self.profiles:
+            kind = DEFAULT_PROFILE
+        model = self._models.get(kind)
+        if model is None:
+            model = self._models[kind] = self.model_factory(self.model_name, self.profiles[kind])
+        return model
+
+    @property
+    def ready(self) -> bool:
+        """True once the Gemini client has been imported and configured."""
+        return bool(self._models)
+
+    def _create_model(self, model_name: str, profile: GenerationProfile):
+        # google.generativeai takes a large share of server import time, so
+        # it is only imported when a model is first needed
+        import google.generativeai as genai
+
+        if not self._configured:
+            genai.configure(api_key=self.api_key)
+            self._configured = True
+        return genai.GenerativeModel(model_name, generation_config=profile.generation_config())
+
+    async def prepare(self):
+        """Create every profile's model off the event loop.
+
+        Run by the lifespan warm-up and awaited by the first generation, so
+        importing and configuring the client never blocks the loop; callers
+        arriving meanwhile share the same attempt, and a failed one is
+        retried by the next caller.
+        """
+        if len(self._models) >= len(self.profiles):
+            return
+        if self._preparing is None or self._preparing.done():
+            self._preparing = asyncio.ensure_future(
+                asyncio.to_thread(lambda: [self.model(kind) for kind in self.profiles])
+            )
+        await asyncio.shield(self._preparing)
+
+    async def _prepared_model(self, kind: str):
+        if kind not in self.profiles:
+            kind = DEFAULT_PROFILE
+        if kind not in self._models:
+            try:
+                await self.prepare()
+            except Exception as e:
+                LLM_ERRORS.inc(kind, "ModelInit")
+                raise LLMError(f"Could not initialize the model: {e}") from e
+        return self._models[kind]
+
+    @property
+    def scheduler(self) -> QuotaScheduler:
+        # Created lazily so its timers bind to the running event loop
+        if self._scheduler is None:
+            self._scheduler = QuotaScheduler(
+                self.max_concurrency, self.requests_per_minute, self.tokens_per_minute, self.max_queue_depth
+            )
+        return self._scheduler
+
+    def estimate_tokens(self, prompt: str, kind: str = DEFAULT_PROFILE) -> int:
+        """Rough prompt + completion ticket count used for the TPM budget."""
+        expected = min(self.expected_output_tokens, self.profile(kind).max_output_tokens)
+        return len(prompt) // 4 + expected
+
+    async def generate(
+        self, prompt: str, timeout: Optional[float] = None, priority: str = "interactive", kind: str = DEFAULT_PROFILE
+    ) -> str:
+        """Generate text for ``prompt`` without blocking the event loop.
+
+        Callers asking for a prompt that is already being generated wait for
+        that call instead of starting their own. ``priority`` is the quota
+        class (see ``quota_scheduler.PRIORITIES``) used to queue the call and
+        ``kind`` (translation, proverb, story, ...) picks the generation
+        profile and labels the call's metrics. ``timeout`` covers the wait
+        for a quota slot as well as the call itself.
+        """
+        key = hashlib.sha256(f"{kind}\0{prompt}".encode("utf-8")).hexdigest()
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats["coalesced_calls"] += 1
+        else:
+            self.stats["calls"] += 1
+            task = asyncio.ensure_future(self._generate(prompt, timeout, priority, kind))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        # Shielded so one waiter disconnecting does not cancel the shared call
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task):
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter went away
+            task.exception()
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            **self.stats,
+            "in_flight": len(self._inflight),
+            "profiles": {kind: profile.generation_config() for kind, profile in self.profiles.items()},
+            "circuit": self.breaker.snapshot(),
+            "queues": self.scheduler.snapshot(),
+        }
+
+    async def _generate(self, prompt: str, timeout: Optional[float], priority: str, kind: str) -> str:
+        timeout = timeout or self.timeout
+        model = await self._prepared_model(kind)
+        ticket = self._admit(kind)
+        started = time.monotonic()
+        deadline = started + timeout
+        try:
+            async with self.scheduler.slot(priority, self.estimate_tokens(prompt, kind), timeout=timeout):
+                started = time.monotonic()
+                LLM_CALLS_IN_FLIGHT.inc(kind)
+                try:
+                    response = await asyncio.wait_for(
+                        model.generate_content_async(prompt), timeout=deadline - started
+                    )
+                    text = response.text
+                finally:
+                    LLM_CALLS_IN_FLIGHT.dec(kind)
+        except QueueFullError as e:
+            raise self._overloaded(kind, ticket, e) from e
+        except QueueTimeoutError as e:
+            raise self._queue_timeout(kind, ticket, timeout, e) from e
+        except asyncio.CancelledError:
+            self.breaker.cancelled(ticket)
+            raise
+        except asyncio.TimeoutError as e:
+            self._record(kind, ticket, started, e)
+            logger.warning("Gemini call timed out after %.1fs", timeout)
+            raise LLMTimeoutError(f"Generation timed out after {timeout:g}s") from e
+        except Exception as e:
+            self._record(kind, ticket, started, e)
+            raise LLMError(str(e)) from e
+        self._record(kind, ticket, started)
+        text = text.strip()
+        self._store(kind, prompt, text, started, priority)
+        return text
+
+    async def stream(
+        self, prompt: str, timeout: Optional[float] = None, priority: str = "interactive", kind: str = DEFAULT_PROFILE
+    ) -> AsyncIterator[str]:
+        """Yield generated text chunks as the model produces them.
+
+        ``timeout`` bounds the wait for a quota slot plus the first response,
+        then the wait for each further chunk, so a long but steadily
+        streaming response is not cut off.
+        """
+        timeout = timeout or self.timeout
+        model = await self._prepared_model(kind)
+        ticket = self._admit(kind)
+        started = time.monotonic()
+        deadline = started + timeout
+        try:
+            async with self.scheduler.slot(priority, self.estimate_tokens(prompt, kind), timeout=timeout):
+                started = time.monotonic()
+                LLM_CALLS_IN_FLIGHT.inc(kind)
+                try:
+                    response = await asyncio.wait_for(
+                        model.generate_content_async(prompt, stream=True), timeout=deadline - started
+                    )
+                    chunks = response.__aiter__()
+                    parts = []
+                    while True:
+                        try:
+                            chunk = await asyncio.wait_for(chunks.__anext__(), timeout=timeout)
+                        except StopAsyncIteration:
+                            break
+                        text = chunk.text
+                        if text:
+                            parts.append(text)
+                            yield text
+                finally:
+                    LLM_CALLS_IN_FLIGHT.dec(kind)
+        except QueueFullError as e:
+            raise self._overloaded(kind, ticket, e) from e
+        except QueueTimeoutError as e:
+            raise self._queue_timeout(kind, ticket, timeout, e) from e
+        except (asyncio.CancelledError, GeneratorExit):
+            self.breaker.cancelled(ticket)
+            raise
+        except asyncio.TimeoutError as e:
+            self._record(kind, ticket, started, e)
+            logger.warning("Gemini stream stalled for %.1fs", timeout)
+            raise LLMTimeoutError(f"Generation timed out after {timeout:g}s") from e
+        except Exception as e:
+            self._record(kind, ticket, started, e)
+            raise LLMError(str(e)) from e
+        self._record(kind, ticket, started)
+        self._store(kind, prompt, "".join(parts).strip(), started, priority, streamed=True)
+
+    def _store(self, kind: str, prompt: str, output: str, started: float, priority: str, streamed: bool = False):
+        if self.generation_store is not None:
+            self.generation_store.record(
+                kind, self.model_name, prompt, output, time.monotonic() - started, priority, streamed=streamed
+            )
+
+    def _record(self, kind: str, ticket: int, started: float, error: Optional[BaseException] = None):
+        """Feed a finished upstream call to the circuit breaker and metrics."""
+        latency = time.monotonic() - started
+        self.breaker.record(ticket, error is None, latency)
+        if error is None:
+            LLM_CALL_DURATION.observe(kind, "ok", value=latency)
+            return
+        outcome = "timeout" if isinstance(error, asyncio.TimeoutError) else "error"
+        LLM_CALL_DURATION.observe(kind, outcome, value=latency)
+        LLM_ERRORS.inc(kind, type(error).__name__)
+
+    def _overloaded(self, kind: str, ticket: int, error: QueueFullError) -> LLMOverloadedError:
+        # Rejected before reaching upstream: the breaker only hands back a
+        # half-open probe slot taken in _admit, it does not count the call
+        self.breaker.cancelled(ticket)
+        LLM_ERRORS.inc(kind, "QueueFull")
+        return LLMOverloadedError(str(error))
+
+    def _queue_timeout(self, kind: str, ticket: int, timeout: float, error: QueueTimeoutError) -> LLMTimeoutError:
+        # Timed out waiting for quota, not upstream; same breaker handling
+        self.breaker.cancelled(ticket)
+        LLM_ERRORS.inc(kind, "QueueTimeout")
+        logger.warning("Gemini call got no quota slot within %.1fs", timeout)
+        return LLMTimeoutError(f"Generation timed out after {timeout:g}s waiting for quota")
+
+    def _admit(self, kind: str) -> int:
+        try:
+            return self.breaker.before_call()
+        except CircuitOpenError as e:
+            LLM_ERRORS.inc(kind, "CircuitOpen")
+            raise LLMUnavailableError(str(e)) from e
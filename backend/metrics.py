@@ -0,0 +1,213 @@
+"""Minimal Prometheus-style metrics with text exposition.
+
+Counters, gauges and histograms keyed by label values, a registry that
+renders the text format served at ``/metrics``, an ASGI middleware that
+times every request by route template, and a pymongo command listener for
+MongoDB operation timings. Everything is in-process and lock-protected
+(pymongo listeners fire on Motor's worker threads), so it is cheap enough
+to leave on in production.
+"""
+import bisect
+import threading
+import time
+from typing import Dict, List, Sequence, Tuple
+
+from pymongo import monitoring
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {value}" for labels, value in items]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0):
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels: str, value: float):
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (+Inf last), sum, count]
+        self._values: Dict[LabelValues, list] = {}
+
+    def observe(self, *labels: str, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(labels)
+            if series is None:
+                series = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = [(labels, list(series[0]), series[1], series[2]) for labels, series in self._values.items()]
+        lines = []
+        for labels, counts, total, count in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                bucket_labels = _format_labels(self.labelnames, labels, f'le="{le}"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "itan_http_request_duration_seconds", "HTTP request latency by route template.", ("method", "route", "status")
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    "itan_http_requests_in_flight", "HTTP requests currently being served.", ("method",)
+)
+LLM_CALL_DURATION = REGISTRY.histogram(
+    "itan_llm_call_duration_seconds", "Upstream Gemini call latency by content type.", ("kind", "outcome")
+)
+LLM_CALLS_IN_FLIGHT = REGISTRY.gauge(
+    "itan_llm_calls_in_flight", "Gemini calls currently running upstream by content type.", ("kind",)
+)
+LLM_ERRORS = REGISTRY.counter(
+    "itan_llm_errors_total", "Failed Gemini calls by content type and error.", ("kind", "error")
+)
+LLM_QUEUE_WAIT = REGISTRY.histogram(
+    "itan_llm_queue_wait_seconds", "Time spent waiting for Gemini quota by priority class.", ("priority",)
+)
+MONGO_OPERATION_DURATION = REGISTRY.histogram(
+    "itan_mongo_operation_duration_seconds", "MongoDB command latency.", ("command", "outcome"),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording per-route latency and in-flight requests."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = ["500"]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = str(message["status"])
+            await send(message)
+
+        started = time.perf_counter()
+        HTTP_REQUESTS_IN_FLIGHT.inc(method)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec(method)
+            # FastAPI records the matched route in the scope during routing
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "unmatched"
+            HTTP_REQUEST_DURATION.observe(method, template, status[0], value=time.perf_counter() - started)
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """pymongo listener timing every command sent by the Motor client."""
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        MONGO_OPERATION_DURATION.observe(event.command_name, "ok", value=event.duration_micros / 1e6)
+
+    def failed(self, event):
+        MONGO_OPERATION_DURATION.observe(event.command_name, "error", value=event.duration_micros / 1e6)
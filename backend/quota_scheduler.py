@@ -0,0 +1,202 @@
+"""Priority-aware admission control for the shared Gemini quota.
+
+Every upstream call asks the ``QuotaScheduler`` for a slot. A slot is granted
+only when a concurrency slot is free and the requests-per-minute and
+tokens-per-minute token buckets have room; waiting calls are admitted
+strictly by priority class (then arrival order), so bulk generation can
+never starve interactive translation.
+
+The queue is bounded: once ``max_queue_depth`` calls are waiting, new calls
+fail at once with ``QueueFullError`` instead of queueing behind minutes of
+backlog, and ``slot(timeout=...)`` gives up on a call still waiting when its
+deadline passes with ``QueueTimeoutError``.
+
+Budgets are per process. Each uvicorn worker has its own scheduler, so with
+N workers the budgets given here must be 1/N of the account quota (the
+gateway divides by ``WEB_CONCURRENCY`` for this reason).
+"""
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+from metrics import LLM_QUEUE_WAIT
+
+# Lower number = served first
+PRIORITIES = {
+    "interactive": 0,
+    "daily": 1,
+    "bulk": 2,
+}
+
+
+class QueueFullError(Exception):
+    """Raised when a call arrives while ``max_queue_depth`` calls are waiting."""
+
+
+class QueueTimeoutError(asyncio.TimeoutError):
+    """Raised when a call's ``slot(timeout=...)`` passes before it is admitted."""
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at ``per_minute / 60``."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` tokens are available (0 if now)."""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float):
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+
+class _Waiter:
+    __slots__ = ("priority", "tokens", "future", "enqueued_at")
+
+    def __init__(self, priority: str, tokens: int, future: asyncio.Future):
+        self.priority = priority
+        self.tokens = tokens
+        self.future = future
+        self.enqueued_at = time.monotonic()
+
+
+class QuotaScheduler:
+    """Concurrency limit plus RPM/TPM budgets with priority queueing."""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        max_queue_depth: Optional[int] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_queue_depth = max_queue_depth
+        self.requests = TokenBucket(requests_per_minute)
+        self.token_budget = TokenBucket(tokens_per_minute)
+        self._active = 0
+        self._waiting = 0
+        self._queue: List[tuple] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.stats: Dict[str, Dict[str, float]] = {
+            name: {
+                "admitted": 0, "rejected": 0, "timed_out": 0, "wait_seconds_total": 0.0, "wait_seconds_max": 0.0,
+            }
+            for name in PRIORITIES
+        }
+
+    @asynccontextmanager
+    async def slot(self, priority: str = "interactive", tokens: int = 0, timeout: Optional[float] = None):
+        """Hold one upstream slot for the duration of the ``async with``.
+
+        Raises ``QueueTimeoutError`` (an ``asyncio.TimeoutError``) if no slot
+        is granted within ``timeout``.
+        """
+        if timeout is None:
+            await self.acquire(priority, tokens)
+        else:
+            try:
+                await asyncio.wait_for(self.acquire(priority, tokens), timeout=timeout)
+            except asyncio.TimeoutError as e:
+                self.stats[priority]["timed_out"] += 1
+                raise QueueTimeoutError(f"No LLM quota slot within {timeout:g}s") from e
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, priority: str = "interactive", tokens: int = 0):
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority class: {priority}")
+        if self.max_queue_depth is not None and self._waiting >= self.max_queue_depth:
+            self.stats[priority]["rejected"] += 1
+            raise QueueFullError(f"{self._waiting} calls already waiting for the LLM quota")
+        waiter = _Waiter(priority, tokens, asyncio.get_running_loop().create_future())
+        self._waiting += 1
+        heapq.heappush(self._queue, (PRIORITIES[priority], next(self._sequence), waiter))
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted just as we were cancelled; hand the slot back
+                self.release()
+            else:
+                waiter.future.cancel()
+                self._waiting -= 1
+            raise
+
+    def release(self):
+        self._active -= 1
+        self._dispatch()
+
+    def queued(self) -> Dict[str, int]:
+        counts = {name: 0 for name in PRIORITIES}
+        for _, _, waiter in self._queue:
+            if not waiter.future.done():
+                counts[waiter.priority] += 1
+        return counts
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        queued = self.queued()
+        report = {}
+        for name, stats in self.stats.items():
+            admitted = stats["admitted"]
+            report[name] = {
+                **stats,
+                "wait_seconds_avg": stats["wait_seconds_total"] / admitted if admitted else 0.0,
+                "queued": queued[name],
+            }
+        return report
+
+    def _dispatch(self):
+        while self._queue:
+            _, _, waiter = self._queue[0]
+            if waiter.future.done():
+                heapq.heappop(self._queue)
+                continue
+            if self._active >= self.max_concurrency:
+                return
+            delay = max(self.requests.wait_time(1), self.token_budget.wait_time(waiter.tokens))
+            if delay > 0:
+                self._schedule(delay)
+                return
+
+            heapq.heappop(self._queue)
+            self._waiting -= 1
+            self.requests.consume(1)
+            self.token_budget.consume(waiter.tokens)
+            self._active += 1
+            self._record_wait(waiter)
+            waiter.future.set_result(None)
+
+    def _schedule(self, delay: float):
+        if self._timer is not None and not self._timer.cancelled():
+            self._timer.cancel()
+        self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+    def _record_wait(self, waiter: _Waiter):
+        waited = time.monotonic() - waiter.enqueued_at
+        stats = self.stats[waiter.priority]
+        stats["admitted"] += 1
+        stats["wait_seconds_total"] += waited
+        stats["wait_seconds_max"] = max(stats["wait_seconds_max"], waited)
+        LLM_QUEUE_WAIT.observe(waiter.priority, value=waited)
@@ -0,0 +1,134 @@
+""""See also" recommendations from a sparse TF-IDF matrix over the whole corpus.
+
+Every Òrìṣà, proverb and folktale (see ``corpus_search.corpus_documents``)
+becomes an L2-normalized TF-IDF row using the same field weights as search.
+Cosine similarity is then a sparse matrix product, so the work grows with
+the number of entries that share words rather than with entries × vocabulary.
+The top ``k`` neighbours of every entry, overall and per type, are computed
+once per corpus load in row blocks so memory stays bounded, and requests only
+read the precomputed lists. Building is CPU-bound; callers on the event loop
+should run it in a thread. numpy and scipy are imported by the first build
+rather than with this module, so they stay off the server's import path.
+"""
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+    from scipy import sparse
+
+from corpus_search import DOC_TYPES, FIELD_WEIGHTS, field_text
+from search import tokenize
+
+# Frequent English words that would otherwise make every entry look alike
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has he his in is it its of on or that the their they "
+    "this to was were when which who with will one all not but".split()
+)
+BLOCK_ROWS = 256
+
+Neighbours = List[Tuple[int, float]]
+
+
+class RelatedIndex:
+    """Precomputed top-``k`` cosine neighbours for every corpus entry."""
+
+    def __init__(self, docs: Sequence[Dict[str, Any]], top_k: int = 20):
+        self._docs = list(docs)
+        self.top_k = top_k
+        self._positions = {(doc["type"], doc["id"]): row for row, doc in enumerate(self._docs)}
+        # row -> doc type -> best neighbours of that type, highest score first
+        self._neighbours: List[Dict[str, Neighbours]] = [{} for _ in self._docs]
+        if len(self._docs) > 1:
+            self._compute(self._matrix())
+
+    def _matrix(self) -> "sparse.csr_matrix":
+        import numpy as np
+        from scipy import sparse
+
+        vocabulary: Dict[str, int] = {}
+        rows, columns, values = [], [], []
+        for row, doc in enumerate(self._docs):
+            weighted: Counter = Counter()
+            for field, weight in FIELD_WEIGHTS[doc["type"]].items():
+                for token in tokenize(field_text(doc["fields"].get(field))):
+                    if token not in STOPWORDS and len(token) > 1:
+                        weighted[token] += weight
+            for token, tf in weighted.items():
+                rows.append(row)
+                columns.append(vocabulary.setdefault(token, len(vocabulary)))
+                values.append(1.0 + np.log(tf))
+
+        matrix = sparse.csr_matrix(
+            (np.array(values, dtype=np.float32), (rows, columns)),
+            shape=(len(self._docs), len(vocabulary)),
+        )
+        document_frequency = np.bincount(matrix.indices, minlength=len(vocabulary))
+        idf = np.log((1 + len(self._docs)) / (1 + document_frequency)) + 1.0
+        matrix = matrix.multiply(idf.astype(np.float32)).tocsr()
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        matrix = sparse.diags(1.0 / np.where(norms == 0, 1.0, norms)).astype(np.float32) @ matrix
+        return matrix.tocsr()
+
+    def _compute(self, matrix: "sparse.csr_matrix"):
+        import numpy as np
+
+        types = np.array([DOC_TYPES.index(doc["type"]) for doc in self._docs])
+        transposed = matrix.T.tocsc()
+        for start in range(0, len(self._docs), BLOCK_ROWS):
+            block = (matrix[start:start + BLOCK_ROWS] @ transposed).tocsr()
+            for offset in range(block.shape[0]):
+                row = start + offset
+                lo, hi = block.indptr[offset], block.indptr[offset + 1]
+                columns, scores = block.indices[lo:hi], block.data[lo:hi]
+                # An entry is not related to itself
+                keep = (columns != row) & (scores > 0)
+                columns, scores = columns[keep], scores[keep]
+                self._neighbours[row] = {
+                    DOC_TYPES[type_index]: self._top(columns[mask], scores[mask])
+                    for type_index in range(len(DOC_TYPES))
+                    if (mask := types[columns] == type_index).any()
+                }
+
+    def _top(self, columns: "np.ndarray", scores: "np.ndarray") -> Neighbours:
+        import numpy as np
+
+        if len(scores) > self.top_k:
+            best = np.argpartition(-scores, self.top_k - 1)[:self.top_k]
+            columns, scores = columns[best], scores[best]
+        order = np.lexsort((columns, -scores))
+        return [(int(columns[i]), float(scores[i])) for i in order]
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._positions
+
+    def related(
+        self, doc_type: str, doc_id: str, limit: int = 5, types: Optional[Sequence[str]] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Most similar entries to ``(doc_type, doc_id)``; ``None`` if it does not exist.
+
+        ``types`` filters before truncating to ``limit``, so every requested
+        type contributes up to ``top_k`` candidates.
+        """
+        row = self._positions.get((doc_type, doc_id))
+        if row is None:
+            return None
+        neighbours = self._neighbours[row]
+        candidates = [
+            neighbour
+            for neighbour_type, best in neighbours.items()
+            if not types or neighbour_type in types
+            for neighbour in best
+        ]
+        candidates.sort(key=lambda item: (-item[1], item[0]))
+        results = []
+        for column, score in candidates[:limit]:
+            doc = self._docs[column]
+            results.append({
+                "type": doc["type"],
+                "id": doc["id"],
+                "title": doc["title"],
+                "subtitle": doc["subtitle"],
+                "score": round(score, 4),
+            })
+        return results
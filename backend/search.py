@@ -0,0 +1,292 @@
+"""Diacritic-insensitive, typo-tolerant inverted indexes over the corpus.
+
+Yoruba tone marks and underdots are folded away (NFD, combining marks
+stripped) before tokenizing, so "ogbon" matches "Ọgbọ́n". Query tokens match
+indexed tokens exactly or by prefix; lookups ``bisect`` into a sorted
+vocabulary and read at most ``PREFIX_MAX_EXPANSIONS`` words after it, so
+latency depends on the number of matches, not corpus size.
+
+With ``fuzzy=True`` query tokens also match vocabulary words within a small
+edit distance ("ogbn", "wisdon"). Candidates come from a trigram index over
+the vocabulary (not the documents), bucketed by word length so only words
+that could be close enough are counted, and are verified with a bit-parallel
+edit distance. The cost grows with the number of distinct words, which
+flattens out long before the corpus does.
+"""
+import bisect
+import heapq
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Tuple
+
+TOKEN_RE = re.compile(r"\w+")
+
+# Relative weight of a match in each proverb field
+FIELD_WEIGHTS = {
+    "yoruba": 3.0,
+    "literal": 2.0,
+    "meaning": 1.5,
+    "context": 1.0,
+}
+FOLKTALE_FIELD_WEIGHTS = {
+    "title": 3.0,
+    "title_yoruba": 3.0,
+    "characters": 2.0,
+    "summary": 1.0,
+}
+PREFIX_MATCH_FACTOR = 0.5
+# Prefix matching needs a token this long and stops after this many words
+PREFIX_MIN_LENGTH = 2
+PREFIX_MAX_EXPANSIONS = 50
+# A fuzzy match with one edit in a five-letter word scores 0.4 * 0.8
+FUZZY_MATCH_FACTOR = 0.4
+# Upper bound on vocabulary words verified per query token
+FUZZY_MAX_CANDIDATES = 256
+
+
+def fold(text: str) -> str:
+    """Lower-case ``text`` and strip tone marks and other combining marks."""
+    decomposed = unicodedata.normalize("NFD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(fold(text))
+
+
+def max_edits(token: str) -> int:
+    """Typos tolerated for a query token; short words must match exactly."""
+    if len(token) < 3:
+        return 0
+    return 1 if len(token) < 6 else 2
+
+
+def trigrams(word: str) -> List[str]:
+    padded = f"$${word}$"
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def char_masks(word: str) -> Dict[str, int]:
+    """Bit ``i`` of ``masks[c]`` is set where ``word[i] == c``."""
+    masks: Dict[str, int] = {}
+    for i, char in enumerate(word):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def osa_distance(masks: Dict[str, int], length: int, text: str) -> int:
+    """Optimal string alignment distance from the word behind ``char_masks``
+    to ``text``, with one DP column per step held in machine words (Hyyrö's
+    bit-vector algorithm), so a whole column costs a few integer operations."""
+    if not length:
+        return len(text)
+    full = (1 << length) - 1
+    last = 1 << (length - 1)
+    vp, vn, d0, previous = full, 0, 0, 0
+    distance = length
+    for char in text:
+        match = masks.get(char, 0)
+        transposed = (((~d0) & match) << 1) & previous
+        d0 = ((((match & vp) + vp) ^ vp) | match | vn | transposed) & full
+        hp = (vn | ~(d0 | vp)) & full
+        hn = d0 & vp
+        if hp & last:
+            distance += 1
+        elif hn & last:
+            distance -= 1
+        hp = ((hp << 1) | 1) & full
+        vp = ((hn << 1) | ~(d0 | hp)) & full
+        vn = d0 & hp
+        previous = match
+    return distance
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Damerau (optimal string alignment) distance, or ``limit + 1`` if larger."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    return min(osa_distance(char_masks(a), len(a), b), limit + 1)
+
+
+class FuzzyVocabulary:
+    """Trigram index over a vocabulary for bounded edit-distance lookups."""
+
+    def __init__(self, words: Iterable[str]):
+        self._words: List[str] = []
+        # word length -> trigram -> ids of words of that length
+        grams: Dict[int, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
+        # word length -> ids of words of that length
+        lengths: Dict[int, List[int]] = defaultdict(list)
+        for word in words:
+            if len(word) < 3:
+                continue
+            word_id = len(self._words)
+            self._words.append(word)
+            lengths[len(word)].append(word_id)
+            for gram in set(trigrams(word)):
+                grams[len(word)][gram].append(word_id)
+        self._grams = {length: dict(by_gram) for length, by_gram in grams.items()}
+        self._lengths = dict(lengths)
+
+    def matches(self, token: str) -> List[Tuple[str, int]]:
+        """``(word, distance)`` for words within ``max_edits(token)`` of ``token``."""
+        limit = max_edits(token)
+        if not limit:
+            return []
+        token_grams = set(trigrams(token))
+        # Words more than ``limit`` letters longer or shorter are never counted
+        lengths = range(len(token) - limit, len(token) + limit + 1)
+        shared: Counter = Counter()
+        for length in lengths:
+            by_gram = self._grams.get(length)
+            if by_gram is None:
+                continue
+            for gram in token_grams:
+                word_ids = by_gram.get(gram)
+                if word_ids:
+                    shared.update(word_ids)
+
+        # q-gram lemma: an insertion, deletion or substitution destroys at
+        # most 3 trigrams and an adjacent transposition at most 4, so k edits
+        # leave all but 4k of them
+        required = len(token_grams) - 4 * limit
+        candidates = [(count, word_id) for word_id, count in shared.items() if count >= required]
+        if required <= 0 and len(candidates) < FUZZY_MAX_CANDIDATES:
+            # Short tokens can lose every trigram (``abc`` -> ``bac``), so the
+            # filter admits words that were never counted; they rank last
+            uncounted = (
+                (0, word_id) for length in lengths for word_id in self._lengths.get(length, ())
+                if word_id not in shared
+            )
+            candidates.extend(islice(uncounted, FUZZY_MAX_CANDIDATES - len(candidates)))
+        if len(candidates) > FUZZY_MAX_CANDIDATES:
+            candidates.sort(reverse=True)
+            candidates = candidates[:FUZZY_MAX_CANDIDATES]
+
+        masks = char_masks(token)
+        found = []
+        for _, word_id in candidates:
+            word = self._words[word_id]
+            distance = osa_distance(masks, len(token), word)
+            if 0 < distance <= limit:
+                found.append((word, distance))
+        return found
+
+
+class TextIndex:
+    """Inverted index from folded tokens to weighted document postings."""
+
+    def __init__(self, field_weights: Dict[str, float]):
+        self.field_weights = field_weights
+        self._docs: List[Dict[str, Any]] = []
+        self._building: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._vocabulary: List[str] = []
+        self._fuzzy = FuzzyVocabulary(())
+
+    def _add(self, doc: Dict[str, Any], fields: Dict[str, Any]):
+        doc_id = len(self._docs)
+        self._docs.append(doc)
+        for field, weight in self.field_weights.items():
+            value = fields.get(field) or ""
+            if isinstance(value, (list, tuple)):
+                value = " ".join(value)
+            for token in set(tokenize(value)):
+                postings = self._building[token]
+                postings[doc_id] = postings.get(doc_id, 0.0) + weight
+
+    def _finish(self):
+        self._postings = dict(self._building)
+        self._building = defaultdict(dict)
+        self._vocabulary = sorted(self._postings)
+        self._fuzzy = FuzzyVocabulary(self._vocabulary)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def _match_token(self, token: str, fuzzy: bool = False) -> Dict[int, float]:
+        """Scores for every document containing ``token``, a word it prefixes,
+        or (with ``fuzzy``) a word within a few edits of it."""
+        scores: Dict[int, float] = dict(self._postings.get(token, {}))
+        if len(token) >= PREFIX_MIN_LENGTH:
+            start = bisect.bisect_right(self._vocabulary, token)
+            for word in self._vocabulary[start:start + PREFIX_MAX_EXPANSIONS]:
+                if not word.startswith(token):
+                    break
+                self._merge(scores, self._postings[word], PREFIX_MATCH_FACTOR)
+        if fuzzy:
+            for word, distance in self._fuzzy.matches(token):
+                self._merge(scores, self._postings[word], FUZZY_MATCH_FACTOR * (1 - distance / len(token)))
+        return scores
+
+    @staticmethod
+    def _merge(scores: Dict[int, float], postings: Dict[int, float], factor: float):
+        """Keep each document's best score; common words have tens of thousands of postings."""
+        best = scores.get
+        for doc_id, weight in postings.items():
+            score = weight * factor
+            if score > best(doc_id, 0.0):
+                scores[doc_id] = score
+
+    def search(
+        self, query: str, limit: int = 20, offset: int = 0, fuzzy: bool = False
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """Return ``(total, page)`` of documents matching every query token."""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return 0, []
+
+        scores = None
+        for token in tokens:
+            matches = self._match_token(token, fuzzy)
+            if scores is None:
+                scores = matches
+            else:
+                scores = {doc_id: score + matches[doc_id] for doc_id, score in scores.items() if doc_id in matches}
+            if not scores:
+                return 0, []
+
+        # Only entries scoring at least the page's last score need a full sort
+        top = scores.items()
+        if 0 < offset + limit < len(scores):
+            cutoff = heapq.nlargest(offset + limit, scores.values())[-1]
+            top = [(doc_id, score) for doc_id, score in top if score >= cutoff]
+        ranked = sorted(top, key=lambda item: (-item[1], item[0]))
+        page = [
+            {**self._docs[doc_id], "score": round(score, 3)}
+            for doc_id, score in ranked[offset:offset + limit]
+        ]
+        return len(scores), page
+
+
+class ProverbIndex(TextIndex):
+    """Index over every proverb in every category."""
+
+    def __init__(self, categories: Dict[str, Dict[str, Any]]):
+        super().__init__(FIELD_WEIGHTS)
+        for category_id, category_data in categories.items():
+            for proverb in category_data["proverbs"]:
+                self._add({
+                    "category": category_id,
+                    "category_name": category_data["name"],
+                    "proverb": proverb
+                }, proverb)
+        self._finish()
+
+
+class FolktaleIndex(TextIndex):
+    """Index over folktale titles, summaries and characters."""
+
+    def __init__(self, folktales: Dict[str, Dict[str, Any]]):
+        super().__init__(FOLKTALE_FIELD_WEIGHTS)
+        for story_id, story in folktales.items():
+            self._add({
+                "id": story_id,
+                "title": story.get("title", ""),
+                "title_yoruba": story.get("title_yoruba", ""),
+                "summary": story.get("summary", ""),
+                "characters": story.get("characters", []),
+            }, story)
+        self._finish()
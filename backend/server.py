@@ -1,440 +1,67 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Query
+from fastapi import FastAPI, APIRouter, Depends, Header, HTTPException, Query, Request, Response
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from contextlib import asynccontextmanager
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import uuid
 from datetime import datetime
-import google.generativeai as genai
 import asyncio
 import json
 import re
+import tempfile
+import hashlib
+import hmac
+import unicodedata
+
+from cache import MongoCache, SQLiteCache, TieredCache, TTLCache
+from corpus import CorpusSnapshot, CorpusStore
+from corpus_search import DOC_TYPES, CorpusSearchIndex, corpus_documents
+from corpus_transfer import (
+    FOLKTALE, NDJSON_MEDIA_TYPE, ORISHA, PROVERB_CATEGORY, TransferError, export_lines, import_lines, ndjson_lines
+)
+# Seed corpus; replaced by the MongoDB snapshot once it has loaded
+from corpus_seed import ORISHA_DATA, PROVERB_CATEGORIES, IJAPA_STORIES
+from cultural_content import CulturalContentMatrix, content_cell_type
+from daily_proverb import DailyProverbStore, utc_date
+from database import Database
+from generation_store import GenerationStore
+from listing import Listing, ListingError, split_param
+from llm_gateway import LLMGateway, LLMTimeoutError, LLMUnavailableError
+from metrics import REGISTRY, MetricsMiddleware, MongoCommandMetrics
+from related import RelatedIndex
+from search import FolktaleIndex, ProverbIndex, TextIndex
+from snapshots import RenderedJSON, etag_matches, make_etag, not_modified, snapshot_response
+from translation_memory import NEAR, TranslationMemory, corpus_pairs
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# Configure Gemini
-genai.configure(api_key=os.environ.get('GEMINI_API_KEY'))
+# Shared async gateway used by every generative route; the Gemini client is
+# imported and configured on first use (or by the lifespan warm-up)
+llm_gateway = LLMGateway()
 
-# MongoDB connection
+# MongoDB connection; the Motor client is created by the lifespan handler
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+db = Database(mongo_url, os.environ['DB_NAME'], event_listeners=[MongoCommandMetrics()])
 
-# Create the main app without a prefix
-app = FastAPI()
+# Every Gemini output is recorded in MongoDB by a write-behind buffer
+generation_store = GenerationStore(
+    db.llm_generations,
+    ttl=float(os.environ.get('GENERATION_STORE_TTL_SECONDS', str(30 * 24 * 3600))),
+    batch_size=int(os.environ.get('GENERATION_STORE_BATCH_SIZE', '100')),
+    flush_interval=float(os.environ.get('GENERATION_STORE_FLUSH_SECONDS', '5')),
+    max_buffer=int(os.environ.get('GENERATION_STORE_MAX_BUFFER', '10000'))
+)
+llm_gateway.generation_store = generation_store
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
-# Extended Orisha data structure with 18 deities
-ORISHA_DATA = {
-    "obatala": {
-        "name": "Ọbàtálá",
-        "yoruba_name": "Ọbàtálá",
-        "domains": ["Creation", "Humankind", "Purity", "Peace", "The Mind"],
-        "colors": ["White"],
-        "symbols": ["White Cloth", "Dove", "Snail Shell"],
-        "sacred_number": 8,
-        "story": "The great creator deity commissioned by Olódùmarè to shape the world and humanity. Known as the sculptor of human forms and the compassionate guardian of all people with disabilities.",
-        "yoruba_story": "Òrìṣà àgbà tí Olódùmarè rán láti dá ayé àti ẹ̀dá. Ó ni àìní fun gbogbo ènìyàn tí wọ́n ní àlàáfíà.",
-        "diaspora": {
-            "santeria": "Our Lady of Mercy",
-            "location": "Cuba, Puerto Rico"
-        },
-        "constellation_position": {"x": 50, "y": 30}
-    },
-    "shango": {
-        "name": "Ṣàngó",
-        "yoruba_name": "Ṣàngó",
-        "domains": ["Thunder", "Lightning", "Fire", "Justice", "Virility", "Dance"],
-        "colors": ["Red", "White"],
-        "symbols": ["Double-headed Axe (Oṣè)", "Ram", "Thunderstones"],
-        "sacred_number": 16,
-        "story": "The powerful Òrìṣà of thunder and lightning, once the fourth Alaafin of the Ọ̀yọ́ Empire. Known for his fiery temperament and his three wives: Ọ̀ṣun, Oya, and Ọbà.",
-        "yoruba_story": "Òrìṣà àrá àti mọ̀nàmọ́ná tí ó jẹ́ ọba Ọ̀yọ́ rí. Ó ní aya mẹ́ta: Ọ̀ṣun, Oya, àti Ọbà.",
-        "diaspora": {
-            "santeria": "St. Barbara",
-            "location": "Cuba, Brazil, Trinidad"
-        },
-        "constellation_position": {"x": 75, "y": 25}
-    },
-    "ogun": {
-        "name": "Ògún",
-        "yoruba_name": "Ògún",
-        "domains": ["Iron", "War", "Technology", "Hunters", "Blacksmiths", "Truth"],
-        "colors": ["Green", "Black"],
-        "symbols": ["Machete", "Iron Implements", "Dog"],
-        "sacred_number": 7,
-        "story": "The master of iron and technology, the divine blacksmith who opened the path for civilization. Patron of all who work with metal and the guardian of truth and oaths.",
-        "yoruba_story": "Ológun irin àti ìmọ̀ ẹ̀rọ, agbẹ́dẹ àtọ̀run tí ó ṣí ọ̀nà fún ọlaju. Ó jẹ́ alábòójútó òtítọ́ àti ìbúra.",
-        "diaspora": {
-            "santeria": "St. Peter",
-            "location": "Cuba, Brazil"
-        },
-        "constellation_position": {"x": 25, "y": 50}
-    },
-    "oshun": {
-        "name": "Ọ̀ṣun",
-        "yoruba_name": "Ọ̀ṣun",
-        "domains": ["Rivers", "Love", "Beauty", "Fertility", "Wealth", "Diplomacy"],
-        "colors": ["Yellow", "Gold"],
-        "symbols": ["River", "Honey", "Mirror", "Peacock Feathers"],
-        "sacred_number": 5,
-        "story": "The beautiful river goddess, the sweetness of life and the power of love. She saved humanity when the male Òrìṣà tried to govern without the feminine principle.",
-        "yoruba_story": "Òrìṣà odò tí ó lẹ́wà, adùn ayé àti agbára ìfẹ́. Ó gba ẹ̀dá là nígbà tí àwọn Òrìṣà ọkùnrin fẹ́ ṣàkóso láì sí obìnrin.",
-        "diaspora": {
-            "santeria": "Our Lady of Charity",
-            "location": "Cuba, Brazil"
-        },
-        "constellation_position": {"x": 80, "y": 60}
-    },
-    "yemoja": {
-        "name": "Yemọja",
-        "yoruba_name": "Yemọja",
-        "domains": ["Ocean", "Motherhood", "Water", "Health", "Wealth"],
-        "colors": ["Blue", "White"],
-        "symbols": ["Ocean Waves", "Cowrie Shells", "Fan"],
-        "sacred_number": 7,
-        "story": "The great mother of waters, the nurturing ocean goddess who is the mother of all Òrìṣà. She represents the primal waters from which all life emerges.",
-        "yoruba_story": "Ìyá àgbà omi, òrìṣà òkun tí ó jẹ́ ìyá gbogbo Òrìṣà. Ó dúró fún àwọn omi àkọ́kọ́ tí gbogbo ẹ̀mí ti wá.",
-        "diaspora": {
-            "santeria": "Our Lady of Regla",
-            "location": "Cuba, Brazil, Uruguay"
-        },
-        "constellation_position": {"x": 20, "y": 80}
-    },
-    "esu": {
-        "name": "Eṣu",
-        "yoruba_name": "Eṣu",
-        "domains": ["Crossroads", "Messenger", "Trickster", "Chaos", "Travelers"],
-        "colors": ["Red", "Black"],
-        "symbols": ["Key", "Hooked Staff", "Crossroads"],
-        "sacred_number": 21,
-        "story": "The divine messenger and guardian of crossroads. He tests humanity, carries sacrifices to the heavens, and maintains cosmic balance through necessary chaos.",
-        "yoruba_story": "Ìránṣẹ́ àtọ̀run àti alábòójútó ibi tí ọ̀nà pàdé. Ó dán ẹ̀dá wò, ó gbé ẹbọ lọ sí ọ̀run, ó sì ṣe ìdọ́gbà ayé.",
-        "diaspora": {
-            "santeria": "St. Anthony of Padua",
-            "location": "Cuba, Brazil, Trinidad"
-        },
-        "constellation_position": {"x": 40, "y": 70}
-    },
-    "orunmila": {
-        "name": "Ọ̀rúnmìlà",
-        "yoruba_name": "Ọ̀rúnmìlà",
-        "domains": ["Wisdom", "Divination", "Knowledge", "Fate", "Prophecy"],
-        "colors": ["Green", "Yellow", "Brown"],
-        "symbols": ["Divination Tray (Opón Ifá)", "Palm Nuts (Ikin)"],
-        "sacred_number": 16,
-        "story": "The wise witness of creation, the master of Ifá divination. He knows the destiny of all things and guides humanity through the wisdom of the oracle.",
-        "yoruba_story": "Ẹlẹ́rìí ìdá ayé, ológbon Ifá. Ó mọ ìpín ohun gbogbo, ó sì tọ́ ẹ̀dá sọ́nà nípasẹ̀ ọgbọ́n àfọ̀ṣẹ.",
-        "diaspora": {
-            "santeria": "St. Francis of Assisi",
-            "location": "Cuba, Brazil"
-        },
-        "constellation_position": {"x": 60, "y": 85}
-    },
-    "oya": {
-        "name": "Oya",
-        "yoruba_name": "Oya",
-        "domains": ["Winds", "Storms", "Lightning", "Change", "Guardian of the Cemetery"],
-        "colors": ["Maroon", "Nine Colors"],
-        "symbols": ["Buffalo Horns", "Machete", "Whirlwind"],
-        "sacred_number": 9,
-        "story": "The fierce goddess of winds and storms, the guardian of the gates of death. She brings change and transformation, clearing the way for new beginnings.",
-        "yoruba_story": "Òrìṣà ìjì àti àrá, alábòójútó ẹnu-ọ̀nà ikú. Ó mú ìyípadà àti ìtúnṣe, ó sì ṣí ọ̀nà fún ìbẹ̀rẹ̀ tuntun.",
-        "diaspora": {
-            "santeria": "Our Lady of Candelaria",
-            "location": "Cuba, Brazil"
-        },
-        "constellation_position": {"x": 85, "y": 40}
-    },
-    "babalu_aye": {
-        "name": "Babalu-Aye",
-        "yoruba_name": "Babalu-Aye",
-        "domains": ["Disease", "Healing", "Earth", "Miracles", "Epidemics"],
-        "colors": ["White", "Black", "Red"],
-        "symbols": ["Crutches", "Jute Cloth", "Dogs"],
-        "sacred_number": 17,
-        "story": "The compassionate healer who governs disease and healing. Once cast out for his pride, he learned humility and became the great physician of the Òrìṣà.",
-        "yoruba_story": "Onísègùn àánú tí ó ṣàkóso àrùn àti ìwòsàn. Ó kọ́ ìrẹ̀lẹ̀ lẹ́yìn tí a ti lé lọ nítorí ìgbéraga, ó sì di dókítà àgbà àwọn Òrìṣà.",
-        "diaspora": {
-            "santeria": "St. Lazarus",
-            "location": "Cuba, Brazil"
-        },
-        "constellation_position": {"x": 15, "y": 45}
-    },
-    "oko": {
-        "name": "Òkò",
-        "yoruba_name": "Òkò",
-        "domains": ["Agriculture", "Fertility", "Harvest", "Food", "Farming"],
-        "colors": ["Blue", "White", "Pink"],
-        "symbols": ["Yam", "Plow", "Harvest Tools"],
-        "sacred_number": 7,
-        "story": "The divine farmer who taught humanity agriculture. He ensures the fertility of the earth and the abundance of harvests for all communities.",
-        "yoruba_story": "Àgbẹ̀ àtọ̀run tí ó kọ́ ẹ̀dá nípa ìṣẹ̀ àgbẹ̀. Ó ṣe ìdánilójú ọ̀rọ̀ ilẹ̀ àti ọ̀pọ̀ ìkórè fún gbogbo àgbègbè.",
-        "diaspora": {
-            "santeria": "St. Isidore",
-            "location": "Cuba, Brazil"
-        },
-        "constellation_position": {"x": 30, "y": 15}
-    },
-    "osanyin": {
-        "name": "Ọ̀ṣányìn",
-        "yoruba_name": "Ọ̀ṣányìn",
-        "domains": ["Herbs", "Medicine", "Forest", "Healing", "Plants"],
-        "colors": ["Green", "Brown"],
-        "symbols": ["Mortar and Pestle", "Medicinal Plants", "Iron Staff"],
-        "sacred_number": 7,
-        "story": "The master of herbs and forest medicines. He holds the secrets of plant healing and works closely with all other Òrìṣà to provide natural remedies.",
-        "yoruba_story": "Ológun ewébẹ̀ àti oògùn àgbò. Ó ni àṣírí ìwòsàn ewéko, ó sì ṣiṣẹ́ pọ̀ pẹ̀lú gbogbo Òrìṣà míràn láti pèsè oògùn àdáyébá.",
-        "diaspora": {
-            "santeria": "St. Joseph",
-            "location": "Cuba, Brazil"
-        },
-        "constellation_position": {"x": 70, "y": 15}
-    },
-    "oba": {
-        "name": "Ọbà",
-        "yoruba_name": "Ọbà",
-        "domains": ["River", "Marriage", "Domestic Affairs", "Loyalty", "Sacrifice"],
-        "colors": ["Pink", "Yellow"],
-        "symbols": ["Ear", "River Current", "Marriage Cloth"],
-        "sacred_number": 8,
-        "story": "The loyal river goddess and third wife of Ṣàngó. Her story teaches about sacrifice, loyalty, and the complexities of love and marriage.",
-        "yoruba_story": "Òrìṣà odò olóòtítọ́ àti aya kẹta Ṣàngó. Ìtàn rẹ̀ kọ́ni nípa ẹbọ, òtítọ́, àti ìdiju ìfẹ́ àti ìgbéyàwó.",
-        "diaspora": {
-            "santeria": "St. Catherine",
-            "location": "Cuba, Brazil"
-        },
-        "constellation_position": {"x": 90, "y": 70}
-    },
-    "osun": {
-        "name": "Ọ̀ṣun",
-        "yoruba_name": "Ọ̀ṣun",
-        "domains": ["Sacred Grove", "Traditions", "Customs", "Ancestral Wisdom"],
-        "colors": ["White", "Green"],
-        "symbols": ["Sacred Grove", "Ancient Trees", "Ritual Objects"],
-        "sacred_number": 4,
-        "story": "The guardian of sacred traditions and ancestral customs. Different from the river Ọ̀ṣun, this deity preserves the ancient ways and ritual practices.",
-        "yoruba_story": "Alábòójútó àṣà mímọ́ àti ìṣẹ̀ àwọn baba. Ó yàtọ̀ sí Ọ̀ṣun odò, òrìṣà yìí tọ́jú àwọn ọ̀nà àtijọ́ àti ìṣẹ̀ ìsìn.",
-        "diaspora": {
-            "santeria": "St. Norbert",
-            "location": "Cuba"
-        },
-        "constellation_position": {"x": 10, "y": 25}
-    },
-    "nana": {
-        "name": "Nana Bùkúù",
-        "yoruba_name": "Nana Bùkúù",
-        "domains": ["Swamp", "Mud", "Ancient Wisdom", "Life and Death", "Primordial Waters"],
-        "colors": ["Purple", "White", "Blue"],
-        "symbols": ["Ibiri (Curved Staff)", "Mud", "Swamp Plants"],
-        "sacred_number": 9,
-        "story": "The ancient mother of waters, older than Yemọja. She represents the primordial mud from which life first emerged and to which it returns.",
-        "yoruba_story": "Ìyá àgbà omi, àgbà ju Yemọja lọ. Ó dúró fún àmí àkọ́kọ́ tí ẹ̀mí ti kọ́kọ́ jáde sí àti èyí tí ó máa padà sí.",
-        "diaspora": {
-            "santeria": "St. Anne",
-            "location": "Brazil, Cuba"
-        },
-        "constellation_position": {"x": 5, "y": 60}
-    },
-    "osumare": {
-        "name": "Ọ̀ṣùmàrè",
-        "yoruba_name": "Ọ̀ṣùmàrè",
-        "domains": ["Rainbow", "Serpent", "Transformation", "Renewal", "Cycles"],
-        "colors": ["All Colors", "Rainbow"],
-        "symbols": ["Rainbow", "Serpent", "Circle"],
-        "sacred_number": 7,
-        "story": "The rainbow serpent who connects heaven and earth. Represents transformation, renewal, and the eternal cycles of life and nature.",
-        "yoruba_story": "Ejò òṣùmàrè tí ó so ọ̀run àti ayé pọ̀. Ó dúró fún ìyípadà, ìmúdọ̀gbà, àti àyíká àìnípẹ̀kun ayé àti ìṣẹ̀dá.",
-        "diaspora": {
-            "santeria": "St. Bartholomew",
-            "location": "Brazil, Cuba"
-        },
-        "constellation_position": {"x": 90, "y": 20}
-    },
-    "ibeji": {
-        "name": "Ìbejì",
-        "yoruba_name": "Ìbejì",
-        "domains": ["Twins", "Children", "Joy", "Playfulness", "Duality"],
-        "colors": ["Blue", "Red", "White"],
-        "symbols": ["Twin Dolls", "Children's Toys", "Double Symbols"],
-        "sacred_number": 2,
-        "story": "The divine twins who bring joy and blessings to families. They represent the sacred nature of twins and the importance of children in Yoruba culture.",
-        "yoruba_story": "Ìbejì àtọ̀run tí ó mú ayọ̀ àti ìbùkún wá sí ìdílé. Wọ́n dúró fún ẹ̀mí mímọ́ ìbejì àti pàtàkì àwọn ọmọ nínú àṣà Yorùbá.",
-        "diaspora": {
-            "santeria": "St. Cosmas and Damian",
-            "location": "Cuba, Brazil"
-        },
-        "constellation_position": {"x": 95, "y": 50}
-    },
-    "aganju": {
-        "name": "Aganjú",
-        "yoruba_name": "Aganjú",
-        "domains": ["Volcanoes", "Desert", "Fire", "Strength", "Deserts"],
-        "colors": ["Red", "Brown", "Orange"],
-        "symbols": ["Volcano", "Desert Sand", "Fire"],
-        "sacred_number": 9,
-        "story": "The fierce deity of volcanoes and deserts. Father of Ṣàngó, he represents the primal force of fire and the strength of the earth itself.",
-        "yoruba_story": "Òrìṣà líle àwọn òkè iná àti àginjù. Baba Ṣàngó, ó dúró fún agbára àkọ́kọ́ iná àti okun ilẹ̀ fúnra rẹ̀.",
-        "diaspora": {
-            "santeria": "St. Christopher",
-            "location": "Cuba, Brazil"
-        },
-        "constellation_position": {"x": 65, "y": 45}
-    },
-    "oke": {
-        "name": "Òkè",
-        "yoruba_name": "Òkè",
-        "domains": ["Mountains", "Heights", "Peaks", "Elevation", "Boundaries"],
-        "colors": ["Brown", "Green", "White"],
-        "symbols": ["Mountain Peak", "High Places", "Boundaries"],
-        "sacred_number": 8,
-        "story": "The deity of mountains and high places. He guards the boundaries between realms and watches over all elevated places of power and worship.",
-        "yoruba_story": "Òrìṣà àwọn òkè àti ibi gíga. Ó ṣọ́ àwọn ààlà láàrin àwọn agbègbè ó sì ṣọ́ gbogbo àwọn ibi gíga agbára àti ìsìn.",
-        "diaspora": {
-            "santeria": "St. Manuel",
-            "location": "Cuba"
-        },
-        "constellation_position": {"x": 35, "y": 35}
-    }
-}
-
-# Proverb database organized by categories
-PROVERB_CATEGORIES = {
-    "wisdom": {
-        "name": "Ìmọ̀ (Wisdom)",
-        "name_yoruba": "Ìmọ̀",
-        "proverbs": [
-            {
-                "yoruba": "Ọgbọ́n ọlọ́gbọ́n ni a fi ń sọgbọ́n, afi ọgbọ́n ẹni nìkan dá, á ṣì gbọ́n ni.",
-                "literal": "It is with the wisdom of others that one becomes wise; he who relies on his own wisdom alone remains foolish.",
-                "meaning": "No one is an island; one should seek counsel from others to gain true wisdom.",
-                "context": "Used to encourage collaboration and learning from others' experiences."
-            },
-            {
-                "yoruba": "Ọ̀rọ̀ ọlọ́gbọ́n là ń gbọ́, kì í ṣe ọ̀rọ̀ aláígbọ́n.",
-                "literal": "It is the words of the wise that we listen to, not the words of the foolish.",
-                "meaning": "Wisdom comes from listening to those who have knowledge and experience.",
-                "context": "Used to emphasize the importance of choosing good advisors and mentors."
-            }
-        ]
-    },
-    "patience": {
-        "name": "Sùúrù (Patience)",
-        "name_yoruba": "Sùúrù",
-        "proverbs": [
-            {
-                "yoruba": "Sùúrù ni baba ìwà.",
-                "literal": "Patience is the father of character.",
-                "meaning": "Patience is the foundation of good character and moral behavior.",
-                "context": "Used to encourage someone to be patient in difficult situations."
-            },
-            {
-                "yoruba": "Àìsùúrù ò jẹ́ kí onílùú jẹ oúnjẹ.",
-                "literal": "Impatience prevents the owner of palms from enjoying his palm wine.",
-                "meaning": "Impatience can prevent us from enjoying the fruits of our labor.",
-                "context": "Used to warn against rushing things that require time to develop properly."
-            }
-        ]
-    },
-    "hard_work": {
-        "name": "Ìṣẹ́ (Hard Work)",
-        "name_yoruba": "Ìṣẹ́",
-        "proverbs": [
-            {
-                "yoruba": "Ìṣẹ́ l'oògùn ìṣẹ́.",
-                "literal": "Work is the medicine for poverty.",
-                "meaning": "Hard work is the cure for poverty and lack.",
-                "context": "Used to motivate people to work hard and not be lazy."
-            },
-            {
-                "yoruba": "A kì í fi ẹnu ṣoké, a fi ọwọ́ ṣoké.",
-                "literal": "One does not farm with the mouth, one farms with the hands.",
-                "meaning": "Talk without action accomplishes nothing; success requires actual work.",
-                "context": "Used to criticize those who talk big but do little work."
-            }
-        ]
-    },
-    "respect": {
-        "name": "Ọ̀wọ̀ (Respect)",
-        "name_yoruba": "Ọ̀wọ̀",
-        "proverbs": [
-            {
-                "yoruba": "Ọ̀wọ̀ kọ́ni dáni.",
-                "literal": "Respect does not diminish a person.",
-                "meaning": "Showing respect to others does not make you less of a person.",
-                "context": "Used to encourage respectful behavior towards others."
-            },
-            {
-                "yoruba": "Ọmọ tí ó bá bú baba rẹ̀, àgbà rẹ̀ kò ní pẹ́.",
-                "literal": "A child who insults his father, his old age will not last long.",
-                "meaning": "Disrespecting elders brings negative consequences.",
-                "context": "Used to warn against disrespecting parents and elders."
-            }
-        ]
-    },
-    "unity": {
-        "name": "Ìṣọ̀kan (Unity)",
-        "name_yoruba": "Ìṣọ̀kan",
-        "proverbs": [
-            {
-                "yoruba": "Ìgbá ọwọ́ la fi ń mu omi.",
-                "literal": "It is with cupped hands that we drink water.",
-                "meaning": "Unity and cooperation are necessary for success.",
-                "context": "Used to emphasize the importance of working together."
-            },
-            {
-                "yoruba": "Ọ̀pọ̀ ọwọ́ ni ó ń mú ẹrù dórí.",
-                "literal": "It is many hands that carry the load to the head.",
-                "meaning": "Many people working together can accomplish great things.",
-                "context": "Used to encourage teamwork and collective effort."
-            }
-        ]
-    }
-}
-
-# Ijapa (Tortoise) folktales
-IJAPA_STORIES = {
-    "how_tortoise_got_cracked_shell": {
-        "title": "How Ìjàpá Got His Cracked Shell",
-        "title_yoruba": "Bí Ìjàpá Ṣe Ní Ikarahun Títẹ́",
-        "summary": "A tale of how Ìjàpá's greed led to his shell being cracked when he fell from the sky during a heavenly feast.",
-        "full_story": "Long ago, when there was a great famine on earth, the birds decided to fly to heaven for a feast. Ìjàpá, being clever but unable to fly, convinced the birds to each give him a feather so he could join them. He told them his name was 'All of You' so that when the heavenly hosts said the feast was for 'All of You,' he could claim it was all for him. His greed was exposed when his wife called his real name from earth. In anger, the birds took back their feathers, and Ìjàpá fell from the sky, cracking his shell forever.",
-        "moral": "Greed and deception lead to one's downfall. Truth always prevails in the end.",
-        "characters": ["Ìjàpá (Tortoise)", "Various Birds", "Yannibo (Tortoise's Wife)"]
-    },
-    "tortoise_and_feast_in_sky": {
-        "title": "Ìjàpá and the Feast in the Sky",
-        "title_yoruba": "Ìjàpá àti Àríyá Ní Ọ̀run",
-        "summary": "The classic tale of Ìjàpá's cunning attempt to attend a heavenly feast, which leads to his ultimate comeuppance.",
-        "full_story": "During a time of great hunger, all the birds received an invitation to a feast in the sky. Ìjàpá, who was also hungry but could not fly, begged the birds to help him. Each bird gave him a feather, and soon he could fly like them. Before they left, Ìjàpá suggested they all take new names for the occasion. He called himself 'All of You.' When they arrived in heaven, the hosts said, 'This feast is prepared for All of You.' Ìjàpá quickly claimed the entire feast was for him alone. The birds, realizing they had been tricked, took back their feathers one by one, leaving Ìjàpá stranded in the sky.",
-        "moral": "Cleverness without wisdom leads to trouble. Selfishness ultimately brings isolation.",
-        "characters": ["Ìjàpá (Tortoise)", "Birds", "Heavenly Hosts"]
-    },
-    "tortoise_gourd_of_wisdom": {
-        "title": "Ìjàpá's Gourd of Wisdom",
-        "title_yoruba": "Ìgbá Ọgbọ́n Ìjàpá",
-        "summary": "How Ìjàpá tried to hoard all the wisdom in the world for himself, only to learn that wisdom belongs to everyone.",
-        "full_story": "Ìjàpá once decided that he would collect all the wisdom in the world and keep it for himself. He gathered wisdom from every corner of the earth and put it all in a large gourd. Then he decided to hide the gourd at the top of a tall palm tree where no one could reach it. As he climbed the tree with the gourd tied to his belly, his young son called from below: 'Father, wouldn't it be easier to tie the gourd to your back instead of your belly?' Ìjàpá realized that even his small son had wisdom that he had not collected. In frustration, he threw the gourd down, and it broke, scattering wisdom to all corners of the world once again.",
-        "moral": "Wisdom cannot be hoarded. It is meant to be shared and belongs to all humanity.",
-        "characters": ["Ìjàpá (Tortoise)", "Ìjàpá's Son"]
-    },
-    "tortoise_and_monkey_prayer": {
-        "title": "Ìjàpá and the Monkey's Prayer",
-        "title_yoruba": "Ìjàpá àti Àdúrà Ọ̀bọ",
-        "summary": "A story about Ìjàpá's attempt to copy Monkey's successful prayer, leading to unexpected consequences.",
-        "full_story": "Ìjàpá noticed that whenever Monkey prayed, he always received what he asked for. Curious about this success, Ìjàpá decided to spy on Monkey during his prayers. He discovered that Monkey always ended his prayers by saying, 'If you cannot grant my request, then let me die.' Ìjàpá thought this was the secret to successful prayer. The next day, Ìjàpá went to pray and ended with the same words. However, when he said, 'If you cannot grant my request, then let me die,' the spirits responded, 'So be it!' Ìjàpá quickly realized that Monkey's prayers were successful because of his sincere faith, not because of specific words. He hastily apologized and learned to pray with genuine heart.",
-        "moral": "Sincerity and faith are more important than copying others' methods. True devotion comes from the heart.",
-        "characters": ["Ìjàpá (Tortoise)", "Ọ̀bọ (Monkey)", "Spirits"]
-    }
-}
-
 # Define Models
 class OrishaProfile(BaseModel):
     id: str
@@ -472,95 +99,370 @@ class TranslationRequest(BaseModel):
     text: str
     target_language: str
 
+class TranslationMemoryMatch(BaseModel):
+    source_text: str
+    translated_text: str
+    match: str
+    score: float
+    origin: str
+
 class TranslationResponse(BaseModel):
     original_text: str
     translated_text: str
     language: str
+    memory_match: Optional[TranslationMemoryMatch] = None
+
+class TranslationAcceptRequest(BaseModel):
+    original_text: str
+    translated_text: str
+    language: str
+
+class TranslationBatchRequest(BaseModel):
+    items: List[TranslationRequest]
+
+class TranslationBatchItem(BaseModel):
+    original_text: str
+    translated_text: Optional[str] = None
+    language: str
+    memory_match: Optional[TranslationMemoryMatch] = None
+    error: Optional[str] = None
+
+class TranslationBatchResponse(BaseModel):
+    results: List[TranslationBatchItem]
 
 class CulturalContentRequest(BaseModel):
     orisha_name: str
     content_type: str
 
+def render_catalog(corpus: CorpusSnapshot) -> Dict[str, RenderedJSON]:
+    """Serialize every static catalog response once"""
+    catalog = {}
+    
+    profiles = [OrishaProfile(id=orisha_id, **data).model_dump() for orisha_id, data in corpus.orishas.items()]
+    catalog["orisha"] = RenderedJSON(profiles)
+    for profile in profiles:
+        catalog[f"orisha:{profile['id']}"] = RenderedJSON(profile)
+    
+    catalog["proverb_categories"] = RenderedJSON([
+        {
+            "id": category_id,
+            "name": data["name"],
+            "name_yoruba": data["name_yoruba"],
+            "count": len(data["proverbs"])
+        }
+        for category_id, data in corpus.proverb_categories.items()
+    ])
+    for category_id, data in corpus.proverb_categories.items():
+        catalog[f"proverb_category:{category_id}"] = RenderedJSON(data)
+    
+    tales = [{"id": story_id, **data} for story_id, data in corpus.folktales.items()]
+    catalog["folktales"] = RenderedJSON(tales)
+    for tale in tales:
+        catalog[f"folktale:{tale['id']}"] = RenderedJSON(tale)
+    
+    return catalog
+
+CATEGORY_SUMMARY_FIELDS = ("id", "name", "name_yoruba", "count")
+
+def build_listings(corpus: CorpusSnapshot) -> Dict[str, Listing]:
+    """Catalog lists that support fields=, ids=, limit= and cursor="""
+    return {
+        "orisha": Listing([
+            OrishaProfile(id=orisha_id, **data).model_dump() for orisha_id, data in corpus.orishas.items()
+        ]),
+        "proverb_categories": Listing(
+            [
+                {"id": category_id, **data, "count": len(data["proverbs"])}
+                for category_id, data in corpus.proverb_categories.items()
+            ],
+            default_fields=CATEGORY_SUMMARY_FIELDS
+        ),
+        "folktales": Listing([{"id": story_id, **data} for story_id, data in corpus.folktales.items()]),
+    }
+
+def corpus_digest(corpus: CorpusSnapshot) -> str:
+    """Content hash of the whole corpus; changes whenever any entry changes"""
+    serialized = json.dumps(
+        [corpus.orishas, corpus.proverb_categories, corpus.folktales],
+        ensure_ascii=False, sort_keys=True
+    )
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()[:32]
+
+# The corpus only changes on reload, so browsers and proxies may reuse
+# responses briefly and serve stale copies while revalidating with the ETag
+CATALOG_CACHE_CONTROL = "public, max-age={}, stale-while-revalidate={}".format(
+    os.environ.get('CATALOG_CACHE_MAX_AGE_SECONDS', '300'),
+    os.environ.get('CATALOG_STALE_WHILE_REVALIDATE_SECONDS', '86400')
+)
+
+# Structures derived from the corpus, rebuilt whenever it is reloaded
+SEED_CORPUS = CorpusSnapshot(
+    orishas=ORISHA_DATA,
+    proverb_categories=PROVERB_CATEGORIES,
+    folktales=IJAPA_STORIES
+)
+corpus_store = CorpusStore(db, poll_interval=float(os.environ.get('CORPUS_POLL_SECONDS', '30')))
+translation_memory = TranslationMemory(
+    db.translation_memory,
+    min_similarity=float(os.environ.get('TRANSLATION_MEMORY_MIN_SIMILARITY', '0.9'))
+)
+proverb_index = ProverbIndex({})
+folktale_index = FolktaleIndex({})
+corpus_index = CorpusSearchIndex([])
+# Built off the event loop after startup; related_version trails corpus_version until then
+related_index = RelatedIndex([])
+related_version = ""
+catalog_snapshot: Dict[str, RenderedJSON] = {}
+catalog_listings: Dict[str, Listing] = {}
+corpus_version = ""
+corpus_loaded = False
+RELATED_TOP_K = int(os.environ.get('RELATED_TOP_K', '20'))
+
+def build_corpus_state(corpus: CorpusSnapshot, related: bool = True) -> Dict[str, Any]:
+    """Build every structure derived from the corpus; CPU-bound, touches no globals.
+    Without ``related`` the related index is left out (it pulls in numpy/scipy)"""
+    documents = corpus_documents(corpus.orishas, corpus.proverb_categories, corpus.folktales)
+    return {
+        "proverb_index": ProverbIndex(corpus.proverb_categories),
+        "folktale_index": FolktaleIndex(corpus.folktales),
+        "corpus_index": CorpusSearchIndex(documents),
+        "related_index": RelatedIndex(documents, top_k=RELATED_TOP_K) if related else None,
+        "pairs": corpus_pairs(corpus.orishas, corpus.proverb_categories, corpus.folktales),
+        "catalog": render_catalog(corpus),
+        "listings": build_listings(corpus),
+        "version": corpus_digest(corpus),
+    }
+
+def swap_corpus_state(corpus: CorpusSnapshot, state: Dict[str, Any]):
+    """Swap a built corpus state in; no awaits, so requests never see a half-swapped corpus"""
+    global ORISHA_DATA, PROVERB_CATEGORIES, IJAPA_STORIES
+    global proverb_index, folktale_index, corpus_index, related_index, related_version
+    global catalog_snapshot, catalog_listings, corpus_version
+    
+    ORISHA_DATA = corpus.orishas
+    PROVERB_CATEGORIES = corpus.proverb_categories
+    IJAPA_STORIES = corpus.folktales
+    proverb_index = state["proverb_index"]
+    folktale_index = state["folktale_index"]
+    corpus_index = state["corpus_index"]
+    if state["related_index"] is not None:
+        related_index = state["related_index"]
+        related_version = state["version"]
+    translation_memory.load_corpus(state["pairs"])
+    catalog_snapshot = state["catalog"]
+    catalog_listings = state["listings"]
+    corpus_version = state["version"]
+
+def reload_corpus(corpus: CorpusSnapshot = SEED_CORPUS):
+    """Rebuild the derived structures, then swap everything in at once; the
+    related index follows from ensure_related_index"""
+    swap_corpus_state(corpus, build_corpus_state(corpus, related=False))
+
+async def ensure_related_index():
+    """Build the related index for the current corpus in a thread if it lags behind"""
+    global related_index, related_version
+    version = corpus_version
+    if related_version == version:
+        return
+    documents = corpus_documents(ORISHA_DATA, PROVERB_CATEGORIES, IJAPA_STORIES)
+    index = await asyncio.to_thread(RelatedIndex, documents, RELATED_TOP_K)
+    # A reload that finished meanwhile brought its own index
+    if corpus_version == version:
+        related_index = index
+        related_version = version
+
+async def apply_corpus_snapshot(corpus: CorpusSnapshot):
+    global corpus_loaded
+    if corpus_digest(corpus) != corpus_version:
+        # Indexes of a large corpus take seconds to build; keep serving the
+        # current corpus from the event loop meanwhile
+        state = await asyncio.to_thread(build_corpus_state, corpus)
+        swap_corpus_state(corpus, state)
+        logger.info(
+            "Corpus reloaded: %d Òrìṣà, %d proverb categories, %d folktales",
+            len(corpus.orishas), len(corpus.proverb_categories), len(corpus.folktales)
+        )
+    corpus_loaded = True
+
+def catalog_response(request: Request, key: str, not_found: str = "Not found") -> Response:
+    rendered = catalog_snapshot.get(key)
+    if rendered is None:
+        raise HTTPException(status_code=404, detail=not_found)
+    return snapshot_response(rendered, request.headers, CATALOG_CACHE_CONTROL)
+
+# Rendered projections/pages, keyed by corpus version so reloads invalidate them
+listing_cache = TTLCache(
+    max_size=int(os.environ.get('LISTING_CACHE_SIZE', '512')),
+    ttl=float(os.environ.get('LISTING_CACHE_TTL_SECONDS', '3600'))
+)
+
+def listing_response(
+    request: Request,
+    key: str,
+    fields: Optional[str],
+    ids: Optional[str],
+    cursor: Optional[str],
+    limit: Optional[int]
+) -> Response:
+    """Projected and/or paginated catalog list; the full snapshot when unparameterized"""
+    if fields is None and ids is None and cursor is None and limit is None:
+        return catalog_response(request, key)
+    
+    cache_key = f"{corpus_version}:{key}:{fields}:{ids}:{cursor}:{limit}"
+    cached = listing_cache.get(cache_key)
+    if cached is None:
+        try:
+            page, total, next_cursor = catalog_listings[key].select(
+                split_param(fields), split_param(ids), cursor, limit
+            )
+        except ListingError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        cached = (RenderedJSON(page), total, next_cursor)
+        listing_cache.set(cache_key, cached)
+    
+    rendered, total, next_cursor = cached
+    response = snapshot_response(rendered, request.headers, CATALOG_CACHE_CONTROL)
+    response.headers["X-Total-Count"] = str(total)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
+
+FIELDS_QUERY = Query(None, description="Comma-separated fields to return; id is always included")
+IDS_QUERY = Query(None, description="Comma-separated ids to fetch, in this order")
+CURSOR_QUERY = Query(None, description="X-Next-Cursor value from the previous page")
+LIMIT_QUERY = Query(None, ge=1, le=500, description="Maximum number of entries to return")
+
+reload_corpus()
+
 # Routes
 @api_router.get("/")
 async def root():
     return {"message": "Kábíyèsí! Welcome to The Living Ìtàn"}
 
 @api_router.get("/orisha", response_model=List[OrishaProfile])
-async def get_all_orisha():
+async def get_all_orisha(
+    request: Request,
+    fields: Optional[str] = FIELDS_QUERY,
+    ids: Optional[str] = IDS_QUERY,
+    cursor: Optional[str] = CURSOR_QUERY,
+    limit: Optional[int] = LIMIT_QUERY
+):
     """Get all Òrìṣà profiles"""
-    profiles = []
-    for orisha_id, data in ORISHA_DATA.items():
-        profile = OrishaProfile(
-            id=orisha_id,
-            **data
-        )
-        profiles.append(profile)
-    return profiles
+    return listing_response(request, "orisha", fields, ids, cursor, limit)
 
 @api_router.get("/orisha/{orisha_id}", response_model=OrishaProfile)
-async def get_orisha_profile(orisha_id: str):
+async def get_orisha_profile(orisha_id: str, request: Request):
     """Get specific Òrìṣà profile"""
-    if orisha_id not in ORISHA_DATA:
-        raise HTTPException(status_code=404, detail="Òrìṣà not found")
-    
-    data = ORISHA_DATA[orisha_id]
-    return OrishaProfile(
-        id=orisha_id,
-        **data
-    )
+    return catalog_response(request, f"orisha:{orisha_id}", "Òrìṣà not found")
 
 @api_router.get("/proverbs/categories")
-async def get_proverb_categories():
-    """Get all proverb categories"""
-    categories = []
-    for category_id, data in PROVERB_CATEGORIES.items():
-        categories.append({
-            "id": category_id,
-            "name": data["name"],
-            "name_yoruba": data["name_yoruba"],
-            "count": len(data["proverbs"])
-        })
-    return categories
+async def get_proverb_categories(
+    request: Request,
+    fields: Optional[str] = FIELDS_QUERY,
+    ids: Optional[str] = IDS_QUERY,
+    cursor: Optional[str] = CURSOR_QUERY,
+    limit: Optional[int] = LIMIT_QUERY
+):
+    """Get all proverb categories; fields=proverbs includes the proverbs themselves"""
+    return listing_response(request, "proverb_categories", fields, ids, cursor, limit)
 
 @api_router.get("/proverbs/category/{category_id}")
-async def get_proverbs_by_category(category_id: str):
+async def get_proverbs_by_category(category_id: str, request: Request):
     """Get proverbs by category"""
-    if category_id not in PROVERB_CATEGORIES:
-        raise HTTPException(status_code=404, detail="Category not found")
+    return catalog_response(request, f"proverb_category:{category_id}", "Category not found")
+
+def indexed_search(
+    request: Request,
+    response: Response,
+    index: TextIndex,
+    name: str,
+    q: str,
+    limit: int,
+    offset: int,
+    fuzzy: bool
+):
+    # Results only depend on the query and the corpus version
+    key = f"{corpus_version}:{name}:{q}:{limit}:{offset}:{fuzzy}"
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    if etag_matches(request.headers.get("if-none-match", ""), digest):
+        return not_modified(make_etag(digest), CATALOG_CACHE_CONTROL)
     
-    return PROVERB_CATEGORIES[category_id]
+    total, results = index.search(q, limit=limit, offset=offset, fuzzy=fuzzy)
+    response.headers["X-Total-Count"] = str(total)
+    response.headers["ETag"] = make_etag(digest)
+    response.headers["Cache-Control"] = CATALOG_CACHE_CONTROL
+    return results
 
 @api_router.get("/proverbs/search")
-async def search_proverbs(q: str = Query(..., description="Search query")):
-    """Search proverbs by keyword"""
-    results = []
-    search_term = q.lower()
+async def search_proverbs(
+    request: Request,
+    response: Response,
+    q: str = Query(..., description="Search query"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of results"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    fuzzy: bool = Query(True, description="Also match words within a typo or two")
+):
+    """Search proverbs by keyword, ignoring tone marks, case and small typos"""
+    return indexed_search(request, response, proverb_index, "proverbs", q, limit, offset, fuzzy)
+
+def parse_types(types: Optional[str]) -> Optional[List[str]]:
+    wanted = split_param(types)
+    unknown = sorted(set(wanted or ()) - set(DOC_TYPES))
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown type(s): {', '.join(unknown)}. Available: {', '.join(DOC_TYPES)}"
+        )
+    return wanted
+
+@api_router.get("/search")
+async def search_corpus(
+    request: Request,
+    q: str = Query(..., description="Search query"),
+    types: Optional[str] = Query(None, description="Comma-separated types: orisha, proverb, folktale"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of hits"),
+    offset: int = Query(0, ge=0, description="Number of hits to skip"),
+    fuzzy: bool = Query(True, description="Fall back to words within a typo or two")
+):
+    """BM25-ranked search across Òrìṣà, proverbs and folktales with highlights and facet counts"""
+    wanted = parse_types(types)
+    key = f"{corpus_version}:corpus:{q}:{types}:{limit}:{offset}:{fuzzy}"
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    headers = {"ETag": make_etag(digest), "Cache-Control": CATALOG_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match", ""), digest):
+        return not_modified(headers["ETag"], CATALOG_CACHE_CONTROL)
     
-    for category_id, category_data in PROVERB_CATEGORIES.items():
-        for proverb in category_data["proverbs"]:
-            # Search in all fields
-            if (search_term in proverb["yoruba"].lower() or 
-                search_term in proverb["literal"].lower() or
-                search_term in proverb["meaning"].lower() or
-                search_term in proverb["context"].lower()):
-                
-                results.append({
-                    "category": category_id,
-                    "category_name": category_data["name"],
-                    "proverb": proverb
-                })
+    results = corpus_index.search(q, types=wanted, limit=limit, offset=offset, fuzzy=fuzzy)
+    return JSONResponse(results, headers=headers)
+
+@api_router.get("/related/{doc_type}/{doc_id}")
+async def get_related(
+    doc_type: str,
+    doc_id: str,
+    request: Request,
+    limit: int = Query(5, ge=1, le=RELATED_TOP_K, description="Maximum number of related entries"),
+    types: Optional[str] = Query(None, description="Comma-separated types to include")
+):
+    """Precomputed "see also" entries for an Òrìṣà, proverb (category-index) or folktale"""
+    wanted = parse_types(types)
+    if related_version != corpus_version:
+        raise HTTPException(status_code=503, detail="Related content is still being indexed",
+                            headers={"Retry-After": "5"})
+    key = f"{corpus_version}:related:{doc_type}:{doc_id}:{limit}:{types}"
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    if etag_matches(request.headers.get("if-none-match", ""), digest):
+        return not_modified(make_etag(digest), CATALOG_CACHE_CONTROL)
     
-    return results
+    related = related_index.related(doc_type, doc_id, limit=limit, types=wanted)
+    if related is None:
+        raise HTTPException(status_code=404, detail="Entry not found")
+    return JSONResponse(
+        {"type": doc_type, "id": doc_id, "related": related},
+        headers={"ETag": make_etag(digest), "Cache-Control": CATALOG_CACHE_CONTROL}
+    )
 
-@api_router.get("/proverbs/daily")
-async def get_daily_proverb():
-    """Get daily Yoruba proverb"""
-    try:
-        model = genai.GenerativeModel('gemini-1.5-flash')
-        
-        prompt = """
-        Provide a traditional Yoruba proverb (òwe) with proper formatting:
+DAILY_PROVERB_PROMPT = """
+        Provide a traditional Yoruba proverb (òwe) for {date} with proper formatting:
         
         Response format (provide ONLY the JSON, no markdown):
         {
@@ -572,171 +474,613 @@ async def get_daily_proverb():
         
         Make sure the response is valid JSON without any markdown formatting.
         """
-        
-        response = model.generate_content(prompt)
-        content = response.text.strip()
-        
-        # Clean the response - remove markdown formatting if present
-        if content.startswith('```json'):
-            content = content[7:]
-        if content.endswith('```'):
-            content = content[:-3]
-        content = content.strip()
-        
-        try:
-            proverb_data = json.loads(content)
-        except json.JSONDecodeError:
-            # Fallback to a predefined proverb if JSON parsing fails
-            proverb_data = {
-                "yoruba": "Ọgbọ́n ọlọ́gbọ́n ni a fi ń sọgbọ́n, afi ọgbọ́n ẹni nìkan dá, á ṣì gbọ́n ni.",
-                "literal_translation": "It is with the wisdom of others that one becomes wise; he who relies on his own wisdom alone remains foolish.",
-                "meaning": "No one is an island; one should seek counsel from others to gain true wisdom.",
-                "usage_context": "Used to encourage collaboration and learning from others' experiences."
-            }
-        
-        return {
-            "proverb": proverb_data,
-            "date": datetime.utcnow().strftime("%Y-%m-%d")
-        }
+
+# Served only when no proverb is cached or stored for the day
+FALLBACK_DAILY_PROVERBS = [
+    {
+        "yoruba": "Ọgbọ́n ọlọ́gbọ́n ni a fi ń sọgbọ́n, afi ọgbọ́n ẹni nìkan dá, á ṣì gbọ́n ni.",
+        "literal_translation": "It is with the wisdom of others that one becomes wise; he who relies on his own wisdom alone remains foolish.",
+        "meaning": "No one is an island; one should seek counsel from others to gain true wisdom.",
+        "usage_context": "Used to encourage collaboration and learning from others' experiences."
+    },
+    {
+        "yoruba": "Ìṣẹ́ l'oògùn ìṣẹ́.",
+        "literal_translation": "Work is the medicine for poverty.",
+        "meaning": "Hard work is the cure for poverty and lack.",
+        "usage_context": "Used to motivate people to work hard and not be lazy."
+    }
+]
+
+async def generate_daily_proverb(date: str) -> Dict[str, str]:
+    """Ask Gemini for a proverb; raises if the response is not valid JSON"""
+    # The date keeps concurrent generations for different days from coalescing
+    content = await llm_gateway.generate(
+        DAILY_PROVERB_PROMPT.replace("{date}", date), priority="daily", kind="proverb"
+    )
     
-    except Exception as e:
-        # Fallback proverb in case of any error
-        return {
-            "proverb": {
-                "yoruba": "Ìṣẹ́ l'oògùn ìṣẹ́.",
-                "literal_translation": "Work is the medicine for poverty.",
-                "meaning": "Hard work is the cure for poverty and lack.",
-                "usage_context": "Used to motivate people to work hard and not be lazy."
-            },
-            "date": datetime.utcnow().strftime("%Y-%m-%d")
-        }
+    # Clean the response - remove markdown formatting if present
+    if content.startswith('```json'):
+        content = content[7:]
+    if content.endswith('```'):
+        content = content[:-3]
+    content = content.strip()
+    
+    return json.loads(content)
+
+def fallback_daily_proverb(day_number: int) -> Dict[str, str]:
+    """Pick a stored corpus proverb for the day when nothing was generated"""
+    proverbs = [p for category in PROVERB_CATEGORIES.values() for p in category["proverbs"]]
+    if not proverbs:
+        return FALLBACK_DAILY_PROVERBS[day_number % len(FALLBACK_DAILY_PROVERBS)]
+    proverb = proverbs[day_number % len(proverbs)]
+    return {
+        "yoruba": proverb["yoruba"],
+        "literal_translation": proverb["literal"],
+        "meaning": proverb["meaning"],
+        "usage_context": proverb["context"]
+    }
+
+daily_proverb_store = DailyProverbStore(
+    db.daily_proverbs,
+    generate_daily_proverb,
+    days_ahead=int(os.environ.get('DAILY_PROVERB_DAYS_AHEAD', '7')),
+    failure_ttl=float(os.environ.get('DAILY_PROVERB_RETRY_SECONDS', '60')),
+    claim_seconds=float(os.environ.get('DAILY_PROVERB_CLAIM_SECONDS', '120'))
+)
+
+@api_router.get("/proverbs/daily")
+async def get_daily_proverb():
+    """Get daily Yoruba proverb"""
+    today = utc_date()
+    proverb_data = await daily_proverb_store.get(today)
+    if proverb_data is None:
+        proverb_data = fallback_daily_proverb(datetime.utcnow().toordinal())
+    
+    return {
+        "proverb": proverb_data,
+        "date": today
+    }
 
 @api_router.get("/folktales")
-async def get_folktales():
+async def get_folktales(
+    request: Request,
+    fields: Optional[str] = FIELDS_QUERY,
+    ids: Optional[str] = IDS_QUERY,
+    cursor: Optional[str] = CURSOR_QUERY,
+    limit: Optional[int] = LIMIT_QUERY
+):
     """Get all Ìjàpá folktales"""
-    tales = []
-    for story_id, data in IJAPA_STORIES.items():
-        tales.append({
-            "id": story_id,
-            **data
-        })
-    return tales
+    return listing_response(request, "folktales", fields, ids, cursor, limit)
+
+@api_router.get("/folktales/search")
+async def search_folktales(
+    request: Request,
+    response: Response,
+    q: str = Query(..., description="Search query"),
+    limit: int = Query(20, ge=1, le=200, description="Maximum number of results"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    fuzzy: bool = Query(True, description="Also match words within a typo or two")
+):
+    """Search folktale titles, summaries and characters, tolerating typos"""
+    return indexed_search(request, response, folktale_index, "folktales", q, limit, offset, fuzzy)
 
 @api_router.get("/folktales/{story_id}")
-async def get_folktale(story_id: str):
+async def get_folktale(story_id: str, request: Request):
     """Get specific folktale"""
-    if story_id not in IJAPA_STORIES:
-        raise HTTPException(status_code=404, detail="Folktale not found")
+    return catalog_response(request, f"folktale:{story_id}", "Folktale not found")
+
+# On-disk tier shared by every worker on this host; LOCAL_CACHE_PATH= disables it.
+# Cultural content and the daily proverb do not use it: they share through
+# MongoDB, where empty cells, daily dates and stale refreshes are claimed by
+# one worker, so each is generated once and every worker serves the same text
+local_cache_path = os.environ.get(
+    'LOCAL_CACHE_PATH', str(Path(tempfile.gettempdir()) / f"{os.environ['DB_NAME']}_cache.sqlite3")
+)
+local_cache = SQLiteCache(
+    local_cache_path,
+    ttl=float(os.environ.get('LOCAL_CACHE_TTL_SECONDS', str(24 * 3600))),
+    max_entries=int(os.environ.get('LOCAL_CACHE_MAX_ENTRIES', '100000'))
+) if local_cache_path else None
+
+translation_cache = TieredCache(
+    TTLCache(
+        max_size=int(os.environ.get('TRANSLATION_CACHE_SIZE', '2048')),
+        ttl=float(os.environ.get('TRANSLATION_CACHE_TTL_SECONDS', '3600'))
+    ),
+    MongoCache(
+        db.translation_cache,
+        ttl=float(os.environ.get('TRANSLATION_CACHE_SHARED_TTL_SECONDS', str(30 * 24 * 3600)))
+    ),
+    local=local_cache
+)
+
+def normalize_text(text: str) -> str:
+    """NFC-normalize and collapse whitespace so equivalent inputs share a cache key"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+def translation_cache_key(text: str, target_language: str) -> str:
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"translate:{target_language.lower()}:{digest}"
+
+def build_translation_prompt(text: str, target_language: str) -> str:
+    if target_language.lower() == "yoruba":
+        return f"""
+        Translate the following English text to Yoruba with proper diacritics and cultural context.
+        Make sure to preserve the cultural and spiritual meaning.
+        
+        Text: {text}
+        
+        Please provide only the Yoruba translation with proper tone marks and diacritics.
+        """
+    else:
+        return f"""
+        Translate the following Yoruba text to English while preserving the cultural and spiritual meaning.
+        
+        Text: {text}
+        
+        Please provide only the English translation that captures the cultural context.
+        """
+
+# Admin-only routes are disabled unless ADMIN_TOKEN is set
+async def require_admin(x_admin_token: Optional[str] = Header(None)):
+    admin_token = os.environ.get('ADMIN_TOKEN')
+    if not admin_token:
+        raise HTTPException(status_code=403, detail="Admin API is disabled")
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token, admin_token):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+def llm_unavailable(detail: str) -> HTTPException:
+    """Fast-fail response while the LLM circuit breaker is open"""
+    retry_after = int(llm_gateway.breaker.cooldown_seconds)
+    return HTTPException(status_code=503, detail=detail, headers={"Retry-After": str(retry_after)})
+
+async def translate_cached(text: str, target_language: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Translate already-normalized text from the translation memory or cache,
+    going to Gemini only when both miss. Returns the text and any memory match;
+    a near match is only a suggestion next to the full translation."""
+    match = await translation_memory.find(text, target_language)
+    if match is not None and match["match"] != NEAR:
+        return match["translated_text"], match
     
-    return {
-        "id": story_id,
-        **IJAPA_STORIES[story_id]
-    }
+    cache_key = translation_cache_key(text, target_language)
+    translated_text = await translation_cache.get(cache_key)
+    if translated_text is None:
+        translated_text = await llm_gateway.generate(
+            build_translation_prompt(text, target_language), kind="translation"
+        )
+        await translation_cache.set(cache_key, translated_text)
+    return translated_text, match
 
 @api_router.post("/translate", response_model=TranslationResponse)
 async def translate_text(request: TranslationRequest):
     """Translate text between Yoruba and English using Gemini"""
     try:
-        model = genai.GenerativeModel('gemini-1.5-flash')
-        
-        if request.target_language.lower() == "yoruba":
-            prompt = f"""
-            Translate the following English text to Yoruba with proper diacritics and cultural context.
-            Make sure to preserve the cultural and spiritual meaning.
-            
-            Text: {request.text}
-            
-            Please provide only the Yoruba translation with proper tone marks and diacritics.
-            """
-        else:
-            prompt = f"""
-            Translate the following Yoruba text to English while preserving the cultural and spiritual meaning.
-            
-            Text: {request.text}
-            
-            Please provide only the English translation that captures the cultural context.
-            """
-        
-        response = model.generate_content(prompt)
-        translated_text = response.text.strip()
+        translated_text, match = await translate_cached(normalize_text(request.text), request.target_language)
         
         return TranslationResponse(
             original_text=request.text,
             translated_text=translated_text,
-            language=request.target_language
+            language=request.target_language,
+            memory_match=match
         )
     
+    except LLMUnavailableError as e:
+        raise llm_unavailable(f"Translation error: {str(e)}")
+    except LLMTimeoutError as e:
+        raise HTTPException(status_code=504, detail=f"Translation error: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Translation error: {str(e)}")
 
+TRANSLATION_BATCH_MAX_ITEMS = int(os.environ.get('TRANSLATION_BATCH_MAX_ITEMS', '100'))
+TRANSLATION_BATCH_CONCURRENCY = int(os.environ.get('TRANSLATION_BATCH_CONCURRENCY', '4'))
+
+@api_router.post("/translate/batch", response_model=TranslationBatchResponse)
+async def translate_batch(request: TranslationBatchRequest):
+    """Translate many texts at once; identical inputs are translated once"""
+    if len(request.items) > TRANSLATION_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch too large: at most {TRANSLATION_BATCH_MAX_ITEMS} items allowed"
+        )
+    
+    # Dedupe on the same normalization the cache uses
+    keys = [(normalize_text(item.text), item.target_language.lower()) for item in request.items]
+    unique = list(dict.fromkeys(keys))
+    
+    semaphore = asyncio.Semaphore(TRANSLATION_BATCH_CONCURRENCY)
+    
+    async def translate_one(text: str, target_language: str) -> str:
+        async with semaphore:
+            return await translate_cached(text, target_language)
+    
+    outcomes = await asyncio.gather(
+        *(translate_one(text, target_language) for text, target_language in unique),
+        return_exceptions=True
+    )
+    translated = dict(zip(unique, outcomes))
+    
+    results = []
+    for item, key in zip(request.items, keys):
+        outcome = translated[key]
+        if isinstance(outcome, Exception):
+            results.append(TranslationBatchItem(
+                original_text=item.text,
+                language=item.target_language,
+                error=f"Translation error: {str(outcome)}"
+            ))
+        else:
+            translated_text, match = outcome
+            results.append(TranslationBatchItem(
+                original_text=item.text,
+                translated_text=translated_text,
+                language=item.target_language,
+                memory_match=match
+            ))
+    
+    return TranslationBatchResponse(results=results)
+
+@api_router.post("/translate/accept", status_code=201, dependencies=[Depends(require_admin)])
+async def accept_translation(request: TranslationAcceptRequest):
+    """Add a reviewed translation to the translation memory"""
+    original_text = normalize_text(request.original_text)
+    translated_text = request.translated_text.strip()
+    if not original_text or not translated_text:
+        raise HTTPException(status_code=400, detail="Both texts are required")
+    try:
+        await translation_memory.accept(original_text, translated_text, request.language)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Could not store translation: {str(e)}")
+    return {"original_text": original_text, "translated_text": translated_text, "language": request.language}
+
+@api_router.get("/cache/stats")
+async def get_cache_stats():
+    """Hit/miss counters for the generation caches"""
+    return {
+        "translation": translation_cache.snapshot(),
+        "cultural_content": cultural_content_matrix.stats(),
+        "translation_memory": translation_memory.snapshot(),
+        "generation_store": generation_store.snapshot(),
+        "llm": llm_gateway.snapshot()
+    }
+
+def build_cultural_prompt(orisha_name: str, content_type: str) -> str:
+    if content_type == "story":
+        return f"""
+        Generate a traditional Yoruba story about {orisha_name} that would be appropriate for 
+        a cultural education app. The story should be:
+        - Culturally authentic and respectful
+        - Suitable for all ages
+        - Include moral lessons
+        - Written in engaging narrative style
+        
+        Provide both English and Yoruba versions.
+        """
+    elif content_type == "praise":
+        return f"""
+        Generate traditional Yoruba praise poetry (oríkì) for {orisha_name}.
+        Include proper diacritics and cultural context.
+        Provide both Yoruba and English translations.
+        """
+    else:
+        return f"""
+        Generate historical and cultural information about {orisha_name} including:
+        - Historical significance
+        - Cultural practices
+        - Regional variations
+        - Modern relevance
+        
+        Make it educational and respectful.
+        """
+
+async def generate_cultural_text(orisha_name: str, content_type: str) -> str:
+    return await llm_gateway.generate(
+        build_cultural_prompt(orisha_name, content_type), priority="bulk", kind=content_cell_type(content_type)
+    )
+
+cultural_content_matrix = CulturalContentMatrix(
+    db.cultural_content,
+    generate_cultural_text,
+    version=os.environ.get('CULTURAL_CONTENT_VERSION', '1'),
+    variants=int(os.environ.get('CULTURAL_CONTENT_VARIANTS', '1')),
+    max_age_seconds=float(os.environ.get('CULTURAL_CONTENT_MAX_AGE_SECONDS', str(7 * 24 * 3600))),
+    claim_seconds=float(os.environ.get('CULTURAL_CONTENT_CLAIM_SECONDS', '300'))
+)
+
+def resolve_orisha_id(orisha_name: str) -> Optional[str]:
+    """Match a free-text Òrìṣà name against ORISHA_DATA keys and display names"""
+    key = orisha_name.strip().lower()
+    if key in ORISHA_DATA:
+        return key
+    name = unicodedata.normalize("NFC", orisha_name.strip())
+    for orisha_id, data in ORISHA_DATA.items():
+        if name in (data["name"], data["yoruba_name"]):
+            return orisha_id
+    return None
+
+def static_cultural_content(orisha_name: str, content_type: str) -> Optional[Dict[str, Any]]:
+    """Degraded response built from the corpus while Gemini is unavailable"""
+    orisha_id = resolve_orisha_id(orisha_name)
+    if orisha_id is None:
+        return None
+    data = ORISHA_DATA[orisha_id]
+    return {
+        "orisha_name": orisha_name,
+        "content_type": content_type,
+        "content": f"{data['story']}\n\n{data['yoruba_story']}",
+        "generated_at": datetime.utcnow().isoformat(),
+        "degraded": True
+    }
+
 @api_router.post("/cultural-content", response_model=Dict[str, Any])
 async def generate_cultural_content(request: CulturalContentRequest):
     """Generate culturally appropriate content using Gemini"""
     try:
-        model = genai.GenerativeModel('gemini-1.5-flash')
-        
         orisha_name = request.orisha_name
         content_type = request.content_type
         
-        if content_type == "story":
-            prompt = f"""
-            Generate a traditional Yoruba story about {orisha_name} that would be appropriate for 
-            a cultural education app. The story should be:
-            - Culturally authentic and respectful
-            - Suitable for all ages
-            - Include moral lessons
-            - Written in engaging narrative style
-            
-            Provide both English and Yoruba versions.
-            """
-        elif content_type == "praise":
-            prompt = f"""
-            Generate traditional Yoruba praise poetry (oríkì) for {orisha_name}.
-            Include proper diacritics and cultural context.
-            Provide both Yoruba and English translations.
-            """
+        orisha_id = resolve_orisha_id(orisha_name)
+        if orisha_id is not None:
+            # Known Òrìṣà are served from the pre-generated matrix
+            entry = await cultural_content_matrix.ensure(
+                orisha_id, ORISHA_DATA[orisha_id]["name"], content_cell_type(content_type)
+            )
+            content = entry["content"]
+            generated_at = entry["generated_at"]
         else:
-            prompt = f"""
-            Generate historical and cultural information about {orisha_name} including:
-            - Historical significance
-            - Cultural practices
-            - Regional variations
-            - Modern relevance
-            
-            Make it educational and respectful.
-            """
-        
-        response = model.generate_content(prompt)
-        content = response.text.strip()
+            content = await generate_cultural_text(orisha_name, content_type)
+            generated_at = datetime.utcnow()
         
         return {
             "orisha_name": orisha_name,
             "content_type": content_type,
             "content": content,
-            "generated_at": datetime.utcnow().isoformat()
+            "generated_at": generated_at.isoformat()
         }
     
+    except LLMUnavailableError as e:
+        fallback = static_cultural_content(orisha_name, content_type)
+        if fallback is None:
+            raise llm_unavailable(f"Content generation error: {str(e)}")
+        return fallback
+    except LLMTimeoutError as e:
+        raise HTTPException(status_code=504, detail=f"Content generation error: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Content generation error: {str(e)}")
 
+# Streaming (Server-Sent Events) variants of the generative routes
+def sse_event(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+def sse_response(events) -> StreamingResponse:
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@api_router.post("/translate/stream")
+async def translate_text_stream(request: TranslationRequest):
+    """Stream a translation as Server-Sent Events while Gemini generates it"""
+    text = normalize_text(request.text)
+    cache_key = translation_cache_key(text, request.target_language)
+    
+    async def events():
+        match = await translation_memory.find(text, request.target_language)
+        if match is not None and match["match"] != NEAR:
+            translated_text = match["translated_text"]
+        else:
+            translated_text = await translation_cache.get(cache_key)
+        if translated_text is None:
+            parts = []
+            try:
+                prompt = build_translation_prompt(text, request.target_language)
+                async for chunk in llm_gateway.stream(prompt, kind="translation"):
+                    parts.append(chunk)
+                    yield sse_event({"text": chunk})
+            except Exception as e:
+                yield sse_event({"detail": f"Translation error: {str(e)}"}, event="error")
+                return
+            translated_text = "".join(parts).strip()
+            await translation_cache.set(cache_key, translated_text)
+        else:
+            yield sse_event({"text": translated_text})
+        
+        yield sse_event(TranslationResponse(
+            original_text=request.text,
+            translated_text=translated_text,
+            language=request.target_language,
+            memory_match=match
+        ).model_dump(), event="done")
+    
+    return sse_response(events())
+
+@api_router.post("/cultural-content/stream")
+async def generate_cultural_content_stream(request: CulturalContentRequest):
+    """Stream cultural content as Server-Sent Events while Gemini generates it"""
+    orisha_name = request.orisha_name
+    content_type = request.content_type
+    orisha_id = resolve_orisha_id(orisha_name)
+    cell_type = content_cell_type(content_type)
+    
+    async def events():
+        entry = None
+        if orisha_id is not None:
+            entry = cultural_content_matrix.get(orisha_id, cell_type)
+        
+        if entry is not None:
+            content = entry["content"]
+            generated_at = entry["generated_at"]
+            yield sse_event({"text": content})
+        else:
+            parts = []
+            try:
+                prompt = build_cultural_prompt(orisha_name, content_type)
+                async for chunk in llm_gateway.stream(prompt, priority="bulk", kind=cell_type):
+                    parts.append(chunk)
+                    yield sse_event({"text": chunk})
+            except LLMUnavailableError as e:
+                fallback = static_cultural_content(orisha_name, content_type)
+                if fallback is None:
+                    yield sse_event({"detail": f"Content generation error: {str(e)}"}, event="error")
+                else:
+                    yield sse_event({"text": fallback["content"]})
+                    yield sse_event(fallback, event="done")
+                return
+            except Exception as e:
+                yield sse_event({"detail": f"Content generation error: {str(e)}"}, event="error")
+                return
+            content = "".join(parts).strip()
+            generated_at = datetime.utcnow()
+            if orisha_id is not None:
+                await cultural_content_matrix.put(
+                    orisha_id, ORISHA_DATA[orisha_id]["name"], cell_type, content
+                )
+        
+        yield sse_event({
+            "orisha_name": orisha_name,
+            "content_type": content_type,
+            "content": content,
+            "generated_at": generated_at.isoformat()
+        }, event="done")
+    
+    return sse_response(events())
+
+# Bulk corpus transfer
+CORPUS_SCHEMAS = {
+    ORISHA: (OrishaProfile, "id"),
+    PROVERB_CATEGORY: (ProverbCategory, "category"),
+    FOLKTALE: (FolktaleStory, "id"),
+}
+CORPUS_TRANSFER_BATCH_SIZE = int(os.environ.get('CORPUS_TRANSFER_BATCH_SIZE', '500'))
+
+@api_router.get("/admin/export", dependencies=[Depends(require_admin)])
+async def export_corpus():
+    """Stream every Òrìṣà, proverb category and folktale as NDJSON"""
+    return StreamingResponse(
+        export_lines(db, batch_size=CORPUS_TRANSFER_BATCH_SIZE),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": 'attachment; filename="corpus.ndjson"'}
+    )
+
+@api_router.post("/admin/import", dependencies=[Depends(require_admin)])
+async def import_corpus(request: Request):
+    """Validate and upsert an NDJSON corpus stream in bounded batches"""
+    try:
+        result = await import_lines(
+            db, ndjson_lines(request.stream()), CORPUS_SCHEMAS, batch_size=CORPUS_TRANSFER_BATCH_SIZE
+        )
+    except TransferError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Corpus import failed: {str(e)}")
+    finally:
+        # Every worker reloads its snapshot on its next poll or change event,
+        # including after a failure part way through
+        await corpus_store.bump_version()
+    return result
+
+background_tasks: List[asyncio.Task] = []
+
+async def start_background_jobs():
+    db.connect()
+    background_tasks.append(asyncio.create_task(ensure_related_index()))
+    if os.environ.get('LLM_PREWARM', 'true').lower() == 'true':
+        background_tasks.append(asyncio.create_task(llm_gateway.prepare()))
+    background_tasks.append(
+        asyncio.create_task(corpus_store.run(SEED_CORPUS, apply_corpus_snapshot))
+    )
+    background_tasks.append(asyncio.create_task(translation_cache.ensure_indexes()))
+    # Picks up translations accepted on other workers
+    memory_reload_seconds = float(os.environ.get('TRANSLATION_MEMORY_RELOAD_SECONDS', '60'))
+    background_tasks.append(asyncio.create_task(translation_memory.run(memory_reload_seconds)))
+    background_tasks.append(asyncio.create_task(generation_store.run()))
+    refresh_seconds = float(os.environ.get('DAILY_PROVERB_REFRESH_SECONDS', '21600'))
+    background_tasks.append(
+        asyncio.create_task(daily_proverb_store.run_prefill(refresh_seconds))
+    )
+    if os.environ.get('CULTURAL_CONTENT_WARMUP', 'true').lower() == 'true':
+        def orishas():
+            return [(orisha_id, data["name"]) for orisha_id, data in ORISHA_DATA.items()]
+        warmup_seconds = float(os.environ.get('CULTURAL_CONTENT_WARMUP_INTERVAL_SECONDS', '3600'))
+        background_tasks.append(
+            asyncio.create_task(cultural_content_matrix.run_warmup(orishas, warmup_seconds))
+        )
+
+async def shutdown_db_client():
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await generation_store.close()
+    if local_cache is not None:
+        local_cache.close()
+    db.close()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Nothing here waits on an upstream, so the catalog routes serve at once
+    await start_background_jobs()
+    try:
+        yield
+    finally:
+        await shutdown_db_client()
+
+READINESS_TIMEOUT_SECONDS = float(os.environ.get('READINESS_TIMEOUT_SECONDS', '2'))
+
+@api_router.get("/ready")
+async def readiness():
+    """Report whether MongoDB and Gemini are ready; 503 until both are"""
+    mongo = {"connected": db.connected, "ready": False}
+    if db.connected:
+        try:
+            await asyncio.wait_for(db.ping(), timeout=READINESS_TIMEOUT_SECONDS)
+            mongo["ready"] = True
+        except Exception as e:
+            mongo["error"] = str(e) or type(e).__name__
+    llm_lazy = os.environ.get('LLM_PREWARM', 'true').lower() != 'true'
+    llm = {
+        "initialized": llm_gateway.ready,
+        "ready": llm_gateway.ready or llm_lazy,
+        "circuit": llm_gateway.breaker.state
+    }
+    ready = mongo["ready"] and llm["ready"]
+    return JSONResponse(
+        {
+            "ready": ready,
+            "mongodb": mongo,
+            "llm": llm,
+            "corpus": {"loaded_from_mongodb": corpus_loaded, "version": corpus_version}
+        },
+        status_code=200 if ready else 503
+    )
+
+# Create the main app without a prefix
+app = FastAPI(lifespan=lifespan)
+
 # Include the router in the main app
 app.include_router(api_router)
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus text exposition of request, Gemini and MongoDB metrics"""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    # Pagination metadata for the catalog and search routes
+    expose_headers=["X-Total-Count", "X-Next-Cursor"],
 )
 
+# Added last so it wraps everything, including CORS preflight responses
+app.add_middleware(MetricsMiddleware)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
-
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()
\ No newline at end of file
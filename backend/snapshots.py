@@ -0,0 +1,106 @@
+"""Pre-rendered, pre-compressed JSON bodies for the static catalog routes.
+
+The corpus only changes when it is reloaded, so catalog responses are
+serialized once into bytes (plus gzip and, when available, brotli variants)
+and each request just picks the variant matching ``Accept-Encoding``.
+Each body carries a strong ETag derived from its content, so repeat requests
+with a matching ``If-None-Match`` get an empty 304.
+"""
+import gzip
+import hashlib
+import json
+from typing import Any, Dict, Mapping, Optional
+
+from starlette.responses import Response
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+
+class RenderedJSON:
+    """A JSON payload serialized once with its compressed variants."""
+
+    __slots__ = ("identity", "gzip", "br", "digest")
+
+    def __init__(self, payload: Any):
+        self.identity = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.gzip = gzip.compress(self.identity, compresslevel=9, mtime=0)
+        self.br: Optional[bytes] = brotli.compress(self.identity) if brotli is not None else None
+        self.digest = hashlib.sha256(self.identity).hexdigest()[:32]
+
+
+def make_etag(digest: str, encoding: Optional[str] = None) -> str:
+    """Strong ETag for one representation; each encoding gets its own tag."""
+    return f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+
+
+def etag_matches(if_none_match: str, digest: str) -> bool:
+    """Weak comparison of ``If-None-Match`` against any encoding of ``digest``."""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        tag = tag.strip('"')
+        if tag == digest or tag.startswith(f"{digest}-"):
+            return True
+    return False
+
+
+def not_modified(etag: str, cache_control: Optional[str] = None) -> Response:
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return Response(status_code=304, headers=headers)
+
+
+def accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """Parse an ``Accept-Encoding`` header into ``{coding: qvalue}``."""
+    encodings = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        encodings[coding.strip().lower()] = q
+    return encodings
+
+
+def snapshot_response(
+    rendered: RenderedJSON,
+    request_headers: Mapping[str, str],
+    cache_control: Optional[str] = None,
+) -> Response:
+    """Build a response from ``rendered`` using the best accepted encoding.
+
+    Returns an empty 304 when ``If-None-Match`` already names this content.
+    """
+    encodings = accepted_encodings(request_headers.get("accept-encoding", ""))
+    if rendered.br is not None and encodings.get("br", 0) > 0:
+        encoding, body = "br", rendered.br
+    elif encodings.get("gzip", 0) > 0:
+        encoding, body = "gzip", rendered.gzip
+    else:
+        encoding, body = None, rendered.identity
+
+    etag = make_etag(rendered.digest, encoding)
+    if etag_matches(request_headers.get("if-none-match", ""), rendered.digest):
+        return not_modified(etag, cache_control)
+
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return Response(content=body, media_type="application/json", headers=headers)
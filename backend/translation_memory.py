@@ -0,0 +1,243 @@
+"""Translation memory built from the corpus's aligned Yoruba/English pairs.
+
+Proverbs (``yoruba``/``literal``), Òrìṣà stories (``yoruba_story``/``story``)
+and folktale titles (``title_yoruba``/``title``) are already translated, as
+are translations admins have accepted (stored in MongoDB). A lookup answers
+at once when the input is a stored segment: either the exact text, ignoring
+case, spacing and surrounding punctuation, or the same folded text, so input
+typed without tone marks still finds its segment. Otherwise it returns the
+closest stored segment above ``min_similarity`` as a near match (inputs
+longer than ``NEAR_MATCH_MAX_CHARS`` only get exact lookups). A near
+match may differ by a word such as "not", so callers still ask Gemini and
+only offer the near match as a suggestion.
+"""
+import asyncio
+import logging
+import unicodedata
+from collections import defaultdict
+from datetime import datetime
+from difflib import SequenceMatcher
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from search import tokenize
+
+logger = logging.getLogger(__name__)
+
+YORUBA = "yoruba"
+ENGLISH = "english"
+
+CORPUS = "corpus"
+ACCEPTED = "accepted"
+
+EXACT = "exact"
+FOLDED = "folded"
+NEAR = "near"
+
+# Similarity is only computed for the segments sharing the most words
+NEAR_MATCH_CANDIDATES = 20
+# Longer input skips near matching; SequenceMatcher is quadratic in length
+NEAR_MATCH_MAX_CHARS = 600
+PUNCTUATION = " \t\n.,;:!?\"'“”‘’()[]-–—"
+
+
+def exact_key(text: str) -> str:
+    text = " ".join(unicodedata.normalize("NFC", text).split())
+    return text.strip(PUNCTUATION).casefold()
+
+
+def corpus_pairs(
+    orishas: Dict[str, Dict[str, Any]],
+    proverb_categories: Dict[str, Dict[str, Any]],
+    folktales: Dict[str, Dict[str, Any]],
+) -> List[Tuple[str, str]]:
+    """Aligned ``(yoruba, english)`` pairs found in the corpus."""
+    pairs = []
+    for category in proverb_categories.values():
+        for proverb in category.get("proverbs", []):
+            pairs.append((proverb.get("yoruba"), proverb.get("literal")))
+    for data in orishas.values():
+        pairs.append((data.get("yoruba_story"), data.get("story")))
+    for story in folktales.values():
+        pairs.append((story.get("title_yoruba"), story.get("title")))
+    return [(yoruba, english) for yoruba, english in pairs if yoruba and english]
+
+
+class TranslationMemory:
+    """In-memory segment index; accepted translations persist in ``collection``."""
+
+    def __init__(self, collection, min_similarity: float = 0.9):
+        self._collection = collection
+        self.min_similarity = min_similarity
+        # origin -> [(source, target, target_language)]
+        self._segments: Dict[str, List[Tuple[str, str, str]]] = {CORPUS: [], ACCEPTED: []}
+        self._exact: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._folded: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._entries: List[Dict[str, Any]] = []
+        self._tokens: Dict[Tuple[str, str], Set[int]] = defaultdict(set)
+        self.stats: Dict[str, int] = {"exact_hits": 0, "folded_hits": 0, "near_hits": 0, "misses": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load_corpus(self, pairs: Iterable[Tuple[str, str]]):
+        """Replace the corpus segments (both directions) and rebuild the index."""
+        segments = []
+        for yoruba, english in pairs:
+            segments.append((english, yoruba, YORUBA))
+            segments.append((yoruba, english, ENGLISH))
+        self._segments[CORPUS] = segments
+        self._rebuild()
+
+    async def ensure_indexes(self):
+        try:
+            await self._collection.create_index("target_language")
+        except Exception as e:
+            logger.warning("Could not create translation memory index: %s", e)
+
+    async def load(self):
+        """Load accepted translations stored by any worker."""
+        try:
+            accepted = []
+            async for doc in self._collection.find({}).sort("accepted_at", 1):
+                accepted.append((doc["source"], doc["target"], doc["target_language"]))
+        except Exception as e:
+            logger.warning("Could not load translation memory: %s", e)
+            return
+        if accepted != self._segments[ACCEPTED]:
+            self._segments[ACCEPTED] = accepted
+            self._rebuild()
+
+    async def run(self, interval: float):
+        """Background loop picking up translations accepted on other workers."""
+        await self.ensure_indexes()
+        while True:
+            await self.load()
+            await asyncio.sleep(interval)
+
+    async def accept(self, source: str, target: str, target_language: str):
+        """Store a reviewed translation and make it available at once."""
+        target_language = target_language.lower()
+        await self._collection.replace_one(
+            {"_id": f"{target_language}:{exact_key(source)}"},
+            {
+                "source": source,
+                "target": target,
+                "target_language": target_language,
+                "accepted_at": datetime.utcnow(),
+            },
+            upsert=True,
+        )
+        self._segments[ACCEPTED].append((source, target, target_language))
+        self._add(source, target, target_language, ACCEPTED)
+
+    def _rebuild(self):
+        self._exact = {}
+        self._folded = {}
+        self._entries = []
+        self._tokens = defaultdict(set)
+        # Accepted translations are added last so they win exact-key ties
+        for origin in (CORPUS, ACCEPTED):
+            for source, target, target_language in self._segments[origin]:
+                self._add(source, target, target_language, origin)
+
+    def _add(self, source: str, target: str, target_language: str, origin: str):
+        entry_id = len(self._entries)
+        entry = {
+            "source": source,
+            "target": target,
+            "target_language": target_language,
+            "origin": origin,
+            "folded": " ".join(tokenize(source)),
+        }
+        self._entries.append(entry)
+        self._exact[(target_language, exact_key(source))] = entry
+        self._folded[(target_language, entry["folded"])] = entry
+        for token in set(entry["folded"].split()):
+            self._tokens[(target_language, token)].add(entry_id)
+
+    def lookup(self, text: str, target_language: str) -> Optional[Dict[str, Any]]:
+        """Best stored translation for ``text``, or ``None`` below ``min_similarity``.
+
+        Returns ``{"translated_text", "source_text", "match", "score", "origin"}``
+        where ``match`` is ``EXACT`` or ``FOLDED`` when ``text`` is a stored
+        segment, and ``NEAR`` when it is only similar to one.
+        """
+        target_language = target_language.lower()
+        match, folded = self._stored(text, target_language)
+        if match is not None:
+            return match
+        return self._near(folded, target_language)
+
+    async def find(self, text: str, target_language: str) -> Optional[Dict[str, Any]]:
+        """``lookup`` for use on the event loop: near matching runs in a thread."""
+        target_language = target_language.lower()
+        match, folded = self._stored(text, target_language)
+        if match is not None:
+            return match
+        return await asyncio.to_thread(self._near, folded, target_language)
+
+    def _stored(self, text: str, target_language: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        entry = self._exact.get((target_language, exact_key(text)))
+        if entry is not None:
+            self.stats["exact_hits"] += 1
+            return self._match(entry, EXACT, 1.0), ""
+
+        folded = " ".join(tokenize(text))
+        entry = self._folded.get((target_language, folded))
+        if entry is not None:
+            self.stats["folded_hits"] += 1
+            return self._match(entry, FOLDED, 1.0), folded
+        return None, folded
+
+    def _near(self, folded: str, target_language: str) -> Optional[Dict[str, Any]]:
+        best, best_score = None, 0.0
+        if len(folded) <= NEAR_MATCH_MAX_CHARS:
+            best, best_score = self._nearest(folded, target_language)
+        if best is None or best_score < self.min_similarity:
+            self.stats["misses"] += 1
+            return None
+        self.stats["near_hits"] += 1
+        return self._match(best, NEAR, best_score)
+
+    def _nearest(self, folded: str, target_language: str) -> Tuple[Optional[Dict[str, Any]], float]:
+        # find() runs this in a worker thread while accept() or a reload may
+        # change the index: hold one generation of it and copy the id sets
+        tokens, entries = self._tokens, self._entries
+        shared: Dict[int, int] = defaultdict(int)
+        for token in set(folded.split()):
+            for entry_id in tuple(tokens.get((target_language, token), ())):
+                shared[entry_id] += 1
+        candidates = sorted(shared, key=lambda entry_id: -shared[entry_id])[:NEAR_MATCH_CANDIDATES]
+
+        # The input is seq2 so SequenceMatcher indexes it once for all candidates
+        matcher = SequenceMatcher(None, autojunk=False)
+        matcher.set_seq2(folded)
+        best, best_score = None, 0.0
+        for entry_id in candidates:
+            candidate = entries[entry_id]
+            # Cheap upper bounds first: only a candidate that could still beat
+            # the threshold and the best so far gets the full ratio()
+            floor = max(self.min_similarity, best_score)
+            length = len(candidate["folded"])
+            if 2 * min(length, len(folded)) / (length + len(folded)) < floor:
+                continue
+            matcher.set_seq1(candidate["folded"])
+            if matcher.quick_ratio() < floor:
+                continue
+            score = matcher.ratio()
+            if score > best_score:
+                best, best_score = candidate, score
+        return best, best_score
+
+    @staticmethod
+    def _match(entry: Dict[str, Any], match: str, score: float) -> Dict[str, Any]:
+        return {
+            "translated_text": entry["target"],
+            "source_text": entry["source"],
+            "match": match,
+            "score": round(score, 4),
+            "origin": entry["origin"],
+        }
+
+    def snapshot(self) -> Dict[str, int]:
+        return {**self.stats, "segments": len(self._entries)}
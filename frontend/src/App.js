@@ -359,7 +359,10 @@ const FolktaleLibrary = ({ onClose }) => {
   const fetchFolktales = async () => {
     setLoading(true);
     try {
-      const response = await axios.get(`${API}/folktales`);
+      // The list only shows summaries; full stories are fetched on selection
+      const response = await axios.get(`${API}/folktales`, {
+        params: { fields: 'title,title_yoruba,summary,characters' }
+      });
       setFolktales(response.data);
     } catch (error) {
       console.error('Error fetching folktales:', error);
@@ -368,8 +371,13 @@ const FolktaleLibrary = ({ onClose }) => {
     }
   };
 
-  const selectTale = (tale) => {
-    setSelectedTale(tale);
+  const selectTale = async (tale) => {
+    try {
+      const response = await axios.get(`${API}/folktales/${tale.id}`);
+      setSelectedTale(response.data);
+    } catch (error) {
+      console.error('Error fetching folktale:', error);
+    }
   };
 
   if (selectedTale) {
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+import cache
+from cache import SQLiteCache, TieredCache, TTLCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache.time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "cache.sqlite3")
+
+
+def run(scenario, *caches):
+    async def wrapped():
+        try:
+            return await scenario()
+        finally:
+            for local in caches:
+                local.close()
+
+    return asyncio.run(wrapped())
+
+
+def test_entries_expire_after_ttl(path, clock):
+    local = SQLiteCache(path, ttl=60)
+
+    async def scenario():
+        await local.set("short", "a", ttl=10)
+        await local.set("default", {"text": "Ẹ káàárọ̀"})
+        clock.now += 30
+        assert await local.get("short") is None
+        assert await local.get("default") == {"text": "Ẹ káàárọ̀"}
+        clock.now += 31
+        assert await local.get("default") is None
+
+    run(scenario, local)
+
+
+def test_least_recently_read_entries_are_evicted(path, clock):
+    local = SQLiteCache(path, max_entries=3, evict_every=1)
+
+    async def scenario():
+        for key in ("a", "b", "c"):
+            await local.set(key, key)
+            clock.now += 1
+        # Reading "a" after TOUCH_INTERVAL makes "b" the least recently read
+        clock.now += SQLiteCache.TOUCH_INTERVAL
+        assert await local.get("a") == "a"
+        await local.set("d", "d")
+        return [await local.get(key) for key in ("a", "b", "c", "d")]
+
+    assert run(scenario, local) == ["a", None, "c", "d"]
+
+
+def test_workers_share_one_file(path, clock):
+    first, second = SQLiteCache(path), SQLiteCache(path)
+
+    async def scenario():
+        await first.set("key", "value")
+        assert await second.get("key") == "value"
+        await second.delete("key")
+        assert await first.get("key") is None
+
+    run(scenario, first, second)
+
+
+def test_local_tier_fills_from_shared_tier(path, clock):
+    class DictTier:
+        def __init__(self, data):
+            self.data = data
+
+        async def get(self, key):
+            return self.data.get(key)
+
+        async def set(self, key, value):
+            self.data[key] = value
+
+    local = SQLiteCache(path)
+    tiered = TieredCache(TTLCache(), shared=DictTier({"key": "value"}), local=local)
+    other_worker = TieredCache(TTLCache(), local=SQLiteCache(path))
+
+    async def scenario():
+        assert await tiered.get("key") == "value"
+        assert await other_worker.get("key") == "value"
+
+    run(scenario, local, other_worker.local)
+    assert tiered.stats["shared_hits"] == 1
+    assert other_worker.stats["local_hits"] == 1
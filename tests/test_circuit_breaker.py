@@ -0,0 +1,121 @@
+import pytest
+
+import circuit_breaker
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", clock)
+    return clock
+
+
+def make_breaker(**kwargs):
+    options = dict(window_seconds=60, min_calls=4, error_rate_threshold=0.5, slow_call_seconds=5,
+                   slow_rate_threshold=0.8, cooldown_seconds=30)
+    options.update(kwargs)
+    return CircuitBreaker(**options)
+
+
+def call(breaker, succeeded=True, latency=0.1):
+    breaker.record(breaker.before_call(), succeeded, latency)
+
+
+def test_stays_closed_below_min_calls(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        call(breaker, succeeded=False)
+    assert breaker.state == CLOSED
+
+
+def test_opens_on_error_rate_and_rejects(clock):
+    breaker = make_breaker()
+    for succeeded in (True, False, True, False):
+        call(breaker, succeeded)
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.snapshot()["rejected"] == 1
+
+
+def test_opens_on_slow_calls(clock):
+    breaker = make_breaker()
+    for _ in range(4):
+        call(breaker, latency=6)
+    assert breaker.state == OPEN
+
+
+def test_old_calls_leave_the_window(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        call(breaker, succeeded=False)
+    clock.now += 61
+    call(breaker, succeeded=False)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_probe_closes_on_success(clock):
+    breaker = make_breaker()
+    for _ in range(4):
+        call(breaker, succeeded=False)
+    clock.now += 31
+    probe = breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    # Only one probe at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record(probe, True, 0.1)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_probe_failure_reopens(clock):
+    breaker = make_breaker()
+    for _ in range(4):
+        call(breaker, succeeded=False)
+    clock.now += 31
+    call(breaker, succeeded=False)
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.snapshot()["opened"] == 2
+
+
+def test_cancelled_probe_frees_the_slot(clock):
+    breaker = make_breaker()
+    for _ in range(4):
+        call(breaker, succeeded=False)
+    clock.now += 31
+    breaker.cancelled(breaker.before_call())
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+
+
+def test_calls_from_before_the_circuit_opened_are_ignored(clock):
+    breaker = make_breaker(min_calls=2)
+    first, second, third = (breaker.before_call() for _ in range(3))
+    breaker.record(first, False, 0.1)
+    breaker.record(second, False, 0.1)
+    assert breaker.state == OPEN
+    clock.now += 31
+    probe = breaker.before_call()
+
+    # The third call was admitted while closed; its success is not the probe's
+    breaker.record(third, True, 0.1)
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.cancelled(third)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record(probe, True, 0.1)
+    assert breaker.state == CLOSED
@@ -0,0 +1,154 @@
+import asyncio
+import json
+from typing import List
+
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+from pydantic import BaseModel
+
+from corpus import FOLKTALE_COLLECTION, ORISHA_COLLECTION
+from corpus_transfer import (
+    FOLKTALE,
+    MAX_LINE_BYTES,
+    ORISHA,
+    PROVERB_CATEGORY,
+    TransferError,
+    export_lines,
+    import_lines,
+    ndjson_lines,
+)
+
+
+class Orisha(BaseModel):
+    id: str
+    name: str
+    domains: List[str] = []
+
+
+class ProverbCategory(BaseModel):
+    category: str
+    name: str
+    proverbs: List[dict] = []
+
+
+class Folktale(BaseModel):
+    id: str
+    title: str
+
+
+SCHEMAS = {
+    ORISHA: (Orisha, "id"),
+    PROVERB_CATEGORY: (ProverbCategory, "category"),
+    FOLKTALE: (Folktale, "id"),
+}
+
+
+class RecordingDatabase:
+    """Passes collections through, recording the size of every bulk write."""
+
+    def __init__(self, db):
+        self._db = db
+        self.writes = []
+
+    def __getitem__(self, name):
+        collection = self._db[name]
+        database = self
+
+        class Recording:
+            def __getattr__(self, attr):
+                return getattr(collection, attr)
+
+            async def bulk_write(self, requests, **kwargs):
+                database.writes.append((name, len(requests)))
+                return await collection.bulk_write(requests, **kwargs)
+
+        return Recording()
+
+
+def line(**entry) -> bytes:
+    return json.dumps(entry, ensure_ascii=False).encode("utf-8")
+
+
+async def stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def collect(lines):
+    return [line async for line in lines]
+
+
+def test_export_import_round_trip():
+    async def scenario():
+        source = AsyncMongoMockClient()["source"]
+        await import_lines(source, stream(
+            line(type=ORISHA, id="sango", name="Ṣàngó", domains=["thunder"]),
+            line(type=PROVERB_CATEGORY, id="wisdom", name="Ọgbọ́n", proverbs=[{"yoruba": "Ìwà l'ẹwà"}]),
+            line(type=FOLKTALE, id="ijapa", title="Ìjàpá"),
+        ), SCHEMAS)
+        exported = await collect(export_lines(source))
+
+        target = AsyncMongoMockClient()["target"]
+        result = await import_lines(target, stream(*exported), SCHEMAS)
+        assert result == {"imported": {ORISHA: 1, PROVERB_CATEGORY: 1, FOLKTALE: 1}, "invalid": 0, "errors": []}
+        assert await collect(export_lines(target)) == exported
+        return exported
+
+    exported = asyncio.run(scenario())
+    assert json.loads(exported[0]) == {"type": ORISHA, "id": "sango", "name": "Ṣàngó", "domains": ["thunder"]}
+
+
+def test_invalid_lines_are_reported_and_not_written():
+    async def scenario():
+        db = AsyncMongoMockClient()["test"]
+        result = await import_lines(db, stream(
+            line(type=ORISHA, id="sango", name="Ṣàngó"),
+            b"{not json",
+            line(type="deity", id="x", name="X"),
+            line(type=ORISHA, name="No id"),
+            line(type=FOLKTALE, id="ijapa"),
+            b"",
+        ), SCHEMAS)
+        assert result["imported"][ORISHA] == 1
+        assert result["invalid"] == 4
+        assert [error["line"] for error in result["errors"]] == [2, 3, 4, 5]
+        assert "unknown type" in result["errors"][1]["error"]
+        assert await db[FOLKTALE_COLLECTION].count_documents({}) == 0
+        assert [doc["_id"] async for doc in db[ORISHA_COLLECTION].find()] == ["sango"]
+
+    asyncio.run(scenario())
+
+
+def test_batches_flush_at_batch_size():
+    async def scenario():
+        db = RecordingDatabase(AsyncMongoMockClient()["test"])
+        lines = [line(type=ORISHA, id=f"o{i}", name=f"O{i}") for i in range(7)]
+        lines.append(line(type=FOLKTALE, id="ijapa", title="Ìjàpá"))
+        result = await import_lines(db, stream(*lines), SCHEMAS, batch_size=3)
+        assert result["imported"][ORISHA] == 7
+        return db.writes
+
+    writes = asyncio.run(scenario())
+    assert writes == [
+        (ORISHA_COLLECTION, 3), (ORISHA_COLLECTION, 3), (ORISHA_COLLECTION, 1), (FOLKTALE_COLLECTION, 1)
+    ]
+
+
+def test_line_split_across_chunks():
+    async def scenario():
+        data = line(type=ORISHA, id="ọ̀ṣun", name="Ọ̀ṣun") + b"\n" + line(type=FOLKTALE, id="a", title="A")
+        # Split inside a multi-byte character and right before a newline
+        chunks = [data[:9], data[9:data.index(b"\n")], data[data.index(b"\n"):]]
+        return await collect(ndjson_lines(stream(*chunks)))
+
+    lines = asyncio.run(scenario())
+    assert [json.loads(raw)["id"] for raw in lines] == ["ọ̀ṣun", "a"]
+
+
+def test_oversized_line_is_rejected():
+    async def scenario():
+        chunks = [b"x" * (MAX_LINE_BYTES // 2)] * 3
+        await collect(ndjson_lines(stream(*chunks)))
+
+    with pytest.raises(TransferError):
+        asyncio.run(scenario())
@@ -0,0 +1,121 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from mongomock_motor import AsyncMongoMockClient
+
+from cultural_content import CONTENT_TYPES, CulturalContentMatrix
+
+
+def make_collection():
+    return AsyncMongoMockClient()["test"]["cultural_content"]
+
+
+def test_failed_first_generation_is_shared_by_waiters():
+    calls = []
+
+    async def generate(orisha_name, content_type):
+        calls.append((orisha_name, content_type))
+        await asyncio.sleep(0.05)
+        raise RuntimeError("upstream down")
+
+    async def scenario():
+        matrix = CulturalContentMatrix(make_collection(), generate)
+        results = await asyncio.gather(
+            *(matrix.ensure("sango", "Ṣàngó", "story") for _ in range(10)), return_exceptions=True
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    asyncio.run(scenario())
+    assert len(calls) == 1
+
+
+def test_workers_converge_on_first_stored_copy():
+    async def scenario():
+        collection = make_collection()
+        first = CulturalContentMatrix(collection, lambda name, kind: asyncio.sleep(0, result="first"))
+        second = CulturalContentMatrix(collection, lambda name, kind: asyncio.sleep(0, result="second"))
+        await first.put("sango", "Ṣàngó", "story", "first")
+        entry = await second.put("sango", "Ṣàngó", "story", "second")
+        assert entry["content"] == "first"
+        assert second.get("sango", "story")["content"] == "first"
+
+    asyncio.run(scenario())
+
+
+def test_stale_cell_is_refreshed_once_across_workers():
+    calls = []
+
+    async def generate(orisha_name, content_type):
+        calls.append(orisha_name)
+        await asyncio.sleep(0.05)
+        return f"fresh {len(calls)}"
+
+    async def scenario():
+        collection = make_collection()
+        workers = [CulturalContentMatrix(collection, generate, max_age_seconds=3600) for _ in range(3)]
+        await workers[0].put("sango", "Ṣàngó", "story", "old")
+        stale = datetime.utcnow() - timedelta(hours=2)
+        await collection.update_one({"_id": "1:sango:story:0"}, {"$set": {"generated_at": stale}})
+        for worker in workers:
+            await worker.load()
+
+        await asyncio.gather(*(worker.refresh("sango", "Ṣàngó", "story") for worker in workers))
+        assert len(calls) == 1
+
+        # Workers that lost the claim adopt the refreshed copy on their next pass
+        await asyncio.gather(*(worker.refresh("sango", "Ṣàngó", "story") for worker in workers))
+        assert len(calls) == 1
+        assert {worker.get("sango", "story")["content"] for worker in workers} == {"fresh 1"}
+
+    asyncio.run(scenario())
+
+
+def test_empty_cells_are_generated_once_across_workers():
+    calls = []
+
+    async def generate(orisha_name, content_type):
+        calls.append((orisha_name, content_type))
+        await asyncio.sleep(0.05)
+        return f"{orisha_name} {content_type} {len(calls)}"
+
+    orishas = [("sango", "Ṣàngó"), ("osun", "Ọ̀ṣun")]
+
+    async def scenario():
+        collection = make_collection()
+        workers = [CulturalContentMatrix(collection, generate, poll_interval=0.01) for _ in range(4)]
+        await asyncio.gather(*(worker.warmup(orishas) for worker in workers))
+        # A request-driven fill on another worker adopts the stored copy too
+        late = CulturalContentMatrix(collection, generate, poll_interval=0.01)
+        entry = await late.ensure("sango", "Ṣàngó", "story")
+        for worker in workers:
+            assert worker.get("sango", "story")["content"] == entry["content"]
+        assert await collection.count_documents({"content": {"$exists": False}}) == 0
+
+    asyncio.run(scenario())
+    assert sorted(calls) == sorted(
+        (name, content_type) for _, name in orishas for content_type in CONTENT_TYPES
+    )
+
+
+def test_failed_claim_holder_hands_the_cell_to_a_waiter():
+    calls = []
+
+    async def generate(orisha_name, content_type):
+        calls.append(orisha_name)
+        await asyncio.sleep(0.05)
+        if len(calls) == 1:
+            raise RuntimeError("upstream down")
+        return "second try"
+
+    async def scenario():
+        collection = make_collection()
+        first, second = (CulturalContentMatrix(collection, generate, poll_interval=0.01) for _ in range(2))
+        results = await asyncio.gather(
+            first.ensure("sango", "Ṣàngó", "story"), second.ensure("sango", "Ṣàngó", "story"),
+            return_exceptions=True,
+        )
+        assert isinstance(results[0], RuntimeError)
+        assert results[1]["content"] == "second try"
+
+    asyncio.run(scenario())
+    assert len(calls) == 2
@@ -0,0 +1,133 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from mongomock_motor import AsyncMongoMockClient
+
+from daily_proverb import DailyProverbStore, utc_date
+
+PROVERB = {"yoruba": "Ìwà l'ẹwà", "translation": "Character is beauty", "meaning": "m", "context": "c"}
+
+
+def make_store(generate, **kwargs):
+    collection = AsyncMongoMockClient()["test"]["daily_proverbs"]
+    return DailyProverbStore(collection, generate, **kwargs)
+
+
+def test_concurrent_callers_share_one_generation():
+    calls = []
+
+    async def generate(date):
+        calls.append(date)
+        await asyncio.sleep(0.05)
+        return PROVERB
+
+    async def scenario():
+        store = make_store(generate)
+        results = await asyncio.gather(*(store.get("2026-01-01") for _ in range(10)))
+        assert all(result == PROVERB for result in results)
+        assert await store.get("2026-01-01") == PROVERB
+
+    asyncio.run(scenario())
+    assert calls == ["2026-01-01"]
+
+
+def test_failed_generation_is_shared_and_not_retried_immediately():
+    calls = []
+
+    async def generate(date):
+        calls.append(date)
+        await asyncio.sleep(0.05)
+        raise RuntimeError("upstream down")
+
+    async def scenario():
+        store = make_store(generate, failure_ttl=60)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await asyncio.gather(*(store.get("2026-01-01") for _ in range(10)))
+        assert results == [None] * 10
+        assert loop.time() - started < 0.5
+        assert await store.get("2026-01-01") is None
+
+    asyncio.run(scenario())
+    assert len(calls) == 1
+
+
+def test_failed_date_is_retried_after_failure_ttl():
+    outcomes = [RuntimeError("upstream down"), PROVERB]
+
+    async def generate(date):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def scenario():
+        store = make_store(generate, failure_ttl=0.01)
+        assert await store.get("2026-01-01") is None
+        await asyncio.sleep(0.02)
+        assert await store.get("2026-01-01") == PROVERB
+
+    asyncio.run(scenario())
+
+
+def test_workers_generate_each_date_once():
+    calls = []
+
+    async def generate(date):
+        calls.append(date)
+        await asyncio.sleep(0.05)
+        return {**PROVERB, "meaning": f"generated {len(calls)}"}
+
+    async def scenario():
+        collection = AsyncMongoMockClient()["test"]["daily_proverbs"]
+        workers = [DailyProverbStore(collection, generate, days_ahead=2, poll_interval=0.01) for _ in range(4)]
+        await asyncio.gather(*(worker.fill_ahead() for worker in workers))
+        for offset in range(3):
+            date = utc_date(offset)
+            assert len({worker._cache[date]["meaning"] for worker in workers}) == 1
+        assert await collection.count_documents({"claimed_until": {"$exists": True}}) == 0
+
+    asyncio.run(scenario())
+    assert sorted(calls) == [utc_date(offset) for offset in range(3)]
+
+
+def test_failed_claim_holder_lets_waiters_fall_back_at_once():
+    outcomes = [RuntimeError("upstream down"), PROVERB]
+
+    async def generate(date):
+        await asyncio.sleep(0.05)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def scenario():
+        collection = AsyncMongoMockClient()["test"]["daily_proverbs"]
+        first = DailyProverbStore(collection, generate, poll_interval=0.01, claim_seconds=5)
+        second = DailyProverbStore(collection, generate, poll_interval=0.01, claim_seconds=5)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        # The waiter sees the released claim instead of polling out the window
+        assert await asyncio.gather(first.get("2026-01-01"), second.get("2026-01-01")) == [None, None]
+        assert loop.time() - started < 1
+        # The claim was released, so a later attempt generates
+        second._failed_until.clear()
+        assert await second.get("2026-01-01") == PROVERB
+
+    asyncio.run(scenario())
+    assert outcomes == []
+
+
+def test_expired_claim_is_taken_over():
+    async def generate(date):
+        return PROVERB
+
+    async def scenario():
+        collection = AsyncMongoMockClient()["test"]["daily_proverbs"]
+        store = DailyProverbStore(collection, generate)
+        await store.ensure_indexes()
+        await collection.insert_one({"date": "2026-01-01", "claimed_until": datetime.utcnow() - timedelta(minutes=1)})
+        assert await store.get("2026-01-01") == PROVERB
+        assert await collection.count_documents({"date": "2026-01-01"}) == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,119 @@
+import asyncio
+
+from mongomock_motor import AsyncMongoMockClient
+from pymongo.errors import AutoReconnect, BulkWriteError
+
+from generation_store import GenerationStore, prompt_hash
+
+
+class FlakyCollection:
+    """Wraps a collection; ``insert_many`` raises the queued errors first."""
+
+    def __init__(self, collection):
+        self._collection = collection
+        self.errors = []
+        self.batches = []
+
+    def __getattr__(self, attr):
+        return getattr(self._collection, attr)
+
+    async def insert_many(self, documents, **kwargs):
+        self.batches.append(len(documents))
+        if self.errors:
+            raise self.errors.pop(0)
+        return await self._collection.insert_many(documents, **kwargs)
+
+
+def make_store(**kwargs):
+    collection = FlakyCollection(AsyncMongoMockClient()["test"]["generations"])
+    return GenerationStore(collection, **kwargs), collection
+
+
+def record(store, count, start=0):
+    for i in range(start, start + count):
+        store.record("translation", "gemini", f"prompt {i}", f"output {i}", 0.25, "interactive")
+
+
+def test_flush_writes_in_batches():
+    store, collection = make_store(batch_size=3)
+    record(store, 7)
+
+    async def scenario():
+        await store.flush()
+        docs = [doc async for doc in collection.find().sort("_id", 1)]
+        assert [doc["prompt"] for doc in docs] == [f"prompt {i}" for i in range(7)]
+        assert docs[0]["prompt_hash"] == prompt_hash("prompt 0")
+        assert docs[0]["latency_ms"] == 250.0
+
+    asyncio.run(scenario())
+    assert collection.batches == [3, 3, 1]
+    assert store.snapshot() == {"recorded": 7, "written": 7, "dropped": 0, "failed_flushes": 0, "buffered": 0}
+
+
+def test_failed_insert_requeues_in_order():
+    store, collection = make_store(batch_size=2)
+    record(store, 3)
+    collection.errors.append(AutoReconnect("mongo down"))
+
+    async def scenario():
+        await store.flush()
+        assert store.snapshot()["buffered"] == 3
+        assert store.stats["failed_flushes"] == 1
+        record(store, 1, start=3)
+        await store.flush()
+        return [doc["prompt"] async for doc in collection.find().sort("_id", 1)]
+
+    assert asyncio.run(scenario()) == [f"prompt {i}" for i in range(4)]
+    assert store.stats["written"] == 4
+
+
+def test_buffer_cap_drops_oldest_records():
+    store, collection = make_store(batch_size=2, max_buffer=3)
+    record(store, 3)
+    collection.errors.append(AutoReconnect("mongo down"))
+
+    async def scenario():
+        await store.flush()
+        record(store, 2, start=3)
+        assert store.snapshot()["buffered"] == 3
+        await store.flush()
+        return [doc["prompt"] async for doc in collection.find().sort("_id", 1)]
+
+    assert asyncio.run(scenario()) == ["prompt 2", "prompt 3", "prompt 4"]
+    assert store.stats["dropped"] == 2
+
+
+def test_rejected_records_are_counted_not_retried():
+    store, collection = make_store(batch_size=4)
+    record(store, 4)
+    collection.errors.append(BulkWriteError({"nInserted": 3, "writeErrors": [{"index": 3}]}))
+
+    asyncio.run(store.flush())
+    assert store.snapshot() == {"recorded": 4, "written": 3, "dropped": 1, "failed_flushes": 0, "buffered": 0}
+    assert collection.batches == [4]
+
+
+def test_close_flushes_what_is_buffered():
+    store, collection = make_store(batch_size=100, flush_interval=3600)
+
+    async def scenario():
+        runner = asyncio.create_task(store.run())
+        await asyncio.sleep(0.01)
+        record(store, 5)
+        runner.cancel()
+        await asyncio.gather(runner, return_exceptions=True)
+        await store.close()
+        return await collection.count_documents({})
+
+    assert asyncio.run(scenario()) == 5
+    assert store.snapshot()["buffered"] == 0
+
+
+def test_close_discards_records_it_cannot_write():
+    store, collection = make_store()
+    record(store, 2)
+    collection.errors.append(AutoReconnect("mongo down"))
+
+    asyncio.run(store.close())
+    assert store.snapshot()["buffered"] == 0
+    assert store.stats["dropped"] == 2
@@ -0,0 +1,63 @@
+import pytest
+
+from listing import Listing, ListingError, decode_cursor, encode_cursor, split_param
+
+ENTRIES = [{"id": f"tale-{i}", "title": f"Tale {i}", "summary": f"Summary {i}"} for i in range(7)]
+
+
+def pages(listing, **kwargs):
+    cursor, seen = None, []
+    while True:
+        page, total, cursor = listing.select(cursor=cursor, **kwargs)
+        seen.append([entry["id"] for entry in page])
+        if cursor is None:
+            return seen, total
+
+
+def test_cursor_round_trip_with_unicode_ids():
+    assert decode_cursor(encode_cursor("ọ̀ṣun")) == "ọ̀ṣun"
+
+
+def test_cursor_pages_cover_every_entry_once():
+    seen, total = pages(Listing(ENTRIES), limit=3)
+    assert total == 7
+    assert seen == [["tale-0", "tale-1", "tale-2"], ["tale-3", "tale-4", "tale-5"], ["tale-6"]]
+
+
+def test_exact_final_page_has_no_next_cursor():
+    page, _, cursor = Listing(ENTRIES[:6]).select(cursor=encode_cursor("tale-2"), limit=3)
+    assert [entry["id"] for entry in page] == ["tale-3", "tale-4", "tale-5"]
+    assert cursor is None
+
+
+def test_ids_keep_request_order_and_paginate():
+    listing = Listing(ENTRIES)
+    seen, total = pages(listing, ids=["tale-5", "missing", "tale-1", "tale-5", "tale-3"], limit=2)
+    assert total == 3
+    assert seen == [["tale-5", "tale-1"], ["tale-3"]]
+
+
+def test_fields_projection_always_includes_id():
+    page, _, _ = Listing(ENTRIES).select(fields=["title"], limit=1)
+    assert page == [{"id": "tale-0", "title": "Tale 0"}]
+
+
+def test_default_fields_apply_without_projection():
+    page, _, _ = Listing(ENTRIES, default_fields=["id", "title"]).select(limit=1)
+    assert page == [{"id": "tale-0", "title": "Tale 0"}]
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"fields": ["nope"]},
+    {"cursor": "!!!"},
+    {"cursor": encode_cursor("unknown")},
+    {"ids": ["tale-1"], "cursor": encode_cursor("tale-2")},
+])
+def test_invalid_requests_raise_listing_error(kwargs):
+    with pytest.raises(ListingError):
+        Listing(ENTRIES).select(**kwargs)
+
+
+def test_split_param():
+    assert split_param(None) is None
+    assert split_param(" a, ,b ") == ["a", "b"]
@@ -0,0 +1,204 @@
+import asyncio
+import gc
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from circuit_breaker import CLOSED, HALF_OPEN, CircuitBreaker
+from llm_gateway import LLMError, LLMGateway, LLMOverloadedError, LLMTimeoutError
+
+
+class StubModel:
+    """Answers every prompt with its own text after ``delay`` seconds."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+
+    async def generate_content_async(self, prompt, stream=False):
+        self.calls.append(prompt)
+        await asyncio.sleep(self.delay)
+        return SimpleNamespace(text=f" {prompt} ")
+
+
+class FailingModel(StubModel):
+    async def generate_content_async(self, prompt, stream=False):
+        self.calls.append(prompt)
+        await asyncio.sleep(self.delay)
+        raise RuntimeError("upstream down")
+
+
+def make_gateway(model, breaker=None, **kwargs):
+    options = dict(max_concurrency=1, timeout=5)
+    options.update(kwargs)
+    return LLMGateway(
+        breaker=breaker or CircuitBreaker(min_calls=2, cooldown_seconds=0),
+        model_factory=lambda name, profile: model,
+        **options,
+    )
+
+
+def test_identical_prompts_share_one_upstream_call():
+    model = StubModel(delay=0.05)
+
+    async def scenario():
+        gateway = make_gateway(model, max_concurrency=4)
+        results = await asyncio.gather(*(gateway.generate("ẹ káàárọ̀") for _ in range(10)))
+        assert results == ["ẹ káàárọ̀"] * 10
+        assert gateway.stats == {"calls": 1, "coalesced_calls": 9}
+        assert gateway.snapshot()["in_flight"] == 0
+        # Same prompt for another kind is a different call
+        await gateway.generate("ẹ káàárọ̀", kind="story")
+        assert gateway.stats["calls"] == 2
+
+    asyncio.run(scenario())
+    assert model.calls == ["ẹ káàárọ̀", "ẹ káàárọ̀"]
+
+
+def test_failure_reaches_every_waiter():
+    model = FailingModel(delay=0.05)
+
+    async def scenario():
+        gateway = make_gateway(model)
+        results = await asyncio.gather(*(gateway.generate("prompt") for _ in range(5)), return_exceptions=True)
+        assert all(isinstance(result, LLMError) for result in results)
+        assert gateway.stats["coalesced_calls"] == 4
+        # Finished calls are not reused: the next request goes upstream again
+        with pytest.raises(LLMError):
+            await gateway.generate("prompt")
+
+    asyncio.run(scenario())
+    assert len(model.calls) == 2
+
+
+def test_cancelled_waiter_does_not_cancel_the_shared_call():
+    model = StubModel(delay=0.05)
+
+    async def scenario():
+        gateway = make_gateway(model)
+        first = asyncio.create_task(gateway.generate("prompt"))
+        second = asyncio.create_task(gateway.generate("prompt"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        assert await second == "prompt"
+        assert first.cancelled()
+
+    asyncio.run(scenario())
+    assert model.calls == ["prompt"]
+
+
+def test_failure_without_waiters_is_retrieved(caplog):
+    model = FailingModel(delay=0.01)
+
+    async def scenario():
+        gateway = make_gateway(model)
+        waiter = asyncio.create_task(gateway.generate("prompt"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0.05)
+        assert gateway.snapshot()["in_flight"] == 0
+
+    asyncio.run(scenario())
+    gc.collect()
+    assert "exception was never retrieved" not in caplog.text
+
+
+def test_first_generation_creates_models_off_the_event_loop():
+    model = StubModel()
+    created = []
+
+    def slow_factory(name, profile):
+        # Stands in for importing and configuring google.generativeai
+        time.sleep(0.1)
+        created.append(threading.current_thread() is threading.main_thread())
+        return model
+
+    async def scenario():
+        gateway = LLMGateway(model_factory=slow_factory, max_concurrency=4, timeout=5)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        running = asyncio.create_task(ticker())
+        results = await asyncio.gather(gateway.generate("a"), gateway.generate("b", kind="story"), gateway.prepare())
+        running.cancel()
+        assert results[:2] == ["a", "b"]
+        assert gateway.ready
+        return ticks, len(gateway.profiles)
+
+    ticks, profiles = asyncio.run(scenario())
+    assert created == [False] * profiles
+    assert ticks > 10
+
+
+def test_quota_timeouts_do_not_open_the_circuit():
+    model = StubModel(delay=0.2)
+
+    async def scenario():
+        gateway = make_gateway(model)
+        busy = asyncio.create_task(gateway.generate("busy"))
+        await asyncio.sleep(0.01)
+        burst = await asyncio.gather(
+            *(gateway.generate(f"bulk {i}", timeout=0.05, priority="bulk") for i in range(5)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, LLMTimeoutError) for result in burst)
+        assert gateway.scheduler.snapshot()["bulk"]["timed_out"] == 5
+        assert gateway.breaker.state == CLOSED
+        assert await busy == "busy"
+        assert await gateway.generate("interactive") == "interactive"
+
+    asyncio.run(scenario())
+    assert model.calls == ["busy", "interactive"]
+
+
+def test_full_queue_hands_back_the_half_open_probe():
+    model = StubModel(delay=0.05)
+    breaker = CircuitBreaker(min_calls=2, cooldown_seconds=0)
+
+    async def scenario():
+        gateway = make_gateway(model, breaker)
+        busy = asyncio.create_task(gateway.generate("busy"))
+        await asyncio.sleep(0.01)
+        gateway.scheduler.max_queue_depth = 0
+        breaker._open(0.0)
+
+        with pytest.raises(LLMOverloadedError):
+            await gateway.generate("probe")
+        assert breaker.state == HALF_OPEN
+        assert breaker._probes_in_flight == 0
+
+        # The next call is let through as the probe instead of being rejected
+        gateway.scheduler.max_queue_depth = None
+        probe = asyncio.create_task(gateway.generate("next probe"))
+        await asyncio.sleep(0.01)
+        assert breaker._probes_in_flight == 1
+        await busy
+        assert await probe == "next probe"
+
+    asyncio.run(scenario())
+
+
+def test_quota_timeout_hands_back_the_half_open_probe():
+    model = StubModel(delay=0.2)
+    breaker = CircuitBreaker(min_calls=2, cooldown_seconds=0)
+
+    async def scenario():
+        gateway = make_gateway(model, breaker)
+        busy = asyncio.create_task(gateway.generate("busy"))
+        await asyncio.sleep(0.01)
+        breaker._open(0.0)
+
+        with pytest.raises(LLMTimeoutError):
+            await gateway.generate("probe", timeout=0.05)
+        assert breaker.state == HALF_OPEN
+        assert breaker._probes_in_flight == 0
+        await busy
+
+    asyncio.run(scenario())
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from quota_scheduler import QueueFullError, QuotaScheduler, TokenBucket
+
+
+def test_token_bucket_wait_time():
+    bucket = TokenBucket(60)
+    assert bucket.wait_time(60) == 0.0
+    bucket.consume(60)
+    assert bucket.wait_time(1) == pytest.approx(1.0, abs=0.05)
+
+
+def test_waiters_are_admitted_by_priority_then_arrival():
+    order = []
+
+    async def call(scheduler, priority, name):
+        async with scheduler.slot(priority):
+            order.append(name)
+            await asyncio.sleep(0)
+
+    async def scenario():
+        scheduler = QuotaScheduler(max_concurrency=1, requests_per_minute=1e6, tokens_per_minute=1e9)
+        # Hold the only slot so every call below has to queue
+        await scheduler.acquire("interactive")
+        tasks = [
+            asyncio.create_task(call(scheduler, priority, name))
+            for priority, name in [("bulk", "bulk-1"), ("daily", "daily-1"), ("interactive", "interactive-1"),
+                                   ("bulk", "bulk-2"), ("interactive", "interactive-2")]
+        ]
+        await asyncio.sleep(0)
+        scheduler.release()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
+    assert order == ["interactive-1", "interactive-2", "daily-1", "bulk-1", "bulk-2"]
+
+
+def test_full_queue_rejects_new_calls():
+    async def scenario():
+        scheduler = QuotaScheduler(
+            max_concurrency=1, requests_per_minute=1e6, tokens_per_minute=1e9, max_queue_depth=2
+        )
+        await scheduler.acquire()
+        waiting = [asyncio.create_task(scheduler.acquire()) for _ in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(QueueFullError):
+            await scheduler.acquire()
+        assert scheduler.snapshot()["interactive"]["rejected"] == 1
+
+        # Cancelled waiters free their place in the queue
+        waiting[0].cancel()
+        await asyncio.sleep(0)
+        third = asyncio.create_task(scheduler.acquire())
+        await asyncio.sleep(0)
+        assert scheduler.queued()["interactive"] == 2
+        waiting[1].cancel()
+        third.cancel()
+        await asyncio.gather(*waiting, third, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+def test_slot_timeout_covers_queue_wait():
+    async def scenario():
+        scheduler = QuotaScheduler(max_concurrency=1, requests_per_minute=1e6, tokens_per_minute=1e9)
+        await scheduler.acquire()
+        with pytest.raises(asyncio.TimeoutError):
+            async with scheduler.slot(timeout=0.05):
+                pass
+        assert scheduler.snapshot()["interactive"]["timed_out"] == 1
+        assert scheduler.queued()["interactive"] == 0
+        # The timed-out waiter did not take the slot when it was released
+        scheduler.release()
+        async with scheduler.slot(timeout=0.05):
+            pass
+
+    asyncio.run(scenario())
+
+
+def test_rate_limit_delays_admission():
+    async def scenario():
+        scheduler = QuotaScheduler(max_concurrency=10, requests_per_minute=60, tokens_per_minute=1e9)
+        scheduler.requests.consume(60)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        async with scheduler.slot():
+            pass
+        return loop.time() - started
+
+    assert asyncio.run(scenario()) == pytest.approx(1.0, abs=0.2)
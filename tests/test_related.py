@@ -0,0 +1,54 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from corpus_search import corpus_documents
+from related import RelatedIndex
+
+ORISHAS = {
+    "shango": {"name": "Shango", "domains": ["thunder", "fire"], "story": "Shango hurls thunder stones."},
+    "oya": {"name": "Oya", "domains": ["wind", "storms"], "story": "Oya rides the storm beside thunder."},
+}
+PROVERB_CATEGORIES = {
+    "wisdom": {"name": "Wisdom", "proverbs": [
+        {"yoruba": "Ààrá ń sán", "literal": "Thunder strikes", "meaning": "Thunder and fire warn the proud"},
+        {"yoruba": "Omi lẹ̀rọ̀", "literal": "Water is calm", "meaning": "Patience cools anger"},
+    ]},
+}
+FOLKTALES = {
+    "tortoise-thunder": {
+        "title": "Tortoise and the Thunder", "summary": "Ìjàpá steals fire from the thunder god.",
+    },
+}
+
+
+def index(top_k=20):
+    return RelatedIndex(corpus_documents(ORISHAS, PROVERB_CATEGORIES, FOLKTALES), top_k=top_k)
+
+
+def test_entry_is_not_related_to_itself():
+    related = index().related("orisha", "shango", limit=10)
+    assert ("orisha", "shango") not in {(hit["type"], hit["id"]) for hit in related}
+    assert [hit["score"] for hit in related] == sorted((hit["score"] for hit in related), reverse=True)
+
+
+def test_unknown_entry_returns_none():
+    assert index().related("orisha", "ogun") is None
+
+
+def test_types_filter_applies_before_top_k():
+    # Oya is only Shango's third best neighbour, so it is cut by top_k=1
+    # overall; the filter must still find it
+    related = index(top_k=1).related("orisha", "shango", limit=5, types=["orisha"])
+    assert [hit["id"] for hit in related] == ["oya"]
+
+
+def test_unrelated_entries_are_left_out():
+    related = index().related("proverb", "wisdom-1", limit=10)
+    assert related == []
+
+
+def test_numpy_is_imported_by_the_first_build_only():
+    probe = "import sys, related; assert 'numpy' not in sys.modules and 'scipy' not in sys.modules"
+    backend = Path(__file__).resolve().parents[1] / "backend"
+    subprocess.run([sys.executable, "-c", probe], cwd=backend, check=True)
@@ -0,0 +1,160 @@
+import random
+
+import pytest
+
+from search import (
+    PREFIX_MAX_EXPANSIONS,
+    FolktaleIndex,
+    FuzzyVocabulary,
+    ProverbIndex,
+    edit_distance,
+    max_edits,
+)
+
+CATEGORIES = {
+    "wisdom": {
+        "name": "Wisdom",
+        "proverbs": [
+            {"yoruba": "Ọgbọ́n ọlọ́gbọ́n", "literal": "The wisdom of others", "meaning": "Learn", "context": "c"},
+            {"yoruba": "Sùúrù ni baba ìwà", "literal": "Patience is the father of character",
+             "meaning": "Be patient", "context": "c"},
+        ],
+    },
+}
+
+
+def test_search_folds_tone_marks():
+    index = ProverbIndex(CATEGORIES)
+    total, hits = index.search("ogbon")
+    assert total == 1
+    assert hits[0]["proverb"]["yoruba"] == "Ọgbọ́n ọlọ́gbọ́n"
+
+
+def test_prefix_match_scores_below_exact_match():
+    index = ProverbIndex(CATEGORIES)
+    total, hits = index.search("pati")
+    assert total == 1
+    _, exact_hits = index.search("patience")
+    assert exact_hits[0]["score"] > hits[0]["score"]
+
+
+def test_single_letter_tokens_do_not_prefix_match():
+    index = ProverbIndex(CATEGORIES)
+    assert index.search("s") == (0, [])
+
+
+def test_prefix_expansion_is_capped():
+    tales = {
+        f"tale-{i}": {"title": f"abc{i:04d}", "title_yoruba": "", "summary": "", "characters": []}
+        for i in range(PREFIX_MAX_EXPANSIONS * 3)
+    }
+    index = FolktaleIndex(tales)
+    total, _ = index.search("abc")
+    assert total == PREFIX_MAX_EXPANSIONS
+
+
+@pytest.mark.parametrize("a, b, distance", [
+    ("ogbon", "ogbon", 0),
+    ("ogbn", "ogbon", 1),
+    ("wisdon", "wisdom", 1),
+    ("obgon", "ogbon", 1),
+    ("usuru", "suuru", 1),
+    ("omdoe", "omode", 1),
+    ("ab", "ba", 1),
+    ("kitten", "sitting", 3),
+])
+def test_edit_distance_counts_adjacent_transpositions_once(a, b, distance):
+    assert edit_distance(a, b, limit=5) == distance
+
+
+def reference_distance(a, b):
+    """Textbook optimal string alignment DP."""
+    d = [[i + j if i == 0 or j == 0 else 0 for j in range(len(b) + 1)] for i in range(len(a) + 1)]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return d[len(a)][len(b)]
+
+
+def test_bit_parallel_edit_distance_matches_the_dp():
+    rng = random.Random(0)
+    for _ in range(2000):
+        a = "".join(rng.choice("abc") for _ in range(rng.randint(0, 9)))
+        b = "".join(rng.choice("abc") for _ in range(rng.randint(0, 9)))
+        assert edit_distance(a, b, limit=20) == reference_distance(a, b), (a, b)
+
+
+def test_edit_distance_stops_past_limit():
+    assert edit_distance("ogbon", "patience", limit=2) == 3
+    assert edit_distance("a", "abcdef", limit=2) == 3
+
+
+@pytest.mark.parametrize("typo, word", [
+    ("ogbn", "ogbon"),
+    ("wisdon", "wisdom"),
+    ("obgon", "ogbon"),
+    ("omdoe", "omode"),
+    ("usuru", "suuru"),
+    ("suruu", "suuru"),
+    ("pateince", "patience"),
+])
+def test_fuzzy_vocabulary_finds_typos(typo, word):
+    vocabulary = FuzzyVocabulary(["ogbon", "suuru", "omode", "wisdom", "patience", "character"])
+    assert (word, edit_distance(typo, word, 2)) in vocabulary.matches(typo)
+
+
+def test_fuzzy_vocabulary_respects_edit_budget():
+    vocabulary = FuzzyVocabulary(["ogbon", "omode", "wisdom"])
+    # Short tokens must match exactly, and exact matches are not typos
+    assert vocabulary.matches("og") == []
+    assert vocabulary.matches("ogbon") == []
+    # Five letters allow one edit, not two
+    assert vocabulary.matches("obgno") == []
+
+
+def test_fuzzy_vocabulary_skips_words_too_long_or_short():
+    vocabulary = FuzzyVocabulary(["ogbon", "ogbonologbon", "ogb"])
+    assert vocabulary.matches("ogbom") == [("ogbon", 1)]
+
+
+
+@pytest.mark.parametrize("token, word", [("abc", "bac"), ("cfgegb", "fggeb")])
+def test_fuzzy_vocabulary_finds_words_sharing_no_trigram(token, word):
+    assert FuzzyVocabulary([word]).matches(token) == [(word, reference_distance(token, word))]
+
+
+def test_fuzzy_vocabulary_finds_every_word_within_budget():
+    rng = random.Random(0)
+    words = sorted({"".join(rng.choice("abcefg") for _ in range(rng.randint(3, 9))) for _ in range(200)})
+    vocabulary = FuzzyVocabulary(words)
+    for _ in range(500):
+        token = "".join(rng.choice("abcefg") for _ in range(rng.randint(3, 9)))
+        limit = max_edits(token)
+        expected = {
+            (word, distance) for word in words
+            for distance in [reference_distance(token, word)] if 0 < distance <= limit
+        }
+        assert set(vocabulary.matches(token)) == expected, token
+
+def test_page_after_cutoff_keeps_score_then_insertion_order():
+    tales = {
+        f"tale-{i}": {"title": "ijapa" if i % 3 else "ijapa ijapa", "title_yoruba": "",
+                      "summary": "ijapa" if i % 2 else "", "characters": []}
+        for i in range(30)
+    }
+    index = FolktaleIndex(tales)
+    total, everything = index.search("ijapa", limit=30)
+    for offset in (0, 5, 12):
+        page_total, page = index.search("ijapa", limit=5, offset=offset)
+        assert page_total == total == 30
+        assert page == everything[offset:offset + 5]
+
+
+def test_fuzzy_search_finds_transposed_yoruba_word():
+    index = ProverbIndex(CATEGORIES)
+    assert index.search("obgon")[0] == 0
+    total, hits = index.search("obgon", fuzzy=True)
+    assert total == 1
+    assert hits[0]["proverb"]["yoruba"] == "Ọgbọ́n ọlọ́gbọ́n"
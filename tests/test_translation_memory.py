@@ -0,0 +1,65 @@
+import asyncio
+
+from mongomock_motor import AsyncMongoMockClient
+
+from translation_memory import EXACT, FOLDED, NEAR, NEAR_MATCH_MAX_CHARS, TranslationMemory
+
+PAIRS = [
+    ("Mo ń lọ sí ọjà lónìí", "I am going to the market today"),
+    ("Ẹ káàárọ̀", "Good morning"),
+]
+
+
+def memory(collection=None):
+    collection = collection or AsyncMongoMockClient()["test"]["translation_memory"]
+    translation_memory = TranslationMemory(collection)
+    translation_memory.load_corpus(PAIRS)
+    return translation_memory
+
+
+def test_exact_match_ignores_case_and_punctuation():
+    match = memory().lookup("good morning!", "yoruba")
+    assert match["match"] == EXACT
+    assert match["translated_text"] == "Ẹ káàárọ̀"
+
+
+def test_folded_match_finds_text_typed_without_tone_marks():
+    match = memory().lookup("mo n lo si oja lonii", "english")
+    assert match["match"] == FOLDED
+    assert match["translated_text"] == "I am going to the market today"
+
+
+def test_similar_sentence_is_only_a_near_match():
+    match = memory().lookup("I am not going to the market today", "yoruba")
+    assert match["match"] == NEAR
+    assert match["score"] < 1.0
+
+
+def test_near_match_runs_off_the_event_loop():
+    async def scenario():
+        return await memory().find("I am not going to the market today", "yoruba")
+
+    match = asyncio.run(scenario())
+    assert match["match"] == NEAR
+    assert match["translated_text"] == "Mo ń lọ sí ọjà lónìí"
+
+
+def test_long_input_skips_near_matching():
+    long_text = "I am going to the market today " * (NEAR_MATCH_MAX_CHARS // 30 + 1)
+    translation_memory = memory()
+    translation_memory.load_corpus(PAIRS + [(long_text + "ni", long_text)])
+    assert translation_memory.lookup(long_text.strip() + " now", "yoruba") is None
+    assert translation_memory.lookup(long_text, "yoruba")["match"] == EXACT
+
+
+def test_load_picks_up_translations_accepted_by_another_worker():
+    collection = AsyncMongoMockClient()["test"]["translation_memory"]
+    first, second = memory(collection), memory(collection)
+
+    async def scenario():
+        await first.accept("good evening", "Ẹ káalẹ́", "yoruba")
+        assert second.lookup("good evening", "yoruba") is None
+        await second.load()
+
+    asyncio.run(scenario())
+    assert second.lookup("Good evening.", "yoruba")["translated_text"] == "Ẹ káalẹ́"